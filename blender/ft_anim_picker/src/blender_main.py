@@ -623,6 +623,11 @@ class PickerWindowManager:
                 # Unregister from visibility manager
                 visibility_manager = PickerVisibilityManager.get_instance()
                 visibility_manager.unregister_picker(widget)
+            
+            # Stop listening to scene changes once the last picker is gone
+            if not self._picker_widgets:
+                from . import scene_events as SE
+                SE.SceneEvents.get_instance().remove()
         except Exception as e:
             print(f"Error removing widget: {e}")
     
@@ -807,6 +812,9 @@ def unregister():
         km.keymap_items.remove(kmi)
     bpy.app.driver_namespace.pop('ft_picker_keymaps', None)
     
+    from . import scene_events as SE
+    SE.SceneEvents.get_instance().remove()
+    
     bpy.utils.unregister_class(ANIM_OT_open_ft_picker)
     bpy.utils.unregister_class(ANIM_OT_toggle_ft_picker_visibility)
     bpy.utils.unregister_class(ANIM_OT_show_ft_picker)
@@ -0,0 +1,154 @@
+import bpy
+
+#----------------------------------------------------------------------------------------------------------
+# DATA-API SELECTION
+#----------------------------------------------------------------------------------------------------------
+# Selection helpers used by the canvas, pose buttons and mirror tools. Everything here writes
+# RNA properties directly (select_set, bone.select, active object/bone) so a click does not go
+# through operator context evaluation. Operators are only used when an object's mode actually
+# has to change, and a single undo step is pushed once the whole batch has been applied.
+
+def _window_override():
+    """Context override for the first window (operators need a window when called from Qt)"""
+    return bpy.context.temp_override(window=bpy.context.window_manager.windows[0])
+
+def tag_view3d_redraw():
+    """Tag all 3D viewports for redraw after direct data changes"""
+    try:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    except Exception:
+        pass
+
+def push_undo(message="Select"):
+    """Push a single undo step for a batch of data-API changes"""
+    try:
+        with _window_override():
+            bpy.ops.ed.undo_push(message=f"FT Anim Picker: {message}")
+    except Exception as e:
+        print(f"Failed to push undo step '{message}': {e}")
+
+def ensure_mode(obj, mode):
+    """Make obj active and put it in mode, calling mode_set only when the mode differs.
+
+    Returns True if an operator was needed.
+    """
+    if obj is None:
+        return False
+
+    view_layer = bpy.context.view_layer
+    if view_layer.objects.active != obj:
+        view_layer.objects.active = obj
+
+    if obj.mode == mode:
+        return False
+
+    try:
+        with bpy.context.temp_override(window=bpy.context.window_manager.windows[0], active_object=obj, object=obj):
+            bpy.ops.object.mode_set(mode=mode)
+        return True
+    except RuntimeError as e:
+        print(f"Failed to switch '{obj.name}' to {mode} mode: {e}")
+        return False
+
+def leave_pose_mode():
+    """Return the active armature to object mode if it is currently posed"""
+    active = bpy.context.view_layer.objects.active
+    if active is not None and active.mode != 'OBJECT':
+        return ensure_mode(active, 'OBJECT')
+    return False
+
+def deselect_all_objects():
+    """Deselect every selected object in the view layer without bpy.ops.object.select_all"""
+    for obj in list(bpy.context.view_layer.objects.selected):
+        obj.select_set(False)
+
+def deselect_all_bones(armature_obj):
+    """Deselect all bones of an armature through the data API"""
+    if armature_obj is None or armature_obj.type != 'ARMATURE' or not armature_obj.data:
+        return
+    for bone in armature_obj.data.bones:
+        if bone.select:
+            bone.select = False
+
+def deselect_all():
+    """Clear bone selection on posed armatures and object selection in one pass"""
+    for obj in bpy.context.view_layer.objects:
+        if obj.type == 'ARMATURE' and obj.mode == 'POSE':
+            deselect_all_bones(obj)
+    if bpy.context.mode != 'POSE':
+        deselect_all_objects()
+    tag_view3d_redraw()
+
+def apply_selection(objects=(), bones=None, active_object=None, active_bone=None, add_to_selection=False, undo_message=None):
+    """Select objects and bones in one batch.
+
+    Args:
+        objects: Iterable of bpy objects to select.
+        bones: Dict of armature object -> list of bone names to select.
+        active_object: Object to make active (objects only).
+        active_bone: Tuple of (armature object, bone name) to make active.
+        add_to_selection: Keep the existing selection.
+        undo_message: If given, push one undo step once everything is applied.
+    """
+    bones = bones or {}
+    objects = [obj for obj in objects if obj is not None]
+
+    if bones:
+        # Bones need their armature in pose mode. Pick the armature holding the active bone
+        # (or the first one) as the pose-mode owner; mode_set only runs if it isn't posed yet.
+        if active_bone and active_bone[0] in bones:
+            pose_armature = active_bone[0]
+        else:
+            pose_armature = next(iter(bones))
+
+        if not add_to_selection:
+            if pose_armature.mode != 'POSE':
+                leave_pose_mode()
+                deselect_all_objects()
+            else:
+                for obj in list(bpy.context.view_layer.objects.selected):
+                    if obj not in bones:
+                        obj.select_set(False)
+
+        for armature_obj in bones:
+            armature_obj.select_set(True)
+
+        ensure_mode(pose_armature, 'POSE')
+
+        active_set = False
+        for armature_obj, bone_names in bones.items():
+            if not add_to_selection:
+                deselect_all_bones(armature_obj)
+            data_bones = armature_obj.data.bones
+            for bone_name in bone_names:
+                bone = data_bones.get(bone_name)
+                if bone is None:
+                    continue
+                bone.select = True
+                is_active = active_bone is not None and active_bone == (armature_obj, bone_name)
+                if is_active or (active_bone is None and not active_set):
+                    data_bones.active = bone
+                    active_set = True
+
+        for obj in objects:
+            obj.select_set(True)
+    else:
+        leave_pose_mode()
+        if not add_to_selection:
+            deselect_all_objects()
+
+        for obj in objects:
+            obj.select_set(True)
+
+        if active_object is None and objects:
+            active_object = objects[0]
+        if active_object is not None:
+            bpy.context.view_layer.objects.active = active_object
+
+    tag_view3d_redraw()
+
+    if undo_message:
+        push_undo(undo_message)
@@ -21,6 +21,7 @@ from . import custom_line_edit as CLE
 from . import button_edit_widgets as BEW
 from . fade_away_logic import FadeAway
 from . import custom_color_picker as CCP
+from . import namespace_resolver as NR
 from .update_ui import UpdateWidget
 
 # Get version from __init__
@@ -1362,60 +1363,42 @@ class BlenderAnimPickerWindow(QtWidgets.QWidget):
         bpy.app.timers.register(show_message, first_interval=0.01)
     #-----------------------------------------------------------------------------------------------------------------------------------
     def setup_scene_update_timer(self):
-        """Setup timer to periodically check for scene changes"""
-        self.scene_update_timer = QtCore.QTimer(self)
-        self.scene_update_timer.timeout.connect(self.check_scene_for_updates)
-        self.scene_update_timer.start(2000)  # Check every 2 seconds
+        """Follow rig changes in the scene through the namespace registry (no polling)"""
+        NR.NamespaceRegistry.get_instance().add_listener(self.check_scene_for_updates)
 
-    def check_scene_for_updates(self):
-        """Check if rigs in scene have changed and update dropdown if needed"""
-        import bpy
-        
-        # Get current rig names in scene
-        current_rigs = []
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'ARMATURE':
-                current_rigs.append(obj.name)
-        current_rigs.sort()
+    def check_scene_for_updates(self, namespaces=None):
+        """Update dropdown if the rigs in the scene differ from its items"""
+        if namespaces is None:
+            namespaces = NR.NamespaceRegistry.get_instance().namespaces()
         
-        # Get dropdown items (excluding 'None')
+        # Get dropdown items (including 'None')
         dropdown_items = []
-        for i in range(1, self.namespace_dropdown.count()):  # Skip index 0 which is 'None'
+        for i in range(self.namespace_dropdown.count()):
             dropdown_items.append(self.namespace_dropdown.itemText(i))
         
         # Update dropdown if rigs have changed
-        if current_rigs != dropdown_items:
+        if namespaces != dropdown_items:
             #print("Scene rigs changed, updating namespace dropdown")
             self.update_namespace_dropdown()
 
     def on_namespace_changed(self, namespace_text):
         """Handle namespace dropdown change"""
         #print(f"Namespace changed to: {namespace_text}")
+        if not self.tab_system.current_tab or self.tab_system.current_tab not in self.tab_system.tabs:
+            return
+        
+        # Buttons are left as they are; only the resolver prefix changes. Warm the
+        # selection caches for the new rig in one deferred pass.
+        canvas = self.tab_system.tabs[self.tab_system.current_tab]['canvas']
+        QtCore.QTimer.singleShot(0, lambda: canvas.prefetch_selection_cache(namespace_text))
         
     def populate_namespace_dropdown(self):
         """Populate namespace dropdown with rigs (armature objects) in the scene"""
-        import bpy
-        with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-            # Clear existing items
-            self.namespace_dropdown.clear()
-            
-            # Add default "None" option
-            self.namespace_dropdown.addItem('None')
-            
-            # Get all armature objects in the scene
-            rig_names = []
-            for obj in bpy.context.scene.objects:
-                if obj.type == 'ARMATURE':
-                    rig_names.append(obj.name)
-            
-            # Sort rig names alphabetically
-            rig_names.sort()
-            
-            # Add rig names to dropdown
-            for rig_name in rig_names:
-                self.namespace_dropdown.addItem(rig_name)
-            
-            #print(f"Found {len(rig_names)} rigs in scene: {rig_names}")
+        # Clear existing items
+        self.namespace_dropdown.clear()
+        
+        # 'None' followed by the sorted rig names, kept current by the namespace registry
+        self.namespace_dropdown.addItems(NR.NamespaceRegistry.get_instance().namespaces())
 
     def update_namespace_dropdown(self):
         """Update the namespace dropdown when scene changes"""
@@ -1766,7 +1749,7 @@ class BlenderAnimPickerWindow(QtWidgets.QWidget):
             "assigned_objects": getattr(button, 'assigned_objects', []),
             "mode": getattr(button, 'mode', 'select'),
             "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-            "pose_data": getattr(button, 'pose_data', {}),
+            "pose_data": button.pose_document_data(),
             "thumbnail_path": getattr(button, 'thumbnail_path', ''),
             "shape_type": button.shape_type,
             "svg_path_data": button.svg_path_data,
@@ -1890,7 +1873,7 @@ class BlenderAnimPickerWindow(QtWidgets.QWidget):
                                 elif field == 'script_data':
                                     tab_data['buttons'][i]['script_data'] = getattr(button, 'script_data', {'code': '', 'type': 'python'})
                                 elif field == 'pose_data':
-                                    tab_data['buttons'][i]['pose_data'] = getattr(button, 'pose_data', {})
+                                    tab_data['buttons'][i]['pose_data'] = button.pose_document_data()
                                 elif field == 'thumbnail_path':
                                     tab_data['buttons'][i]['thumbnail_path'] = getattr(button, 'thumbnail_path', '')
                                 elif field == 'selectable':
@@ -2051,7 +2034,7 @@ class BlenderAnimPickerWindow(QtWidgets.QWidget):
                         "assigned_objects": getattr(button, 'assigned_objects', []),
                         "mode": getattr(button, 'mode', 'select'),
                         "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-                        "pose_data": getattr(button, 'pose_data', {}),
+                        "pose_data": button.pose_document_data(),
                         "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                         "shape_type": button.shape_type,
                         "svg_path_data": button.svg_path_data,
@@ -2128,7 +2111,7 @@ class BlenderAnimPickerWindow(QtWidgets.QWidget):
             "assigned_objects": getattr(button, 'assigned_objects', []),
             "mode": getattr(button, 'mode', 'select'),
             "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-            "pose_data": getattr(button, 'pose_data', {}),
+            "pose_data": button.pose_document_data(),
             "thumbnail_path": getattr(button, 'thumbnail_path', ''),
             "shape_type": button.shape_type,
             "svg_path_data": button.svg_path_data,
@@ -2176,7 +2159,7 @@ class BlenderAnimPickerWindow(QtWidgets.QWidget):
             "assigned_objects": button.assigned_objects,
             "mode": button.mode,
             "script_data": button.script_data,
-            "pose_data": button.pose_data,
+            "pose_data": button.pose_document_data(),
             "thumbnail_path": getattr(button, 'thumbnail_path', ''),
             "shape_type": button.shape_type,
             "svg_path_data": button.svg_path_data,
@@ -2259,7 +2242,7 @@ class BlenderAnimPickerWindow(QtWidgets.QWidget):
                     "assigned_objects": getattr(canvas_button, 'assigned_objects', []),
                     "mode": getattr(canvas_button, 'mode', 'select'),
                     "script_data": getattr(canvas_button, 'script_data', {'code': '', 'type': 'python'}),
-                    "pose_data": getattr(canvas_button, 'pose_data', {}),
+                    "pose_data": canvas_button.pose_document_data(),
                     "thumbnail_path": getattr(canvas_button, 'thumbnail_path', ''),
                     "shape_type": canvas_button.shape_type,
                     "svg_path_data": canvas_button.svg_path_data,
@@ -3205,7 +3188,7 @@ class BlenderAnimPickerWindow(QtWidgets.QWidget):
             "assigned_objects": getattr(button, 'assigned_objects', []),
             "mode": getattr(button, 'mode', 'select'),
             "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-            "pose_data": getattr(button, 'pose_data', {}),
+            "pose_data": button.pose_document_data(),
             "thumbnail_path": getattr(button, 'thumbnail_path', ''),
             "shape_type": button.shape_type,
             "svg_path_data": button.svg_path_data,
@@ -3687,6 +3670,8 @@ class BlenderAnimPickerWindow(QtWidgets.QWidget):
         except Exception as e:
             print(f"Error unregistering from visibility manager: {e}")
 
+        NR.NamespaceRegistry.get_instance().remove_listener(self.check_scene_for_updates)
+
         # Comprehensive cleanup
         self.cleanup_resources()
         
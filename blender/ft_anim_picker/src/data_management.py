@@ -6,6 +6,7 @@ from collections import OrderedDict
 from threading import Timer
 
 from . import blender_ui as UI
+from . import pose_library as PL
 
 class PickerDataManager:
     PROP_NAME = 'PickerToolData'
@@ -501,6 +502,8 @@ class PickerDataManager:
     def _perform_save(cls, data):
         """Actually perform the save operation"""
         try:
+            # Poses are kept in the pose library; the document only stores references
+            PL.externalize_pose_data(data)
             scene = bpy.context.scene
             scene[cls.PROP_NAME] = json.dumps(data)
             cls._last_save_time = time.time()
@@ -0,0 +1,321 @@
+from PySide6 import QtWidgets, QtCore
+from PySide6.QtCore import QTimer
+
+from . import utils as UT
+
+def item_id(obj_data):
+    """Unique identifier for an assigned object/bone"""
+    if obj_data.get('is_bone', False):
+        return f"{obj_data.get('armature', '')}|{obj_data.get('name', '')}"
+    return obj_data.get('name', '')
+
+class MissingObjectsReport:
+    """Session-wide record of assigned objects that could not be resolved.
+
+    The selection resolver only appends to this store; it never touches UI. The report
+    panel listens for changes and refreshes on its own (coalesced) timer.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = MissingObjectsReport()
+        return cls._instance
+
+    def __init__(self):
+        self._entries = {}  # (button_id, item_key, kind) -> entry dict
+        self._listeners = []
+
+    def record(self, button, obj_data, kind='object', namespace=None):
+        """Record a missing item for button (called from the resolver hot path)"""
+        item_key = item_id(obj_data)
+        key = (button.unique_id, item_key, kind)
+
+        entry = self._entries.get(key)
+        is_new = entry is None
+        if is_new:
+            entry = {
+                'button_id': button.unique_id,
+                'button_label': button.label,
+                'item_key': item_key,
+                'name': obj_data.get('name', ''),
+                'armature': obj_data.get('armature', ''),
+                'is_bone': obj_data.get('is_bone', False),
+                'kind': kind,
+                'count': 0,
+                'namespace': namespace,
+            }
+            self._entries[key] = entry
+        entry['count'] += 1
+        entry['namespace'] = namespace
+
+        self._notify(is_new)
+
+    def entries(self):
+        return list(self._entries.values())
+
+    def discard(self, button, obj_data, kind='object'):
+        """Drop the entry of an item that resolves again (called from the resolver hot path)"""
+        if not self._entries:
+            return
+        if self._entries.pop((button.unique_id, item_id(obj_data), kind), None) is not None:
+            self._notify(False)
+
+    def remove(self, button_id, item_key, kind=None):
+        """Drop the entries of an item (only those of kind when given)"""
+        keys = [key for key in self._entries 
+                if key[0] == button_id and key[1] == item_key and (kind is None or key[2] == kind)]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            self._notify(False)
+
+    def clear(self):
+        self._entries.clear()
+        self._notify(False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add_listener(self, listener):
+        """Register a callable(has_new_entries) notified on every change"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, has_new_entries):
+        for listener in list(self._listeners):
+            try:
+                listener(has_new_entries)
+            except Exception as e:
+                print(f"Error in missing objects listener: {e}")
+
+class MissingObjectsPanel(QtWidgets.QWidget):
+    """Non-modal panel listing missing objects for the session with a one-click repair"""
+    def __init__(self, canvas, parent=None):
+        super(MissingObjectsPanel, self).__init__(parent or canvas.window())
+        self.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+        self.setAttribute(QtCore.Qt.WA_ShowWithoutActivating)
+        self.canvas = canvas
+        self.report = MissingObjectsReport.get_instance()
+
+        # Register with visibility manager so the panel hides with its picker
+        self.parent_picker = canvas.window()
+        from . import blender_main
+        visibility_manager = blender_main.PickerVisibilityManager.get_instance()
+        visibility_manager.register_child_widget(self.parent_picker, self)
+
+        # Setup main layout
+        self.main_layout = QtWidgets.QVBoxLayout(self)
+        self.main_layout.setContentsMargins(4, 4, 4, 4)
+        self.main_layout.setSpacing(4)
+
+        # Create main frame
+        self.frame = QtWidgets.QFrame()
+        self.frame.setFixedWidth(260)
+        self.frame.setStyleSheet("""
+            QFrame {
+                background-color: rgba(36, 36, 36, .9);
+                border: 1px solid #444444;
+                border-radius: 4px;
+            }
+        """)
+        self.frame_layout = QtWidgets.QVBoxLayout(self.frame)
+        self.frame_layout.setContentsMargins(6, 6, 6, 6)
+        self.frame_layout.setSpacing(6)
+
+        # Title bar with draggable area and close button
+        self.title_bar = QtWidgets.QWidget()
+        self.title_bar.setFixedHeight(30)
+        self.title_bar.setStyleSheet("background: rgba(30, 30, 30, .9); border: none; border-radius: 3px;")
+        title_layout = QtWidgets.QHBoxLayout(self.title_bar)
+        title_layout.setContentsMargins(6, 6, 6, 6)
+        title_layout.setSpacing(6)
+
+        self.title_label = QtWidgets.QLabel("Missing Objects")
+        self.title_label.setStyleSheet("color: #dddddd; background: transparent;")
+        title_layout.addWidget(self.title_label)
+
+        self.close_button = QtWidgets.QPushButton("✕")
+        self.close_button.setFixedSize(16, 16)
+        self.close_button.setStyleSheet("""
+            QPushButton {
+                background-color: rgba(200, 0, 0, 0.6);
+                color: #ff9393;
+                border: none;
+                border-radius: 2px;
+                padding: 0px 0px 2px 0px;
+            }
+            QPushButton:hover {
+                background-color: rgba(255, 0, 0, 0.6);
+            }
+        """)
+        title_layout.addWidget(self.close_button)
+
+        # Missing objects list
+        self.missing_list = QtWidgets.QListWidget()
+        self.missing_list.setFixedHeight(180)
+        self.missing_list.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.missing_list.setStyleSheet("""
+            QListWidget {
+                background-color: #1e1e1e;
+                border: none;
+                border-radius: 2px;
+                color: #dddddd;
+                outline: 0;
+            }
+            QListWidget::item {
+                padding: 3px;
+            }
+        """)
+
+        self.note_label = QtWidgets.QLabel("[Objects may have been deleted or renamed]")
+        self.note_label.setStyleSheet("color: rgba(255, 255, 255, 0.4); font-size: 10px; background: transparent; border: none;")
+
+        # Repair controls
+        repair_layout = QtWidgets.QHBoxLayout()
+        self.namespace_combo = QtWidgets.QComboBox()
+        self.namespace_combo.setFixedHeight(20)
+        self.namespace_combo.setStyleSheet("background-color: #1e1e1e; color: #dddddd; border: none; border-radius: 3px; padding-left: 4px;")
+
+        self.repair_button = QtWidgets.QPushButton("Repair All")
+        self.repair_button.setFixedHeight(20)
+        self.repair_button.setToolTip("Remap all missing objects to the chosen namespace")
+        self.repair_button.setStyleSheet("""
+            QPushButton {
+                background-color: #5285a6;
+                color: white;
+                border: none;
+                border-radius: 3px;
+                padding: 0px 6px;
+            }
+            QPushButton:hover {
+                background-color: #619ac2;
+            }
+        """)
+
+        self.clear_button = QtWidgets.QPushButton("Clear")
+        self.clear_button.setFixedHeight(20)
+        self.clear_button.setStyleSheet("""
+            QPushButton {
+                background-color: #494949;
+                color: white;
+                border: none;
+                border-radius: 3px;
+                padding: 0px 6px;
+            }
+            QPushButton:hover {
+                background-color: #5a5a5a;
+            }
+        """)
+        repair_layout.addWidget(self.namespace_combo, 1)
+        repair_layout.addWidget(self.repair_button)
+        repair_layout.addWidget(self.clear_button)
+
+        self.frame_layout.addWidget(self.title_bar)
+        self.frame_layout.addWidget(self.missing_list)
+        self.frame_layout.addWidget(self.note_label)
+        self.frame_layout.addLayout(repair_layout)
+        self.main_layout.addWidget(self.frame)
+
+        # Refreshes are coalesced so a burst of misses costs one repaint
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh_list)
+
+        # Connect signals
+        self.close_button.clicked.connect(self.close)
+        self.repair_button.clicked.connect(self.repair_all)
+        self.clear_button.clicked.connect(self.report.clear)
+        self.report.add_listener(self._on_report_changed)
+
+        # Window dragging
+        self.dragging = False
+        self.offset = None
+        self.title_bar.mousePressEvent = self.title_bar_mouse_press
+        self.title_bar.mouseMoveEvent = self.title_bar_mouse_move
+        self.title_bar.mouseReleaseEvent = self.title_bar_mouse_release
+
+        self.refresh_list()
+
+    def _on_report_changed(self, has_new_entries):
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start(100)
+
+    def refresh_list(self):
+        self.missing_list.clear()
+        for entry in sorted(self.report.entries(), key=lambda e: (e['button_label'], e['name'])):
+            suffix = " (counterpart)" if entry['kind'] == 'counterpart' else ""
+            if entry['is_bone']:
+                suffix = f" (in {entry['armature']}){suffix}"
+            text = f"{entry['name']}{suffix}  —  {entry['button_label'] or entry['button_id']}"
+            if entry['count'] > 1:
+                text += f"  ×{entry['count']}"
+            self.missing_list.addItem(QtWidgets.QListWidgetItem(text))
+
+        self.title_label.setText(f"Missing Objects ({len(self.report)})")
+        self.repair_button.setEnabled(len(self.report) > 0)
+        self._refresh_namespaces()
+
+    def _refresh_namespaces(self):
+        main_window = self.canvas.window()
+        if not hasattr(main_window, 'namespace_dropdown'):
+            return
+        current = self.namespace_combo.currentText() or main_window.namespace_dropdown.currentText()
+        dropdown = main_window.namespace_dropdown
+        namespaces = [dropdown.itemText(i) for i in range(dropdown.count())]
+
+        self.namespace_combo.blockSignals(True)
+        self.namespace_combo.clear()
+        self.namespace_combo.addItems(namespaces)
+        if current in namespaces:
+            self.namespace_combo.setCurrentText(current)
+        self.namespace_combo.blockSignals(False)
+
+    def repair_all(self):
+        namespace = self.namespace_combo.currentText()
+        repaired, remaining = self.canvas.repair_missing_objects(namespace)
+        self.note_label.setText(f"[Repaired {repaired}, {remaining} still missing]")
+        self.refresh_list()
+
+    def position_window(self):
+        main_window = self.canvas.window()
+        global_pos = main_window.mapToGlobal(main_window.rect().topRight())
+        self.move(global_pos + QtCore.QPoint(10, 0))
+
+    # Window dragging methods
+    def title_bar_mouse_press(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            self.dragging = True
+            self.offset = event.globalPos() - self.pos()
+
+    def title_bar_mouse_move(self, event):
+        if self.dragging and event.buttons() == QtCore.Qt.LeftButton:
+            self.move(event.globalPos() - self.offset)
+
+    def title_bar_mouse_release(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            self.dragging = False
+
+    def showEvent(self, event):
+        self.report.add_listener(self._on_report_changed)
+        from . import blender_main
+        blender_main.PickerVisibilityManager.get_instance().register_child_widget(self.parent_picker, self)
+        self.refresh_list()
+        super().showEvent(event)
+
+    def closeEvent(self, event):
+        self.report.remove_listener(self._on_report_changed)
+        
+        # Unregister from visibility manager
+        from . import blender_main
+        visibility_manager = blender_main.PickerVisibilityManager.get_instance()
+        visibility_manager.unregister_child_widget(self.parent_picker, self)
+        
+        super().closeEvent(event)
+        UT.blender_main_window()
@@ -0,0 +1,108 @@
+import bpy
+from PySide6.QtCore import QTimer
+
+from . import scene_events as SE
+
+#----------------------------------------------------------------------------------------------------------
+# SELECTION CACHE STORE
+#----------------------------------------------------------------------------------------------------------
+# Resolution state that outlives PickerButton widgets. Canvas buttons are rebuilt on tab switches
+# and undo/redo, so per-button selection caches live here keyed by button id and are picked up
+# again by the new widgets. Each cache holds one entry per (kind, namespace), which keeps the
+# caches of previously used rigs warm when switching a picker between them.
+
+_selection_caches = {}
+
+def selection_cache_for(button_id):
+    """Persistent selection cache dict for a button id (a private dict if the id is None)"""
+    if button_id is None:
+        return {}
+    return _selection_caches.setdefault(button_id, {})
+
+def clear_selection_caches():
+    _selection_caches.clear()
+
+def _on_scene_changed(reason):
+    # A newly loaded file means new picker data; drop caches of buttons that no longer exist
+    if reason == 'load':
+        clear_selection_caches()
+
+SE.SceneEvents.get_instance().add_listener(_on_scene_changed)
+
+#----------------------------------------------------------------------------------------------------------
+# NAMESPACE REGISTRY
+#----------------------------------------------------------------------------------------------------------
+def _window_scene():
+    """Scene of the main window (bpy.context has no scene when called from Qt outside an override)"""
+    with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
+        return bpy.context.scene
+
+class NamespaceRegistry:
+    """Rig (armature) names of the current scene kept up to date from scene handlers.
+
+    The picker windows read the list from here instead of scanning scene objects on a timer.
+    Object add/remove, renames, collection edits (depsgraph_update_post) and file loads
+    (load_post) mark the list dirty and schedule one coalesced rescan. Listeners are called
+    with the new list when it actually changed.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = NamespaceRegistry()
+        return cls._instance
+
+    def __init__(self):
+        self._namespaces = None  # Sorted rig names, None while dirty
+        self._notified_namespaces = None
+        self._scene_pointer = None
+        self._listeners = []
+
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        SE.SceneEvents.get_instance().add_listener(self._on_scene_changed)
+
+    def namespaces(self):
+        """Dropdown entries ('None' first); only rescans the scene if the list is dirty"""
+        SE.scene_generation()  # Make sure the handlers feeding this registry are installed
+        if self._namespaces is None or self._scene_pointer != _window_scene().as_pointer():
+            self._namespaces = self._scan()
+        return ['None'] + self._namespaces
+
+    def refresh(self):
+        """Rescan now and notify listeners if the rig list changed"""
+        self._namespaces = self._scan()
+        if self._namespaces != self._notified_namespaces:
+            self._notified_namespaces = self._namespaces
+            self._notify()
+
+    def add_listener(self, listener):
+        """Register a callable(namespaces) notified when the rig list changes"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _scan(self):
+        scene = _window_scene()
+        self._scene_pointer = scene.as_pointer()
+        return sorted(obj.name for obj in scene.objects if obj.type == 'ARMATURE')
+
+    def _notify(self):
+        namespaces = ['None'] + self._namespaces
+        for listener in list(self._listeners):
+            try:
+                listener(namespaces)
+            except Exception as e:
+                print(f"Error in namespace listener: {e}")
+
+    def _on_scene_changed(self, reason):
+        self._namespaces = None
+        # Coalesce bursts (file load, linking a rig) into a single rescan
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start(200)
@@ -0,0 +1,395 @@
+import bpy
+import time
+from collections import ChainMap
+from bpy.app.handlers import persistent
+
+from . import scene_events as SE
+from . import utils as UT
+
+#----------------------------------------------------------------------------------------------------------
+# OBJECT AND MIRROR CACHES
+#----------------------------------------------------------------------------------------------------------
+# Name lookups (exact, namespace prefix/suffix, partial, by type) and mirror counterparts for every
+# object in bpy.data.objects, used when applying and mirroring poses. They used to be rebuilt from
+# all objects on every call; now they are built once and kept up to date from the scene events:
+# objects reported by depsgraph_update_post as added or renamed are patched in, deletions prune the
+# dead references, undo/redo rebind the (reallocated) objects by name and only a file load or a
+# count mismatch falls back to a full rebuild. Counterparts are found by trying MIRROR_PATTERNS on
+# the name; each name's candidate list is kept with a reverse index, so adding or removing an
+# object only re-resolves the names that list it as a candidate.
+#
+# The returned dicts are live views of the cache and must be treated as read-only.
+
+MIRROR_PATTERNS = (
+    # Suffix patterns
+    ('_L', '_R'), ('_l', '_r'), ('.L', '.R'), ('.l', '.r'),
+    ('Left', 'Right'), ('left', 'right'),
+    ('_Left', '_Right'), ('_left', '_right'),
+    ('.Left', '.Right'), ('.left', '.right'),
+    # Prefix patterns
+    ('L_', 'R_'), ('l_', 'r_'), ('L.', 'R.'), ('l.', 'r.'),
+    ('Left_', 'Right_'), ('left_', 'right_'),
+    ('Left.', 'Right.'), ('left.', 'right.')
+)
+
+NAMESPACE_SEPARATORS = ('_', '.')
+
+def _type_key(obj):
+    return 'ARMATURE' if obj.type == 'ARMATURE' else ('MESH' if obj.type == 'MESH' else 'OTHER')
+
+def _name_parts(name):
+    lower_name = name.lower()
+    return [part for part in lower_name.split('_') + lower_name.split('.') if part and len(part) > 2]
+
+def _is_alive(obj):
+    try:
+        obj.name
+        return True
+    except ReferenceError:
+        return False
+
+def mirror_name_candidates(name):
+    """Counterpart names to try for an object name, in priority order (one per matching pattern)"""
+    candidates = []
+    for left_pat, right_pat in MIRROR_PATTERNS:
+        if name.endswith(left_pat):
+            candidates.append(name[:-len(left_pat)] + right_pat)
+        elif name.endswith(right_pat):
+            candidates.append(name[:-len(right_pat)] + left_pat)
+        elif name.startswith(left_pat):
+            candidates.append(right_pat + name[len(left_pat):])
+        elif name.startswith(right_pat):
+            candidates.append(left_pat + name[len(right_pat):])
+        elif left_pat in name:
+            candidates.append(name.replace(left_pat, right_pat))
+        elif right_pat in name:
+            candidates.append(name.replace(right_pat, left_pat))
+    return candidates
+
+def mirror_base_candidates(base_name):
+    """Counterpart names to try for a name with the namespace stripped"""
+    candidates = []
+    for left_pat, right_pat in MIRROR_PATTERNS:
+        if left_pat in base_name:
+            candidates.append(base_name.replace(left_pat, right_pat))
+        elif right_pat in base_name:
+            candidates.append(base_name.replace(right_pat, left_pat))
+    return candidates
+
+class _MirrorIndex:
+    """Counterparts for the keys of a name -> object map: {name: first existing candidate's object}"""
+    def __init__(self, objects, candidates_for):
+        self.objects = objects
+        self.candidates_for = candidates_for
+        self.mirror = {}
+        self._candidates = {}  # name -> candidate names
+        self._listed_by = {}  # candidate name -> names that list it
+
+    def rebuild(self):
+        self.mirror.clear()
+        self._candidates.clear()
+        self._listed_by.clear()
+        for name in self.objects:
+            self._index(name)
+        self.resolve_all()
+
+    def resolve_all(self):
+        for name in self._candidates:
+            self._resolve(name)
+
+    def add(self, name):
+        """Call after name was added to the object map"""
+        self._index(name)
+        self._resolve(name)
+        for other in self._listed_by.get(name, ()):
+            self._resolve(other)
+
+    def remove(self, name):
+        """Call after name was removed from the object map"""
+        for candidate in self._candidates.pop(name, ()):
+            listed = self._listed_by.get(candidate)
+            if listed:
+                listed.discard(name)
+                if not listed:
+                    del self._listed_by[candidate]
+        self.mirror.pop(name, None)
+        for other in list(self._listed_by.get(name, ())):
+            self._resolve(other)
+
+    def _index(self, name):
+        candidates = self.candidates_for(name)
+        self._candidates[name] = candidates
+        for candidate in candidates:
+            self._listed_by.setdefault(candidate, set()).add(name)
+
+    def _resolve(self, name):
+        for candidate in self._candidates.get(name, ()):
+            obj = self.objects.get(candidate)
+            if obj is not None:
+                self.mirror[name] = obj
+                return
+        self.mirror.pop(name, None)
+
+class _NamespaceView:
+    """Namespace prefix/suffix lookups (and their mirror index) for one namespace"""
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.prefix = {}
+        self.suffix = {}
+        self.mirror_index = _MirrorIndex(self.prefix, mirror_base_candidates)
+
+    def _bases(self, name):
+        prefix_bases = []
+        suffix_bases = []
+        for sep in NAMESPACE_SEPARATORS:
+            prefix_pattern = f"{self.namespace}{sep}"
+            if name.startswith(prefix_pattern):
+                prefix_bases.append(name[len(prefix_pattern):])
+            suffix_pattern = f"{sep}{self.namespace}"
+            if name.endswith(suffix_pattern):
+                suffix_bases.append(name[:-len(suffix_pattern)])
+        if name == self.namespace:
+            prefix_bases.append(name)
+            suffix_bases.append(name)
+        return prefix_bases, suffix_bases
+
+    def rebuild(self, objects):
+        self.rebind(objects)
+        self.mirror_index.rebuild()
+
+    def rebind(self, objects):
+        """Refill the lookups with new references for the same names and re-resolve counterparts"""
+        self.prefix.clear()
+        self.suffix.clear()
+        for name, obj in objects.items():
+            prefix_bases, suffix_bases = self._bases(name)
+            for base in prefix_bases:
+                self.prefix[base] = obj
+            for base in suffix_bases:
+                self.suffix[base] = obj
+        self.mirror_index.resolve_all()
+
+    def add(self, name, obj):
+        prefix_bases, suffix_bases = self._bases(name)
+        for base in suffix_bases:
+            self.suffix[base] = obj
+        for base in prefix_bases:
+            self.prefix[base] = obj
+            self.mirror_index.add(base)
+
+    def remove(self, name, obj):
+        prefix_bases, suffix_bases = self._bases(name)
+        for base in suffix_bases:
+            if self.suffix.get(base) is obj:
+                del self.suffix[base]
+        for base in prefix_bases:
+            if self.prefix.get(base) is obj:
+                del self.prefix[base]
+                self.mirror_index.remove(base)
+
+class ObjectCache:
+    """Persistent object lookup and mirror caches for all objects in the blend file"""
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = ObjectCache()
+        return cls._instance
+
+    def __init__(self):
+        self.exact = {}
+        self.partial = {}
+        self.by_type = {'ARMATURE': [], 'MESH': [], 'OTHER': []}
+        self.mirror_index = _MirrorIndex(self.exact, mirror_name_candidates)
+        self._views = {}  # namespace -> _NamespaceView
+        self._names = {}  # object pointer -> name it is cached under
+
+        self._built = False
+        self._rebind_needed = False
+        self._pending_objects = []  # Objects reported added/renamed since the last sync
+        self._handlers_installed = False
+
+        SE.SceneEvents.get_instance().add_listener(self._on_scene_changed)
+
+    #------------------------------------------------------------------------------
+    def object_cache(self, namespace):
+        """Lookup dict with 'exact', 'namespace_prefix', 'namespace_suffix', 'partial' and 'by_type'"""
+        self.sync()
+        view = self._view(namespace)
+        return {
+            'exact': self.exact,
+            'namespace_prefix': view.prefix if view else {},
+            'namespace_suffix': view.suffix if view else {},
+            'partial': self.partial,
+            'by_type': self.by_type,
+        }
+
+    def mirror_cache(self, namespace):
+        """Mapping of object name (or namespace-stripped name) -> mirrored counterpart object"""
+        self.sync()
+        view = self._view(namespace)
+        if view is None:
+            return self.mirror_index.mirror
+        # Namespace matches take precedence over exact-name matches
+        return ChainMap(view.mirror_index.mirror, self.mirror_index.mirror)
+
+    def invalidate(self):
+        """Force a full rebuild on next use"""
+        self._built = False
+
+    def sync(self):
+        """Bring the caches up to date with bpy.data.objects"""
+        SE.scene_generation()  # Make sure the depsgraph handler feeding this cache is installed
+        self._install_handlers()
+
+        if not self._built or not SE.SceneEvents.get_instance().installed:
+            self._rebuild()
+            return
+
+        start_time = time.perf_counter()
+        if self._rebind_needed:
+            self._rebind()
+        if self._pending_objects:
+            self._apply_pending()
+
+        if len(self.exact) != len(bpy.data.objects):
+            # Deleted objects are not reported by the depsgraph; drop references that died
+            self._prune()
+            if len(self.exact) != len(bpy.data.objects):
+                self._rebuild()
+                return
+
+        if UT.DEBUG:
+            print(f"Object cache synced in {(time.perf_counter() - start_time) * 1000.0:.2f}ms")
+
+    #------------------------------------------------------------------------------
+    def _view(self, namespace):
+        if not namespace or namespace == 'None':
+            return None
+        view = self._views.get(namespace)
+        if view is None:
+            view = _NamespaceView(namespace)
+            view.rebuild(self.exact)
+            self._views[namespace] = view
+        return view
+
+    def _rebuild(self):
+        start_time = time.perf_counter()
+        self.exact.clear()
+        self.partial.clear()
+        for objects in self.by_type.values():
+            objects.clear()
+        self._names.clear()
+
+        for obj in bpy.data.objects:
+            self._add_lookups(obj)
+
+        self.mirror_index.rebuild()
+        for view in self._views.values():
+            view.rebuild(self.exact)
+
+        self._built = True
+        self._rebind_needed = False
+        self._pending_objects = []
+        if UT.DEBUG:
+            print(f"Object cache rebuilt: {len(self.exact)} objects in {(time.perf_counter() - start_time) * 1000.0:.1f}ms")
+
+    def _add_lookups(self, obj):
+        name = obj.name
+        self.exact[name] = obj
+        self._names[obj.as_pointer()] = name
+        self.by_type[_type_key(obj)].append(obj)
+        for part in _name_parts(name):
+            self.partial.setdefault(part, []).append(obj)
+
+    def _add(self, obj):
+        self._add_lookups(obj)
+        self.mirror_index.add(obj.name)
+        for view in self._views.values():
+            view.add(obj.name, obj)
+
+    def _remove(self, name):
+        obj = self.exact.pop(name, None)
+        if obj is None:
+            return
+        self.mirror_index.remove(name)
+        for view in self._views.values():
+            view.remove(name, obj)
+
+        # Compare by identity: the reference may already be dead, and it is the one stored in the lists
+        for objects in self.by_type.values():
+            objects[:] = [other for other in objects if other is not obj]
+        for part in _name_parts(name):
+            objects = self.partial.get(part)
+            if objects is not None:
+                objects[:] = [other for other in objects if other is not obj]
+                if not objects:
+                    del self.partial[part]
+
+    def _apply_pending(self):
+        pending, self._pending_objects = self._pending_objects, []
+        for obj in pending:
+            if not _is_alive(obj):
+                continue
+            name = obj.name
+            cached_name = self._names.get(obj.as_pointer())
+            if cached_name == name and name in self.exact:
+                continue
+            if cached_name is not None:
+                self._remove(cached_name)  # Renamed
+            self._remove(name)  # Name taken over from an object that no longer has it
+            self._add(obj)
+
+    def _prune(self):
+        for name, obj in list(self.exact.items()):
+            if not _is_alive(obj):
+                self._remove(name)
+            elif obj.name != name:
+                self._remove(name)
+                self._add(obj)
+
+    def _rebind(self):
+        """Undo/redo reallocate every ID: swap the cached references for the new objects by name.
+
+        The lookups are refilled from the same names; mirror candidates are kept and only re-resolved.
+        """
+        self._rebind_needed = False
+        objects = {obj.name: obj for obj in bpy.data.objects}
+        if objects.keys() != self.exact.keys():
+            self._rebuild()
+            return
+
+        self.partial.clear()
+        for type_objects in self.by_type.values():
+            type_objects.clear()
+        self._names.clear()
+        for obj in objects.values():
+            self._add_lookups(obj)
+
+        self.mirror_index.resolve_all()
+        for view in self._views.values():
+            view.rebind(self.exact)
+
+    #------------------------------------------------------------------------------
+    def _on_scene_changed(self, reason):
+        if reason == 'load':
+            self.invalidate()
+            self._views.clear()
+        elif reason in ('objects', 'rename'):
+            self._pending_objects.extend(SE.SceneEvents.get_instance().updated_objects)
+
+    def _install_handlers(self):
+        if self._handlers_installed:
+            return
+        if _on_undo_redo_post not in bpy.app.handlers.undo_post:
+            bpy.app.handlers.undo_post.append(_on_undo_redo_post)
+        if _on_undo_redo_post not in bpy.app.handlers.redo_post:
+            bpy.app.handlers.redo_post.append(_on_undo_redo_post)
+        self._handlers_installed = True
+
+@persistent
+def _on_undo_redo_post(*args):
+    cache = ObjectCache.get_instance()
+    cache._rebind_needed = True
+    cache._pending_objects = []
@@ -9,6 +9,7 @@ from PySide6.QtWidgets import QLabel, QToolTip
 from PySide6.QtCore import Qt
 
 import re
+import time
 
 from . import utils as UT
 from . import custom_line_edit as CLE
@@ -19,8 +20,43 @@ from . import tool_functions as TF
 from . import custom_dialog as CD
 from . import blender_main as MAIN
 from . import custom_color_picker as CCP
+from . import script_tokens as ST
 from . utils import undoable
 
+#----------------------------------------------------------------------------------------------------------
+# SYNTAX HIGHLIGHTING RULES
+#----------------------------------------------------------------------------------------------------------
+# Rules are compiled once. highlightBlock splits a line into code, string and comment segments in a
+# single scan and runs the code rules over code segments only, so a line costs a fixed number of
+# linear passes. Triple-quoted strings left open at the end of a line are carried to the next line
+# through the block state.
+
+STATE_CODE = 0
+TRIPLE_QUOTE_STATES = {"'''": 1, '"""': 2}
+TRIPLE_QUOTES = {state: quote for quote, state in TRIPLE_QUOTE_STATES.items()}
+
+_SEGMENT_RE = re.compile(r'''
+    (?P<triple>'{3}|"{3})
+  | (?P<string>'(?:[^'\\]|\\.)*(?:'|\\?$)|"(?:[^"\\]|\\.)*(?:"|\\?$))
+  | (?P<comment>\#.*)
+''', re.VERBOSE)
+_TRIPLE_END_RE = {
+    "'''": re.compile(r"(?:[^'\\]|\\.|'(?!''))*'''"),
+    '"""': re.compile(r'(?:[^"\\]|\\.|"(?!""))*"""'),
+}
+
+_TOKEN_RE = re.compile(r'''
+    (?P<tf>@TF\.)(?P<tf_name>\w+)
+  | (?P<call>@(?:picker_button|button_appearance|tool_tip|pb|ba|tt)\s*\()(?P<args>[^)]*)
+  | (?P<special>@reset_(?:all|move|scale|rotate)\b|@match_(?:ik_to_fk|fk_to_ik)\s*\([^)]*\)?)
+  | (?P<ns>@ns\.?)
+''', re.VERBOSE | re.IGNORECASE)
+_NS_RE = re.compile(r'@ns\.?', re.IGNORECASE)
+_BRACKET_RE = re.compile(r'[\(\)\{\}\[\]]')
+_ASSIGNMENT_RE = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\s*=(?!=)')
+_LINE_ASSIGNMENT_RE = re.compile(r'\s*([a-zA-Z_][a-zA-Z0-9_]*(?:\s*,\s*[a-zA-Z_][a-zA-Z0-9_]*)+)\s*=(?!=)')
+_IDENTIFIER_RE = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*')
+
 class ScriptSyntaxHighlighter(QtGui.QSyntaxHighlighter):
     def __init__(self, parent=None):
         super(ScriptSyntaxHighlighter, self).__init__(parent)
@@ -69,181 +105,103 @@ class ScriptSyntaxHighlighter(QtGui.QSyntaxHighlighter):
             'continue', 'try', 'except', 'finally', 'with', 'lambda', 'yield', 'global', 'nonlocal', 'assert', 'del',
             'raise', 'and', 'or', 'not', 'in', 'is', 'True', 'False', 'None', 'bpy'
         ]
-        self.keyword_pattern = r'\\b(' + '|'.join(self.python_keywords) + r')\\b'
+        self.keyword_re = re.compile(r'\b(' + '|'.join(self.python_keywords) + r')\b')
 
     def highlightBlock(self, text):
-        # Define all special tokens to highlight
-        special_patterns = [
-            r'@match_ik_to_fk\s*\([^)]*\)',  # Match @match_ik_to_fk() with any parameters
-            r'@match_fk_to_ik\s*\([^)]*\)',   # Match @match_fk_to_ik() with any parameters
-        ]
-        #--------------------------------------------------------------------------------------------------------
-        # First, collect all quoted string ranges to avoid highlighting comments inside them
-        quoted_ranges = []
-        
-        # Find double quoted strings
-        double_quote_pattern = r'"[^"\\]*(?:\\.[^"\\]*)*"'
-        for match in re.finditer(double_quote_pattern, text):
-            quoted_ranges.append((match.start(), match.end()))
-        
-        # Find single quoted strings
-        single_quote_pattern = r'\'[^\'\\]*(?:\\.[^\'\\]*)*\''
-        for match in re.finditer(single_quote_pattern, text):
-            quoted_ranges.append((match.start(), match.end()))
-        
-        # Helper function to check if a position is inside a quoted string
-        def is_in_quoted_string(pos):
-            for start, end in quoted_ranges:
-                if start <= pos < end:
-                    return True
-            return False
-        
-        # Store quoted text positions but don't apply formatting yet
-        # We'll apply quoted text formatting after variable highlighting
-        quoted_text_matches = []
-        
-        for match in re.finditer(double_quote_pattern, text):
-            quoted_text_matches.append((match.start(), len(match.group())))
+        for kind, start, end in self._segments(text):
+            if kind == 'code':
+                self._highlight_code(text, start, end)
+            elif kind == 'string':
+                self.setFormat(start, end - start, self.quoted_text_format)
+                # Namespace tokens are resolved inside strings, so they stand out there too
+                for match in _NS_RE.finditer(text, start, end):
+                    self.setFormat(match.start(), len(match.group()), self.special_format)
+            else:
+                self.setFormat(start, end - start, self.comment_format)
 
-        for match in re.finditer(single_quote_pattern, text):
-            quoted_text_matches.append((match.start(), len(match.group())))
-        #--------------------------------------------------------------------------------------------------------
-        # Apply highlighting for @TF.functionName pattern (without brackets) Only highlight if the function exists in tool_functions
-        tool_functions = ['tool_tip','button_appearance','reset_move','reset_scale','reset_rotate','reset_all']
-        tf_pattern = r'(@TF\.)(\w+)'
-        for match in re.finditer(tf_pattern, text, re.IGNORECASE):
-            function_name = match.group(2)
-            if function_name in tool_functions:
-                # Apply bright green to @TF.
-                self.setFormat(match.start(1), len(match.group(1)), self.special_format)
-                # Apply sky blue to the function name
-                self.setFormat(match.start(2), len(match.group(2)), self.tf_function_format)
-        #--------------------------------------------------------------------------------------------------------
-        tool_function_patterns = [
-            r'(@TF\.)(\w+)',
-            r'(@pb\s*\(([^)]+)\))',
-            r'(@picker_button\s*\(([^)]+)\))',
-            r'(@ba\s*\(([^)]+)\))',
-            r'(@button_appearance\s*\(([^)]+)\))',
-            r'(@tt\s*\(([^)]+)\))',
-            r'(@tool_tip\s*\(([^)]+)\))',
-            r'(@tool_tip\s*\(([^)]+)\))',
-            
-        ]
-        tool_function_patterns_02 = [
-            r'(@reset_all\b)',
-            r'(@reset_move\b)',
-            r'(@reset_scale\b)',
-            r'(@reset_rotate\b)',
-        ]
-        #--------------------------------------------------------------------------------------------------------
-        for pattern in tool_function_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Apply bright green to @pb
-                self.setFormat(match.start(1), len(match.group(1)), self.special_format)
-                # Apply sky blue to the function name
-                self.setFormat(match.start(2), len(match.group(2)), self.tf_function_format)
-        #--------------------------------------------------------------------------------------------------------
-        for pattern in tool_function_patterns_02:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Apply bright green to the function name
-                self.setFormat(match.start(1), len(match.group(1)), self.special_format)
-        #--------------------------------------------------------------------------------------------------------
-        # Apply highlighting for other special patterns
-        for pattern in special_patterns:
-            for match in re.finditer(pattern, text):
+    def _segments(self, text):
+        """(kind, start, end) segments of a line, kind being 'code', 'string' or 'comment'.
+
+        Starts inside the triple-quoted string left open by the previous block, if any, and sets the
+        block state for the next one.
+        """
+        segments = []
+        pos = 0
+        string_start = 0
+        quote = TRIPLE_QUOTES.get(self.previousBlockState())
+        while True:
+            if quote:
+                # Inside a triple-quoted string: it runs to its closing quotes or past the end of the line
+                end = _TRIPLE_END_RE[quote].match(text, pos)
+                if end is None:
+                    segments.append(('string', string_start, len(text)))
+                    self.setCurrentBlockState(TRIPLE_QUOTE_STATES[quote])
+                    return segments
+                segments.append(('string', string_start, end.end()))
+                pos = end.end()
+                quote = None
+
+            match = _SEGMENT_RE.search(text, pos)
+            if match is None:
+                break
+            if match.start() > pos:
+                segments.append(('code', pos, match.start()))
+            if match.lastgroup == 'triple':
+                quote = match.group()
+                string_start = match.start()
+                pos = match.end()
+                continue
+            segments.append((match.lastgroup, match.start(), match.end()))
+            pos = match.end()
+
+        if pos < len(text):
+            segments.append(('code', pos, len(text)))
+        self.setCurrentBlockState(STATE_CODE)
+        return segments
+
+    def _highlight_code(self, text, start, end):
+        """Picker tokens, keywords, brackets and assigned names of the code between start and end"""
+        for match in _TOKEN_RE.finditer(text, start, end):
+            kind = match.lastgroup
+            if kind == 'tf_name':
+                self.setFormat(match.start('tf'), len(match.group('tf')), self.special_format)
+                self.setFormat(match.start('tf_name'), len(match.group('tf_name')), self.tf_function_format)
+            elif kind == 'args':
+                self.setFormat(match.start('call'), len(match.group('call')), self.special_format)
+                self.setFormat(match.start('args'), len(match.group('args')), self.tf_function_format)
+            else:
                 self.setFormat(match.start(), len(match.group()), self.special_format)
-        
-        # Highlight Python keywords
-        for match in re.finditer(r'\b(' + '|'.join(self.python_keywords) + r')\b', text):
+
+        for match in self.keyword_re.finditer(text, start, end):
             self.setFormat(match.start(), len(match.group()), self.keyword_format)
 
-        # Highlight (), {}, [] in yellow
-        for match in re.finditer(r'[\(\)\{\}\[\]]', text):
+        for match in _BRACKET_RE.finditer(text, start, end):
             self.setFormat(match.start(), 1, self.bracket_format)
-        #--------------------------------------------------------------------------------------------------------
-        # FIXED: Highlight variable assignments - consolidated and improved logic
-        
-        # 1. Handle line-start variable assignments (including multiple assignments)
-        line_assignment_pattern = r'^\s*([a-zA-Z_][a-zA-Z0-9_]*(?:\s*,\s*[a-zA-Z_][a-zA-Z0-9_]*)*)\s*=(?!=)'
-        processed_assignments = set()  # Track processed assignments to avoid duplicates
-        
-        for match in re.finditer(line_assignment_pattern, text, re.MULTILINE):
-            var_section = match.group(1)
-            var_start_offset = match.start(1)
-            
-            # Don't highlight if inside a quoted string
-            if not is_in_quoted_string(var_start_offset):
-                # Extract individual variable names from the comma-separated list
-                individual_vars = re.finditer(r'[a-zA-Z_][a-zA-Z0-9_]*', var_section)
-                for var_match in individual_vars:
-                    var_start = var_start_offset + var_match.start()
-                    var_length = len(var_match.group())
-                    
-                    # Double-check each variable position
-                    if not is_in_quoted_string(var_start):
-                        self.setFormat(var_start, var_length, self.variable_format)
-                        processed_assignments.add(var_start)  # Mark as processed
-        
-        # 2. Handle function parameters and keyword arguments (but not line-start assignments)
-        param_pattern = r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=(?!=)'
-        for match in re.finditer(param_pattern, text):
-            param_start = match.start(1)
-            param_length = len(match.group(1))
-            
-            # Skip if already processed as a line-start assignment
-            if param_start in processed_assignments:
-                continue
-            
-            # Don't highlight if inside a quoted string
-            if not is_in_quoted_string(param_start):
-                # Check if this is NOT a line-start assignment
-                line_start = text.rfind('\n', 0, param_start) + 1
-                text_before_param = text[line_start:param_start].strip()
-                
-                # Only highlight if there's something before it on the same line
-                # (indicating it's a function parameter, not a variable assignment)
-                if text_before_param:
-                    self.setFormat(param_start, param_length, self.variable_format)
-        
-        #--------------------------------------------------------------------------------------------------------
-        # Apply quoted text formatting AFTER most highlighting but BEFORE @ns patterns
-        # This ensures strings get their formatting, but special patterns can override
-        for start_pos, length in quoted_text_matches:
-            self.setFormat(start_pos, length, self.quoted_text_format)
-        
-        #--------------------------------------------------------------------------------------------------------
-        # Re-apply @ns patterns AFTER quoted text to ensure they override string formatting
-        # Apply highlighting for @ns.qualifier pattern (handles both direct and quoted contexts)
-        ns_pattern = r'(@ns\.)([a-zA-Z0-9_-]+)'
-        for match in re.finditer(ns_pattern, text, re.IGNORECASE):
-            # Apply special_format to @ns. (always, even inside quotes)
-            self.setFormat(match.start(1), len(match.group(1)), self.special_format)
-            # Apply tf_function_format to the qualifier
-            #self.setFormat(match.start(2), len(match.group(2)), self.tf_function_format)
 
-        # Also handle @ns. when it appears alone (like in strings)
-        standalone_ns_pattern = r'@ns\.?'
-        for match in re.finditer(standalone_ns_pattern, text, re.IGNORECASE):
-            # Check if this @ns. is not already part of a @ns.qualifier match
-            is_standalone = True
-            for qual_match in re.finditer(ns_pattern, text, re.IGNORECASE):
-                if match.start() == qual_match.start(1):
-                    is_standalone = False
-                    break
-            
-            if is_standalone:
-                self.setFormat(match.start(), len(match.group()), self.special_format)
-        
-        #--------------------------------------------------------------------------------------------------------
-        # Highlight comments (lines starting with #) but only if not inside strings
-        # Comments should override quoted text formatting when the # is not inside a string
-        comment_pattern = r'#.*'
-        for match in re.finditer(comment_pattern, text):
-            comment_start = match.start()
-            if not is_in_quoted_string(comment_start):
-                # Apply comment formatting to the entire comment, overriding any previous formatting
-                self.setFormat(comment_start, len(match.group()), self.comment_format)
+        # Assigned names and keyword arguments (a, b = ... at the start of a line included)
+        if start == 0:
+            match = _LINE_ASSIGNMENT_RE.match(text, 0, end)
+            if match:
+                for name in _IDENTIFIER_RE.finditer(text, match.start(1), match.end(1)):
+                    self.setFormat(name.start(), len(name.group()), self.variable_format)
+        for match in _ASSIGNMENT_RE.finditer(text, start, end):
+            self.setFormat(match.start(1), len(match.group(1)), self.variable_format)
+
+def benchmark_paste(lines=5000):
+    """Paste a generated script of `lines` lines into a highlighted CodeEditor (needs a QApplication).
+
+    Returns {'lines', 'ms'} for the paste, highlighting included.
+    """
+    editor = CodeEditor()
+    highlighter = ScriptSyntaxHighlighter(editor.document())
+    code = ST.benchmark_script(lines)
+    
+    start = time.perf_counter()
+    editor.insertPlainText(code)
+    elapsed = time.perf_counter() - start
+    
+    editor.deleteLater()
+    return {'lines': editor.document().blockCount(), 'ms': elapsed * 1000.0}
 
 class LineNumberArea(QtWidgets.QWidget):
     def __init__(self, editor):
@@ -962,6 +920,12 @@ class ScriptManagerWidget(QtWidgets.QWidget):
         self.button_id_label.setStyleSheet("color: #4ca3fe; background: transparent; font-weight: bold; border: none;")
         self.title_label_layout.addWidget(self.button_id_label)
         
+        self.script_cache_label = QtWidgets.QLabel("")
+        self.script_cache_label.setStyleSheet("color: #888888; background: transparent; border: none;")
+        self.script_cache_label.setToolTip("Script runs served from the compiled script cache")
+        self.title_label_layout.addSpacing(6)
+        self.title_label_layout.addWidget(self.script_cache_label)
+        
         title_layout.addSpacing(4)
         #title_layout.addLayout(self.title_label_layout)
         #--------------------------------------------------------------------------------------------------------------------------
@@ -1194,6 +1158,7 @@ class ScriptManagerWidget(QtWidgets.QWidget):
         # Make sure to update the button's script data
         button.script_data = script_data
         self.button_id_label.setText(f"[{self.picker_button.unique_id}]")
+        self.update_script_cache_label()
         self.position_window()
 
     def _find_parent_picker(self):
@@ -1205,6 +1170,13 @@ class ScriptManagerWidget(QtWidgets.QWidget):
             parent = parent.parent()
         return None
 
+    def update_script_cache_label(self):
+        stats = self.picker_button.script_cache_stats() if self.picker_button else None
+        if stats and stats['runs']:
+            self.script_cache_label.setText(f"cache {stats['hits']}/{stats['runs']} hits")
+        else:
+            self.script_cache_label.setText("")
+
     def position_window(self):
         if self.picker_button:
             button_geometry = self.picker_button.geometry()
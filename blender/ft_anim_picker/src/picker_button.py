@@ -8,6 +8,7 @@ from PySide6.QtGui import QColor, QAction
 from PySide6.QtCore import QTimer, QPropertyAnimation, QEasingCurve, Signal
 
 import re
+import hashlib
 
 from . import utils as UT
 from . import custom_line_edit as CLE
@@ -18,6 +19,16 @@ from . import tool_functions as TF
 from . import custom_dialog as CD
 from . import blender_main as MAIN
 from . import custom_color_picker as CCP
+from . import blender_selection as BS
+from . import scene_events as SE
+from . import namespace_resolver as NR
+from . import pose_blend as PBL
+from . import pose_library as PL
+from . import script_context as SC
+from . import script_tokens as ST
+from . import button_profiler as BPF
+from . import script_queue as SQ
+from . import object_cache as OC
 from . utils import undoable
 
 from .pb_selection_manager import SelectionManagerWidget
@@ -73,7 +84,7 @@ class ButtonClipboard:
                 # Add pose-specific data if this is a pose button
                 if button.mode == 'pose':
                     button_data['thumbnail_path'] = getattr(button, 'thumbnail_path', '')
-                    button_data['pose_data'] = self._safe_copy_dict(getattr(button, 'pose_data', {}))
+                    button_data['pose_data'] = button.pose_document_data()  # Copy the pose reference
                 
                 self.copied_buttons.append(button_data)
             
@@ -165,9 +176,15 @@ class PickerButton(QtWidgets.QWidget):
         self.edit_mode = False
         self.update_cursor()
         self.assigned_objects = []  
+        self._selection_cache = NR.selection_cache_for(unique_id)  # Resolved selection sets keyed by (kind, namespace)
+        self._pose_blend = None  # Active PoseBlendSession while blending
+        self._blend_drag_origin = None
 
         self.mode = 'select'  # 'select', 'script', or 'pose'
         self.script_data = {}  # Store script data
+        self._script_cache = {}  # (code hash, namespace, script type) -> processed/compiled script, see _cached_script
+        self._script_runs = 0
+        self._script_cache_hits = 0
         self.pose_data = {}  # Store pose data
 
         # Rename mode properties
@@ -578,6 +595,9 @@ class PickerButton(QtWidgets.QWidget):
         else:
             if self.text_pixmap and not self.text_pixmap.isNull():
                 painter.drawPixmap(0, 0, self.text_pixmap)
+        
+        # Run time badge (script/pose profiler)
+        BPF.draw_badge(painter, self, rect)
     #---------------------------------------------------------------------------------------
     def _create_button_path(self, rect, radii, zoom_factor):
         """Create button path based on shape type"""
@@ -1571,6 +1591,19 @@ class PickerButton(QtWidgets.QWidget):
         
         info_layout.addStretch()
         
+        # Selection cache status (debug mode only)
+        if UT.DEBUG and self.mode == 'select':
+            if self._selection_cache:
+                cache_text = ' | '.join(
+                    f"{kind}: {entry['resolve_ms']:.2f}ms, {entry['hits']} hits"
+                    for (kind, _), entry in self._selection_cache.items()
+                )
+            else:
+                cache_text = "not cached"
+            cache_label = QtWidgets.QLabel(f"[{cache_text}]")
+            cache_label.setStyleSheet("color: rgba(255, 255, 255, 0.4); font-size: 9px; border:none;background-color: transparent;")
+            info_layout.addWidget(cache_label)
+        
         # Thumbnail info for pose mode
         if self.mode == 'pose':
             if self.thumbnail_path:
@@ -1700,6 +1733,55 @@ class PickerButton(QtWidgets.QWidget):
         # Apply regular selection (not counterpart)
         canvas.apply_final_selection(add_to_selection=shift_held, ctrl_held=False)
 
+    #---------------------------------------------------------------------------------------
+    # SELECTION CACHE
+    #---------------------------------------------------------------------------------------
+    def _assigned_objects_signature(self):
+        """Cheap signature of assigned_objects, used to notice edits to the assignment"""
+        return tuple((obj_data.get('name'), obj_data.get('armature'), obj_data.get('is_bone', False)) 
+                     for obj_data in self.assigned_objects)
+
+    def get_cached_selection(self, kind, namespace):
+        """Return the cached resolved items for (kind, namespace) or None if it is stale.
+
+        kind is 'objects' or 'counterparts'. An entry is valid while the scene generation
+        (see scene_events) and the assigned objects are unchanged since it was stored.
+        """
+        entry = self._selection_cache.get((kind, namespace))
+        if entry is None:
+            return None
+        
+        if (not SE.SceneEvents.get_instance().is_current(entry['generation']) or 
+            entry['signature'] != self._assigned_objects_signature()):
+            del self._selection_cache[(kind, namespace)]
+            return None
+        
+        entry['hits'] += 1
+        if UT.DEBUG:
+            self._tooltip_needs_update = True
+        return entry
+
+    def store_selection_cache(self, kind, namespace, generation, resolved_items, missing, resolve_ms, missing_items=()):
+        """Store freshly resolved items ({'bones': [...], 'objects': [...]}) for (kind, namespace).
+
+        missing_items holds the (item data, report kind) of each miss, so cache hits can report them too.
+        """
+        self._selection_cache[(kind, namespace)] = {
+            'generation': generation,
+            'signature': self._assigned_objects_signature(),
+            'bones': list(resolved_items['bones']),
+            'objects': list(resolved_items['objects']),
+            'missing': set(missing),
+            'missing_items': list(missing_items),
+            'resolve_ms': resolve_ms,
+            'hits': 0,
+        }
+        if UT.DEBUG:
+            self._tooltip_needs_update = True
+
+    def invalidate_selection_cache(self):
+        self._selection_cache.clear()
+
     def update_visual_state(self, selected):
         """Update only the visual selection state"""
         if self.is_selected != selected:
@@ -2021,6 +2103,18 @@ class PickerButton(QtWidgets.QWidget):
                 
                 remove_pose_action = menu.addAction(QtGui.QIcon(UT.get_icon('subtract.png')),"Remove Pose")
                 remove_pose_action.triggered.connect(self.remove_pose_for_selected_buttons)
+                
+                key_pose_action = menu.addAction(QtGui.QIcon(UT.get_icon('pose_01.png')),"Apply Pose + Key")
+                key_pose_action.triggered.connect(lambda: self.apply_pose(key=True))
+                key_pose_action.setEnabled(self.has_pose())
+                
+                key_range_action = menu.addAction(QtGui.QIcon(UT.get_icon('pose_01.png')),"Key Pose on Frames...")
+                key_range_action.triggered.connect(self.show_key_pose_range_dialog)
+                key_range_action.setEnabled(self.has_pose())
+                
+                blend_pose_action = menu.addAction(QtGui.QIcon(UT.get_icon('pose_01.png')),"Blend Pose")
+                blend_pose_action.triggered.connect(self.show_pose_blend_slider)
+                blend_pose_action.setEnabled(self.has_pose())
 
                 thumbnail_menu = QtWidgets.QMenu("Thumbnail")
                 thumbnail_menu.setWindowFlags(thumbnail_menu.windowFlags() | QtCore.Qt.FramelessWindowHint | QtCore.Qt.NoDropShadowWindowHint)
@@ -2712,7 +2806,7 @@ class PickerButton(QtWidgets.QWidget):
     def remove_pose_for_selected_buttons(self):
         """Remove the pose data for selected buttons"""
         for button in self.parent().get_selected_buttons():
-            if not button.pose_data:
+            if not button.has_pose():
                 # Use custom dialog instead of QMessageBox
                 dialog = CD.CustomDialog(self, title="No Pose", size=(200, 80), info_box=True)
                 message_label = QtWidgets.QLabel("There is no pose to remove.")
@@ -3706,65 +3800,142 @@ class PickerButton(QtWidgets.QWidget):
         dialog.add_button_box()
         dialog.exec_()
     #---------------------------------------------------------------------------------------
+    # POSE DATA
+    #---------------------------------------------------------------------------------------
+    @property
+    def pose_data(self):
+        """Stored pose, loaded from the pose library on first use"""
+        if self._pose_ref is not None:
+            return PL.PoseLibrary.get_instance().load(self._pose_ref) or {}
+        return self._pose_data
+
+    @pose_data.setter
+    def pose_data(self, value):
+        # Accepts either pose data or a pose library reference from the picker document
+        if PL.is_pose_ref(value):
+            self._pose_ref = dict(value)
+            self._pose_data = {}
+        else:
+            self._pose_ref = None
+            self._pose_data = value or {}
+
+    def has_pose(self):
+        """True if the button has a pose (without loading it)"""
+        return bool(self._pose_ref or self._pose_data)
+
+    def pose_document_data(self):
+        """Pose data as stored in the picker document: a pose library reference, or {} without a pose"""
+        if self._pose_ref is None and self._pose_data:
+            try:
+                self._pose_ref = PL.PoseLibrary.get_instance().store(self._pose_data)
+                self._pose_data = {}
+            except OSError as e:
+                print(f"Could not store pose in library, keeping it in the picker data: {e}")
+                return self._pose_data
+        return dict(self._pose_ref) if self._pose_ref else {}
+    #---------------------------------------------------------------------------------------
     # POSE APPLICATION
     #---------------------------------------------------------------------------------------
-    def apply_pose(self):
-        """Apply the stored pose to the assigned objects - OPTIMIZED VERSION WITH FULL NAMESPACE INTEGRATION"""
+    def apply_pose(self, key=False, frames=None):
+        """Apply the stored pose to the assigned objects - OPTIMIZED VERSION WITH FULL NAMESPACE INTEGRATION
+        
+        With key=True the channels the pose wrote are also keyed, at the current frame or at each of
+        frames, in the same undo step. Keying at other frames does not change the current frame.
+        """
         if not self._validate_pose_data():
             return
         
         pose_data = self.pose_data.get("default", {})
         current_namespace = self._get_current_namespace_from_window()
         
-        # Pre-build optimized object lookup cache with namespace support
-        object_cache = self._build_namespace_object_cache(current_namespace)
+        # Object lookup cache with namespace support (persistent, see object_cache)
+        object_cache = OC.ObjectCache.get_instance().object_cache(current_namespace)
         
         successfully_posed_objects = []
         posed_bones_by_armature = {}
+        key_targets = []  # (object or pose bone, attr values written, fcurve group)
         
         try:
-            for pose_key, attr_values in pose_data.items():
-                #print(f"Processing pose entry: '{pose_key}'")
+            # Timed (and optionally cProfiled) per button, see button_profiler
+            with BPF.measure(self, 'pose'):
+                for pose_key, attr_values in pose_data.items():
+                    #print(f"Processing pose entry: '{pose_key}'")
                 
-                if isinstance(attr_values, dict) and attr_values.get('is_armature_pose', False):
-                    # Handle armature pose with namespace priority
-                    armature_obj = self._resolve_armature_with_namespace_cached(
-                        pose_key, current_namespace, attr_values, object_cache
-                    )
+                    if isinstance(attr_values, dict) and attr_values.get('is_armature_pose', False):
+                        # Handle armature pose with namespace priority
+                        armature_obj = self._resolve_armature_with_namespace_cached(
+                            pose_key, current_namespace, attr_values, object_cache
+                        )
                     
-                    if armature_obj:
-                        successfully_posed_objects.append(armature_obj)
+                        if armature_obj:
+                            successfully_posed_objects.append(armature_obj)
                         
-                        # Apply armature-level transforms
-                        armature_attrs = {k: v for k, v in attr_values.items() 
-                                        if k not in ['pose_bones', 'source_armature', 'is_armature_pose']}
-                        if armature_attrs:
-                            self._apply_object_attributes(armature_obj, armature_attrs)
+                            # Apply armature-level transforms
+                            armature_attrs = {k: v for k, v in attr_values.items() 
+                                            if k not in ['pose_bones', 'source_armature', 'is_armature_pose']}
+                            if armature_attrs:
+                                self._apply_object_attributes(armature_obj, armature_attrs)
+                                key_targets.append((armature_obj, armature_attrs, None))
                         
-                        # Apply bone poses with namespace priority
-                        if 'pose_bones' in attr_values:
-                            posed_bones = self._apply_bones_with_namespace_priority_cached(
-                                armature_obj, attr_values['pose_bones'], current_namespace
-                            )
-                            if posed_bones:
-                                posed_bones_by_armature[armature_obj.name] = posed_bones
-                    else:
-                        print(f"Warning: Could not find armature for pose key '{pose_key}'")
-                else:
-                    # Handle regular object pose with namespace priority
-                    obj = self._resolve_object_with_namespace_cached(pose_key, current_namespace, object_cache)
-                    if obj:
-                        successfully_posed_objects.append(obj)
-                        self._apply_object_attributes(obj, attr_values)
+                            # Apply bone poses with namespace priority
+                            if 'pose_bones' in attr_values:
+                                posed_bones = self._apply_bones_with_namespace_priority_cached(
+                                    armature_obj, attr_values['pose_bones'], current_namespace
+                                )
+                                if posed_bones:
+                                    posed_bones_by_armature[armature_obj.name] = posed_bones
+                                    key_targets.extend((bone, attr_values['pose_bones'][bone.name], bone.name)
+                                                       for bone in posed_bones)
+                        else:
+                            print(f"Warning: Could not find armature for pose key '{pose_key}'")
                     else:
-                        print(f"Warning: Could not find object '{pose_key}'")
+                        # Handle regular object pose with namespace priority
+                        obj = self._resolve_object_with_namespace_cached(pose_key, current_namespace, object_cache)
+                        if obj:
+                            successfully_posed_objects.append(obj)
+                            self._apply_object_attributes(obj, attr_values)
+                            key_targets.append((obj, attr_values, None))
+                        else:
+                            print(f"Warning: Could not find object '{pose_key}'")
             
-            # Select the posed objects and bones with namespace priority
-            self._select_posed_objects_and_bones_with_namespace(successfully_posed_objects, posed_bones_by_armature)
+                undo_message = "Apply Pose"
+                if key:
+                    keyed = self._key_pose_targets(key_targets, frames)
+                    undo_message = "Key Pose Range" if frames else "Apply and Key Pose"
+                    if UT.DEBUG:
+                        print(f"Keyed {keyed} channels")
+            
+                # Select the posed objects and bones with namespace priority (pushes the undo step)
+                self._select_posed_objects_and_bones_with_namespace(successfully_posed_objects, posed_bones_by_armature,
+                                                                    undo_message=undo_message)
             
         except Exception as e:
             self._handle_apply_error(e, successfully_posed_objects, posed_bones_by_armature)
 
+    def key_pose_range(self, frames):
+        """Apply the stored pose and key it at each of frames, without changing the current frame"""
+        if frames:
+            self.apply_pose(key=True, frames=frames)
+
+    def show_key_pose_range_dialog(self):
+        """Ask for a frame list (defaults to the scene frame range) and key the pose on those frames"""
+        scene = bpy.context.scene
+        
+        dialog = CD.CustomDialog(self, title="Key Pose Range", size=(240, 130))
+        dialog.add_widget(QtWidgets.QLabel("Frames (e.g. 1, 12, 20-40, 50-100x10):"))
+        frames_edit = QtWidgets.QLineEdit(f"{scene.frame_start}-{scene.frame_end}")
+        dialog.add_widget(frames_edit)
+        dialog.add_button_box()
+        
+        if dialog.exec_() != QtWidgets.QDialog.Accepted:
+            return
+        try:
+            frames = UT.parse_frame_list(frames_edit.text())
+        except ValueError as e:
+            print(f"Invalid frame list '{frames_edit.text()}': {e}")
+            return
+        self.key_pose_range(frames)
+
     def apply_mirrored_pose(self):
         """Apply the stored pose to mirrored objects - OPTIMIZED VERSION WITH NAMESPACE INTEGRATION"""
         if not self._validate_pose_data():
@@ -3773,9 +3944,9 @@ class PickerButton(QtWidgets.QWidget):
         pose_data = self.pose_data.get("default", {})
         current_namespace = self._get_current_namespace_from_window()
         
-        # Pre-build optimized caches with namespace support
-        object_cache = self._build_namespace_object_cache(current_namespace)
-        mirror_cache = self._build_namespace_mirror_cache(object_cache, current_namespace)
+        # Object and mirror caches with namespace support (persistent, see object_cache)
+        object_cache = OC.ObjectCache.get_instance().object_cache(current_namespace)
+        mirror_cache = OC.ObjectCache.get_instance().mirror_cache(current_namespace)
         
         successfully_posed_objects = []
         posed_bones_by_armature = {}
@@ -3817,6 +3988,84 @@ class PickerButton(QtWidgets.QWidget):
         except Exception as e:
             self._handle_apply_error(e, successfully_posed_objects, posed_bones_by_armature)
 
+    #---------------------------------------------------------------------------------------
+    # POSE BLENDING
+    #---------------------------------------------------------------------------------------
+    def is_pose_blending(self):
+        return self._pose_blend is not None
+
+    def start_pose_blend(self):
+        """Start blending from the current pose towards the stored pose. Returns True if blending"""
+        if self._pose_blend is not None:
+            return True
+        if not self._validate_pose_data():
+            return False
+        
+        try:
+            bone_targets, object_targets = self._collect_pose_blend_targets()
+            session = PBL.PoseBlendSession(bone_targets, object_targets)
+        except Exception as e:
+            print(f"Error starting pose blend: {e}")
+            return False
+        
+        if not len(session):
+            return False
+        self._pose_blend = session
+        return True
+
+    def update_pose_blend(self, weight):
+        """Preview the blend at weight (0 = pose at blend start, 1 = stored pose)"""
+        if self._pose_blend is None:
+            return
+        try:
+            self._pose_blend.preview(weight)
+        except Exception as e:
+            print(f"Error blending pose: {e}")
+
+    def finish_pose_blend(self):
+        """Commit the current blend as one undo step"""
+        session = self._pose_blend
+        self._pose_blend = None
+        if session is None:
+            return
+        try:
+            if session.weight > 0.0:
+                session.commit()
+            else:
+                session.cancel()
+        except Exception as e:
+            print(f"Error committing pose blend: {e}")
+
+    def show_pose_blend_slider(self):
+        if not hasattr(self, 'pose_blend_slider'):
+            self.pose_blend_slider = PBL.PoseBlendSlider(self)
+        self.pose_blend_slider.show_at(self.mapToGlobal(self.rect().bottomLeft()))
+
+    def _collect_pose_blend_targets(self):
+        """Resolve the stored pose like apply_pose, without applying it.
+
+        Returns (bone targets {armature: {bone name: attr values}}, object targets [(object, attr values)]).
+        """
+        pose_data = self.pose_data.get("default", {})
+        current_namespace = self._get_current_namespace_from_window()
+        object_cache = OC.ObjectCache.get_instance().object_cache(current_namespace)
+        
+        bone_targets = {}
+        object_targets = []
+        for pose_key, attr_values in pose_data.items():
+            if isinstance(attr_values, dict) and attr_values.get('is_armature_pose', False):
+                armature_obj = self._resolve_armature_with_namespace_cached(
+                    pose_key, current_namespace, attr_values, object_cache
+                )
+                if armature_obj and armature_obj.pose and 'pose_bones' in attr_values:
+                    bone_targets.setdefault(armature_obj, {}).update(attr_values['pose_bones'])
+            else:
+                obj = self._resolve_object_with_namespace_cached(pose_key, current_namespace, object_cache)
+                if obj:
+                    object_targets.append((obj, attr_values))
+        
+        return bone_targets, object_targets
+
     def _validate_pose_data(self):
         """Validate that pose data exists and is not empty"""
         if not self.pose_data or not self.pose_data.get("default", {}):
@@ -3835,119 +4084,6 @@ class PickerButton(QtWidgets.QWidget):
             return namespace if namespace != 'None' else None
         return None
 
-    def _build_namespace_object_cache(self, current_namespace):
-        """Build optimized object lookup cache with comprehensive namespace support"""
-        import bpy
-        with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-            cache = {
-                'exact': {},           # Exact name matches
-                'namespace_prefix': {},  # Objects with namespace prefixes
-                'namespace_suffix': {},  # Objects with namespace suffixes
-                'partial': {},         # Partial matches for fallback
-                'by_type': {'ARMATURE': [], 'MESH': [], 'OTHER': []}  # Objects by type
-            }
-            
-            separators = ['_', '.']
-            
-            for obj in bpy.data.objects:
-                name = obj.name
-                
-                # Store exact name
-                cache['exact'][name] = obj
-                
-                # Store by type for faster armature lookups
-                obj_type = 'ARMATURE' if obj.type == 'ARMATURE' else ('MESH' if obj.type == 'MESH' else 'OTHER')
-                cache['by_type'][obj_type].append(obj)
-                
-                # If we have a namespace, build namespace-aware cache
-                if current_namespace:
-                    for sep in separators:
-                        # Check for namespace prefix patterns
-                        prefix_pattern = f"{current_namespace}{sep}"
-                        if name.startswith(prefix_pattern):
-                            base_name = name[len(prefix_pattern):]
-                            cache['namespace_prefix'][base_name] = obj
-                        
-                        # Check for namespace suffix patterns
-                        suffix_pattern = f"{sep}{current_namespace}"
-                        if name.endswith(suffix_pattern):
-                            base_name = name[:-len(suffix_pattern)]
-                            cache['namespace_suffix'][base_name] = obj
-                    
-                    # Handle case where object name equals namespace
-                    if name == current_namespace:
-                        cache['namespace_prefix'][current_namespace] = obj
-                        cache['namespace_suffix'][current_namespace] = obj
-                
-                # Build partial match cache for fallback
-                name_parts = name.lower().split('_') + name.lower().split('.')
-                for part in name_parts:
-                    if part and len(part) > 2:  # Only meaningful parts
-                        if part not in cache['partial']:
-                            cache['partial'][part] = []
-                        cache['partial'][part].append(obj)
-            
-            return cache
-
-    def _build_namespace_mirror_cache(self, object_cache, current_namespace):
-        """Build mirror object lookup cache with namespace awareness"""
-        mirror_cache = {}
-        
-        # Enhanced mirror patterns with both suffix and prefix support
-        mirror_patterns = [
-            # Suffix patterns
-            ('_L', '_R'), ('_l', '_r'), ('.L', '.R'), ('.l', '.r'),
-            ('Left', 'Right'), ('left', 'right'),
-            ('_Left', '_Right'), ('_left', '_right'),
-            ('.Left', '.Right'), ('.left', '.right'),
-            # Prefix patterns
-            ('L_', 'R_'), ('l_', 'r_'), ('L.', 'R.'), ('l.', 'r.'),
-            ('Left_', 'Right_'), ('left_', 'right_'),
-            ('Left.', 'Right.'), ('left.', 'right.')
-        ]
-        
-        # Check all exact matches first (highest priority)
-        for obj_name, obj in object_cache['exact'].items():
-            for left_pat, right_pat in mirror_patterns:
-                mirror_name = None
-                
-                # Check suffix patterns
-                if obj_name.endswith(left_pat):
-                    mirror_name = obj_name[:-len(left_pat)] + right_pat
-                elif obj_name.endswith(right_pat):
-                    mirror_name = obj_name[:-len(right_pat)] + left_pat
-                # Check prefix patterns
-                elif obj_name.startswith(left_pat):
-                    mirror_name = right_pat + obj_name[len(left_pat):]
-                elif obj_name.startswith(right_pat):
-                    mirror_name = left_pat + obj_name[len(right_pat):]
-                # Check anywhere in name (fallback)
-                elif left_pat in obj_name:
-                    mirror_name = obj_name.replace(left_pat, right_pat)
-                elif right_pat in obj_name:
-                    mirror_name = obj_name.replace(right_pat, left_pat)
-                
-                if mirror_name and mirror_name in object_cache['exact']:
-                    mirror_cache[obj_name] = object_cache['exact'][mirror_name]
-                    break
-        
-        # Also check namespace-aware matches
-        if current_namespace:
-            for base_name, obj in object_cache['namespace_prefix'].items():
-                for left_pat, right_pat in mirror_patterns:
-                    if left_pat in base_name:
-                        mirror_base = base_name.replace(left_pat, right_pat)
-                        if mirror_base in object_cache['namespace_prefix']:
-                            mirror_cache[base_name] = object_cache['namespace_prefix'][mirror_base]
-                            break
-                    elif right_pat in base_name:
-                        mirror_base = base_name.replace(right_pat, left_pat)
-                        if mirror_base in object_cache['namespace_prefix']:
-                            mirror_cache[base_name] = object_cache['namespace_prefix'][mirror_base]
-                            break
-        
-        return mirror_cache
-
     def _resolve_object_with_namespace_cached(self, obj_name, current_namespace, object_cache):
         """Find object by name using cache, with namespace fallback - ENHANCED VERSION"""
         # Priority 1: Try with current namespace if available
@@ -4076,49 +4212,23 @@ class PickerButton(QtWidgets.QWidget):
                 if mirrored_name and mirrored_name in armature_obj.pose.bones:
                     bone_mirror_cache[bone.name] = armature_obj.pose.bones[mirrored_name]
             
-            # Context management (optimized)
-            original_mode = bpy.context.mode
-            original_active = bpy.context.view_layer.objects.active
-            context_changed = False
-            
-            try:
-                if bpy.context.view_layer.objects.active != armature_obj:
-                    bpy.context.view_layer.objects.active = armature_obj
-                    context_changed = True
+            # Pose bone transforms are plain data, so no active object or mode change is needed here
+            for bone_name, bone_attr_values in bones_data.items():
+                mirrored_bone = bone_mirror_cache.get(bone_name)
                 
-                if bpy.context.mode != 'POSE':
-                    bpy.ops.object.mode_set(mode='POSE')
-                    context_changed = True
-                
-                for bone_name, bone_attr_values in bones_data.items():
-                    mirrored_bone = bone_mirror_cache.get(bone_name)
-                    
-                    if mirrored_bone:
-                        try:
-                            mirrored_attrs = self._mirror_transform_attributes(bone_attr_values)
-                            self._apply_transform_data(mirrored_bone, mirrored_attrs)
-                            self._apply_custom_properties(mirrored_bone, bone_attr_values, exclude_keys=[
-                                'location', 'rotation_quaternion', 'rotation_axis_angle', 
-                                'rotation_euler', 'scale'
-                            ])
-                            posed_bones.append(mirrored_bone)
-                        except Exception as e:
-                            print(f"Error applying mirrored pose to bone {mirrored_bone.name}: {e}")
-                    else:
-                        print(f"Warning: No mirrored bone found for '{bone_name}' in armature '{armature_obj.name}'")
-            
-            finally:
-                if context_changed:
+                if mirrored_bone:
                     try:
-                        if original_active and original_active != bpy.context.view_layer.objects.active:
-                            bpy.context.view_layer.objects.active = original_active
-                        if original_mode != 'POSE' and bpy.context.mode == 'POSE':
-                            if 'EDIT' in original_mode:
-                                bpy.ops.object.mode_set(mode='EDIT')
-                            else:
-                                bpy.ops.object.mode_set(mode='OBJECT')
+                        mirrored_attrs = self._mirror_transform_attributes(bone_attr_values)
+                        self._apply_transform_data(mirrored_bone, mirrored_attrs)
+                        self._apply_custom_properties(mirrored_bone, bone_attr_values, exclude_keys=[
+                            'location', 'rotation_quaternion', 'rotation_axis_angle', 
+                            'rotation_euler', 'scale'
+                        ])
+                        posed_bones.append(mirrored_bone)
                     except Exception as e:
-                        print(f"Error restoring context: {e}")
+                        print(f"Error applying mirrored pose to bone {mirrored_bone.name}: {e}")
+                else:
+                    print(f"Warning: No mirrored bone found for '{bone_name}' in armature '{armature_obj.name}'")
             
             return posed_bones
 
@@ -4157,13 +4267,15 @@ class PickerButton(QtWidgets.QWidget):
         
         return None
 
-    def _select_posed_objects_and_bones_with_namespace(self, successfully_posed_objects, posed_bones_by_armature, is_mirrored=False):
+    def _select_posed_objects_and_bones_with_namespace(self, successfully_posed_objects, posed_bones_by_armature, is_mirrored=False,
+                                                       undo_message="Apply Pose"):
         """Select the successfully posed objects and their bones in Blender with namespace priority
         
         Args:
             successfully_posed_objects: List of objects that were successfully posed
             posed_bones_by_armature: Dictionary of armature names to posed bones
             is_mirrored: True if this is a mirrored pose application, False for regular poses
+            undo_message: Name of the undo step pushed for the pose and the selection
         """
         if not successfully_posed_objects:
             return
@@ -4177,51 +4289,36 @@ class PickerButton(QtWidgets.QWidget):
                 current_namespace = None
         
         try:
-            # Deselect all objects and select posed objects
-            bpy.ops.object.select_all(action='DESELECT')
-            for obj in successfully_posed_objects:
-                obj.select_set(True)
-            
-            # Handle bone posing and object posing separately
             if posed_bones_by_armature:
                 # BONE POSING: Find the target armature (namespace priority)
-                target_armature = None
-                
                 if current_namespace and current_namespace in posed_bones_by_armature:
                     target_armature = current_namespace
                 else:
                     # Use the first available armature
                     target_armature = next(iter(posed_bones_by_armature.keys()))
                 
-                if target_armature and target_armature in bpy.data.objects:
+                armature_bones = {}
+                active_bone = None
+                if target_armature in bpy.data.objects:
                     active_obj = bpy.data.objects[target_armature]
-                    bpy.context.view_layer.objects.active = active_obj
-                    
-                    with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-                        bpy.ops.object.mode_set(mode='POSE')
-                        bpy.ops.pose.select_all(action='DESELECT')
-                        
-                        # Select the posed bones in the target armature
-                        if target_armature in posed_bones_by_armature:
-                            posed_bones = posed_bones_by_armature[target_armature]
-                            for bone in posed_bones:
-                                bone.bone.select = True
-                            bpy.context.object.data.bones.active = bpy.context.object.data.bones[posed_bones[-1].name]
-                        
-                        # Stay in pose mode for bone posing
+                    posed_bones = posed_bones_by_armature[target_armature]
+                    armature_bones[active_obj] = [bone.name for bone in posed_bones]
+                    if posed_bones:
+                        active_bone = (active_obj, posed_bones[-1].name)
+                
+                # Other posed objects stay selected alongside the posed armature (stays in pose mode)
+                other_objects = [obj for obj in successfully_posed_objects if obj not in armature_bones]
+                BS.apply_selection(objects=other_objects, bones=armature_bones, active_bone=active_bone,
+                                   undo_message=undo_message)
             else:
                 # OBJECT POSING: Set the last selected object as active
                 # For regular poses: this is the last original object
                 # For mirrored poses: this is the last mirrored object
-                last_selected_object = successfully_posed_objects[-1]
-                bpy.context.view_layer.objects.active = last_selected_object
+                BS.apply_selection(objects=successfully_posed_objects, active_object=successfully_posed_objects[-1],
+                                   undo_message=undo_message)
                                 
         except Exception as e:
             print(f"Error selecting posed objects and bones: {e}")
-            try:
-                bpy.ops.object.mode_set(mode='OBJECT')
-            except:
-                pass
 
     def _apply_object_attributes(self, obj, attr_values):
         """Apply transform and custom properties to an object"""
@@ -4259,6 +4356,59 @@ class PickerButton(QtWidgets.QWidget):
                     target_type = "bone" if hasattr(target, 'bone') else "object"
                     print(f"Error setting {target_type} custom property {attr}: {e}")
 
+    def _pose_data_paths(self, target, attr_values):
+        """Data paths _apply_transform_data and _apply_custom_properties write for attr_values on target"""
+        data_paths = []
+        if 'location' in attr_values and len(attr_values['location']) == 3:
+            data_paths.append('location')
+        
+        rotation_mode = getattr(target, 'rotation_mode', None)
+        if rotation_mode == 'QUATERNION':
+            rotation_path = 'rotation_quaternion'
+        elif rotation_mode == 'AXIS_ANGLE':
+            rotation_path = 'rotation_axis_angle'
+        else:
+            rotation_path = 'rotation_euler'
+        if rotation_path in attr_values:
+            data_paths.append(rotation_path)
+        
+        if 'scale' in attr_values and len(attr_values['scale']) == 3:
+            data_paths.append('scale')
+        
+        for attr, value in attr_values.items():
+            if attr in ('location', 'rotation_quaternion', 'rotation_axis_angle', 'rotation_euler', 'scale',
+                        'pose_bones', 'source_armature', 'is_armature_pose'):
+                continue
+            if isinstance(value, (bool, int, float)):
+                data_paths.append(f'["{attr}"]')
+        return data_paths
+
+    def _key_pose_targets(self, key_targets, frames=None):
+        """Key the channels a pose wrote at frames (default: the current frame). Returns the number of keys
+        
+        Each transform channel is keyed with one keyframe_insert for all of its components. The
+        values were just written, so keying at other frames needs no frame change or rig evaluation.
+        
+        Args:
+            key_targets: List of (object or pose bone, attr values written, fcurve group name or None)
+            frames: Frames to key at
+        """
+        keyed = 0
+        with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
+            frames = frames or [bpy.context.scene.frame_current]
+            for target, attr_values, group in key_targets:
+                for data_path in self._pose_data_paths(target, attr_values):
+                    try:
+                        for frame in frames:
+                            if group:
+                                target.keyframe_insert(data_path, frame=frame, group=group)
+                            else:
+                                target.keyframe_insert(data_path, frame=frame)
+                            keyed += 1
+                    except (TypeError, RuntimeError) as e:
+                        print(f"Error keying {data_path} on {target.name}: {e}")
+        return keyed
+
     def _mirror_transform_attributes(self, attr_values):
         """Mirror transform attributes for X-axis symmetry"""
         mirrored_attrs = attr_values.copy()
@@ -4332,26 +4482,62 @@ class PickerButton(QtWidgets.QWidget):
             return
         
         try:
-            # Get namespace info
-            current_ns, ns_prefix = self._get_namespace_info()
+            # Timed (and optionally cProfiled) per button, see button_profiler
+            with BPF.measure(self, 'script'):
+                # Get namespace info
+                current_ns, ns_prefix = self._get_namespace_info()
             
-            # Process the code (handle tokens and imports)
-            modified_code = self._process_script_code(code, current_ns)
+                # Process and compile the code (handle tokens and imports), cached per code/namespace
+                script = self._cached_script(code, current_ns, 'python')
             
-            # Set up execution environment
-            global_vars = self._create_execution_environment(current_ns, ns_prefix)
+                # Set up execution environment
+                global_vars = self._create_execution_environment(current_ns, ns_prefix)
             
-            # Execute with proper Blender context
-            #print(f"Executing script for button: {self.unique_id}")
-            with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-                exec(modified_code, global_vars, global_vars)
-            #print("Script executed successfully")
+                # Execute with proper Blender context
+                #print(f"Executing script for button: {self.unique_id}")
+                # Tool functions find this button through the script context, appearance changes are saved once
+                with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]), SC.script_button(self), \
+                        TF.appearance_batch():
+                    exec(script['code'], global_vars, global_vars)
+                #print("Script executed successfully")
             
         except Exception as e:
             self._show_script_error(str(e))
         finally:
             self._update_blender_ui()
 
+    MAX_CACHED_SCRIPTS = 4  # Per button: one entry per namespace the script was run with
+
+    def _cached_script(self, code, current_ns, script_type):
+        """Processed source and compiled code object ('code', None for MEL) of a script.
+
+        Token processing and compile() run once per (code hash, namespace, script type); later
+        runs reuse the entry and count as cache hits.
+        """
+        key = (hashlib.sha1(code.encode('utf-8')).hexdigest(), current_ns, script_type)
+        self._script_runs += 1
+        
+        script = self._script_cache.get(key)
+        if script is not None:
+            script['hits'] += 1
+            self._script_cache_hits += 1
+            return script
+        
+        modified_code = self._process_script_code(code, current_ns)
+        compiled = None
+        if script_type == 'python':
+            compiled = compile(modified_code, f"<picker button {self.unique_id}>", 'exec')
+        
+        script = {'source': modified_code, 'code': compiled, 'hits': 0}
+        self._script_cache[key] = script
+        while len(self._script_cache) > self.MAX_CACHED_SCRIPTS:
+            self._script_cache.pop(next(iter(self._script_cache)))
+        return script
+
+    def script_cache_stats(self):
+        """Script cache counters: cached entries, runs and cache hits"""
+        return {'entries': len(self._script_cache), 'runs': self._script_runs, 'hits': self._script_cache_hits}
+
     def _get_namespace_info(self):
         """Get current namespace and prefix from main window"""
         main_window = self.window()
@@ -4365,107 +4551,9 @@ class PickerButton(QtWidgets.QWidget):
         return current_ns, ns_prefix
     
     def _process_script_code(self, code, current_ns):
-        """Process script code to handle tokens and imports"""
-        modified_code = code
-        
-        # Remove tooltip functions (already handled in script manager)
-        patterns_to_remove = [
-            r'@TF\.tool_tip\s*\(\s*["\'](.+?)["\']\s*\)',
-            r'@tool_tip\s*\(\s*["\'](.+?)["\']\s*\)',
-            r'@tt\s*\(\s*["\'](.+?)["\']\s*\)',
-        ]
-        for pattern in patterns_to_remove:
-            modified_code = re.sub(pattern, '', modified_code, flags=re.IGNORECASE)
-        #--------------------------------------------------------------------------------------------------------
-        # Replace namespace tokens with new logic
-        def replace_ns_token(match):
-            full_match = match.group(0)  # The entire @ns.qualifier
-            qualifier = match.group(1)   # Just the qualifier part
-            
-            if current_ns and current_ns != 'None':
-                # If there's a namespace, replace entire @ns.qualifier with just the namespace
-                #print(f"Replacing '{full_match}' with '{current_ns}'")
-                return current_ns
-            else:
-                # If namespace is None, replace @ns.qualifier with just the qualifier
-                #print(f"Replacing '{full_match}' with '{qualifier}'")
-                return qualifier
-        
-        # Replace @ns.qualifier patterns (this replaces the ENTIRE @ns.qualifier with the return value)
-        modified_code = re.sub(r'@ns\.([a-zA-Z0-9_-]+)', replace_ns_token, modified_code, flags=re.IGNORECASE)
-        #modified_code = re.sub(r'@ns\s*\(\s*["\'](.+?)["\']\s*\)', current_ns, modified_code, flags=re.IGNORECASE)
-        
-        # Handle @ns. without qualifier (standalone namespace references)
-        if current_ns and current_ns != 'None':
-            modified_code = re.sub(r'@ns(?!\w)', f'"{current_ns}"', modified_code, flags=re.IGNORECASE)
-        else:
-            modified_code = re.sub(r'@ns(?!\w)', '""', modified_code, flags=re.IGNORECASE)
-        #--------------------------------------------------------------------------------------------------------
-        # Handle TF function calls and add import if needed
-        needs_tf_import = False
-        
-        # Handle general @TF.function_name calls
-        tf_pattern = r'(\s*)@TF\.(?!tool_tip|tt)(\w+)\s*\(([^)]*)\)'
-        if re.search(tf_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(tf_pattern, r'\1TF.\2(\3)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # Handle @pb function calls and add import if needed
-        pb_pattern = r'@pb\s*\(([^)]+)\)'
-        if re.search(pb_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(pb_pattern, r'TF.pb(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        # second pattern for @pb
-        pb_pattern_02 = r'@picker_button\s*\(([^)]+)\)'
-        if re.search(pb_pattern_02, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(pb_pattern_02, r'TF.pb(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # handle @ba calls and add import if needed
-        button_appearance_pattern = r'@ba\s*\(([^)]+)\)'
-        if re.search(button_appearance_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(button_appearance_pattern, r'TF.button_appearance(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        # second pattern for @ba
-        button_appearance_pattern_02 = r'@button_appearance\s*\(([^)]+)\)'
-        if re.search(button_appearance_pattern_02, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(button_appearance_pattern_02, r'TF.button_appearance(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # handle @reset_all, @reset_translate, @reset_rotate, @reset_scale
-        reset_all_pattern = r'@reset_all\b'
-        if re.search(reset_all_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(reset_all_pattern, r'TF.reset_all()', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        reset_translate_pattern = r'@reset_move\b'
-        if re.search(reset_translate_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(reset_translate_pattern, r'TF.reset_move()', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        reset_rotate_pattern = r'@reset_rotate\b'
-        if re.search(reset_rotate_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(reset_rotate_pattern, r'TF.reset_rotate()', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        reset_scale_pattern = r'@reset_scale\b'
-        if re.search(reset_scale_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(reset_scale_pattern, r'TF.reset_scale()', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # Handle Tool Tip calls and add import if needed
-        tool_tip_pattern = r'@tt\s*\(([^)]+)\)'
-        if re.search(tool_tip_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(tool_tip_pattern, r'TF.tool_tip(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        # second pattern for @tt
-        tool_tip_pattern_02 = r'@tool_tip\s*\(([^)]+)\)'
-        if re.search(tool_tip_pattern_02, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(tool_tip_pattern_02, r'TF.tool_tip(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # Add TF import if needed
-        if needs_tf_import and 'import ft_anim_picker.src.tool_functions as TF' not in modified_code:
-            modified_code = 'import ft_anim_picker.src.tool_functions as TF\n' + modified_code
-
-        return modified_code
+        """Process script code to handle tokens and imports (single pass, see script_tokens)"""
+        namespace = current_ns if current_ns and current_ns != 'None' else ''
+        return ST.process_script_code(code, namespace)
 
     def _create_execution_environment(self, current_ns, ns_prefix):
         """Create the execution environment with necessary variables and modules"""
@@ -4821,12 +4909,11 @@ class PickerButton(QtWidgets.QWidget):
                 if not selected_pose_bones and object_mode != 'POSE':
                     try:
                         # Ensure armature is selected and active
-                        bpy.ops.object.select_all(action='DESELECT')
+                        BS.deselect_all_objects()
                         active_obj.select_set(True)
-                        bpy.context.view_layer.objects.active = active_obj
                         
-                        # Switch to pose mode
-                        bpy.ops.object.mode_set(mode='POSE')
+                        # Switch to pose mode (only operator call on this path)
+                        BS.ensure_mode(active_obj, 'POSE')
                         bpy.context.view_layer.update()
                         
                         # Try getting selected bones again
@@ -4999,10 +5086,17 @@ class PickerButton(QtWidgets.QWidget):
                     if self.mode == 'select':
                         self.handle_select_mode_click(shift_held, ctrl_held, alt_held, canvas,event)
                     elif self.mode == 'script':
-                        self.execute_script_command()
+                        # Deferred and coalesced so spamming the button never piles up runs (see script_queue)
+                        SQ.ScriptQueue.get_instance().submit(self)
                     elif self.mode == 'pose':
-                        if alt_held:
+                        if ctrl_held:
+                            # Ctrl+drag blends from the current pose towards the stored pose
+                            if self.start_pose_blend():
+                                self._blend_drag_origin = event.globalPos()
+                        elif alt_held:
                             self.apply_mirrored_pose()
+                        elif shift_held:
+                            self.apply_pose(key=True)
                         else:
                             self.apply_pose()
                     
@@ -5062,7 +5156,13 @@ class PickerButton(QtWidgets.QWidget):
 
     def mouseMoveEvent(self, event):
         """Enhanced mouse move with duplication support and optimized dragging"""
-        if hasattr(self, 'duplicating') and self.duplicating and event.buttons() & QtCore.Qt.LeftButton:
+        if self._blend_drag_origin is not None and event.buttons() & QtCore.Qt.LeftButton:
+            weight = (event.globalPos().x() - self._blend_drag_origin.x()) / PBL.BLEND_DRAG_DISTANCE
+            weight = min(max(weight, 0.0), 1.0)
+            self.update_pose_blend(weight)
+            QtWidgets.QToolTip.showText(event.globalPos(), f"Blend {int(weight * 100)}%", self)
+            event.accept()
+        elif hasattr(self, 'duplicating') and self.duplicating and event.buttons() & QtCore.Qt.LeftButton:
             # Handle duplication drag
             self.handle_duplication_drag(event)
             event.accept()
@@ -5122,6 +5222,14 @@ class PickerButton(QtWidgets.QWidget):
         if event.button() == QtCore.Qt.LeftButton:
             canvas = self.parent()
             
+            # Handle pose blend completion
+            if self._blend_drag_origin is not None:
+                self._blend_drag_origin = None
+                QtWidgets.QToolTip.hideText()
+                self.finish_pose_blend()
+                event.accept()
+                return
+            
             # Handle duplication completion
             if hasattr(self, 'duplicating') and self.duplicating:
                 self.complete_duplication_drag(event)
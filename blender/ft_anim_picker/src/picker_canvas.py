@@ -5,6 +5,7 @@ from shiboken6 import wrapInstance
 from functools import partial
 
 import os
+import time
 
 import bpy
 from . import blender_ui as UI
@@ -15,6 +16,11 @@ from . import tool_functions as TF
 from . import data_management as DM
 from . import custom_dialog as CD
 from . import pb_transform_guides as TG
+from . import blender_selection as BS
+from . import scene_events as SE
+from . import missing_objects_report as MR
+from . import button_profiler as BPF
+from . import script_queue as SQ
 from .blender_curve_converter import create_buttons_from_blender_curves
 
 class HUDWidget(QtWidgets.QWidget):
@@ -87,6 +93,18 @@ class HUDWidget(QtWidgets.QWidget):
 
         self.layout.addLayout(self.selection_layout, 0, 1, QtCore.Qt.AlignBottom | QtCore.Qt.AlignRight)
         #--------------------------------------------------------------------------------------------------------------------------------
+        # Script queue depth, shown while button scripts are waiting to run (click to cancel them)
+        self.script_queue_label = QtWidgets.QLabel()
+        self.script_queue_label.setStyleSheet("color: rgba(255, 200, 120, 0.7); background-color: rgba(35, 35, 35, 0.7); border-radius: 3px; padding: 2px 6px;")
+        self.script_queue_label.setVisible(False)
+        self.layout.addWidget(self.script_queue_label, 0, 0, 1, 2, QtCore.Qt.AlignBottom | QtCore.Qt.AlignHCenter)
+
+        # Missing objects count for the session, shown while the report has entries (click to open it)
+        self.missing_objects_label = QtWidgets.QLabel()
+        self.missing_objects_label.setStyleSheet("color: rgba(255, 140, 140, 0.7); background-color: rgba(35, 35, 35, 0.7); border-radius: 3px; padding: 2px 6px;")
+        self.missing_objects_label.setVisible(False)
+        self.layout.addWidget(self.missing_objects_label, 0, 0, 1, 2, QtCore.Qt.AlignTop | QtCore.Qt.AlignHCenter)
+        #--------------------------------------------------------------------------------------------------------------------------------
         self.reset_buttons()
         
         # Store all HUD elements (except toggle button)
@@ -105,6 +123,11 @@ class HUDWidget(QtWidgets.QWidget):
         self.update_timer.timeout.connect(self.update_selection_count)
         self.update_timer.start(100)  
 
+        # The queue outlives the HUD (tabs get deleted, windows closed), so unregister on destruction
+        queue_listener = self.update_script_queue_depth
+        SQ.ScriptQueue.get_instance().add_listener(queue_listener)
+        self.destroyed.connect(lambda *args: SQ.ScriptQueue.get_instance().remove_listener(queue_listener))
+
     def reset_buttons(self):
         button_size = 14
         br = 3
@@ -147,6 +170,16 @@ class HUDWidget(QtWidgets.QWidget):
         container_layout.setContentsMargins(0, 0, 0, 0)
         #container_layout.addWidget(self.reset_button_frame)
         
+    def update_script_queue_depth(self, depth):
+        """Script queue listener: show how many button scripts are queued or running"""
+        self.script_queue_label.setText(f"Scripts queued: {depth}  ✕")
+        self.script_queue_label.setVisible(depth > 0)
+
+    def update_missing_count(self, count):
+        """Show how many items the session missing-objects report holds"""
+        self.missing_objects_label.setText(f"Missing: {count}")
+        self.missing_objects_label.setVisible(count > 0)
+
     def toggle_hud(self):
         self.hud_visible = not self.hud_visible
         for element in self.hud_elements:
@@ -210,6 +243,8 @@ class PickerCanvas(QtWidgets.QWidget):
         self.last_pan_pos = None
 
         self.buttons = []
+        self._button_index = {}  # unique_id -> button, see button_by_id
+        self._button_index_size = -1
         self.setup_dot_texture()
         
         # Set size policy to allow expanding
@@ -231,6 +266,13 @@ class PickerCanvas(QtWidgets.QWidget):
         self.hud = HUDWidget(self)
         self.hud.raise_()
 
+        # The missing objects panel opens by itself only when the report gains new entries. The report
+        # outlives the canvas (tabs get deleted, windows closed), so the listener goes on destruction
+        self._missing_report_has_new = False
+        report_listener = self._on_missing_report_changed
+        MR.MissingObjectsReport.get_instance().add_listener(report_listener)
+        self.destroyed.connect(lambda *args: MR.MissingObjectsReport.get_instance().remove_listener(report_listener))
+
         self.minimal_mode = False
         self.last_selected_button = None
 
@@ -939,12 +981,8 @@ class PickerCanvas(QtWidgets.QWidget):
         if not final_selections:
             # If no buttons selected, clear Blender selection
             try:
-                import bpy
-                with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-                    if bpy.context.mode == 'POSE':
-                        bpy.ops.pose.select_all(action='DESELECT')
-                    elif bpy.context.mode == 'OBJECT':
-                        bpy.ops.object.select_all(action='DESELECT')
+                BS.deselect_all()
+                BS.push_undo("Deselect")
             except:
                 pass
             return
@@ -957,18 +995,11 @@ class PickerCanvas(QtWidgets.QWidget):
             # Regular selection - resolve objects and bones from button data
             resolved_items, missing_objects = self._resolve_selection_items(final_selections)
         
-        # Switch to pose mode if bones are being selected
-        if resolved_items['bones']:
-            self._enter_pose_mode_for_bones(resolved_items['bones'])
-        
-        # Apply selection in Blender with proper active item
+        # Apply selection in Blender with proper active item (switches to pose mode only if needed)
         self._apply_blender_selection(resolved_items, add_to_selection, final_selections[-1] if final_selections else None)
         
         # Handle UI updates
         self._handle_post_selection_updates(missing_objects)
-        import bpy
-        with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-            bpy.ops.ed.undo_push(message="Select Object")
 
     def _get_ordered_selections(self, add_to_selection):
         """Build ordered list of buttons to select based on drag operation"""
@@ -1017,27 +1048,93 @@ class PickerCanvas(QtWidgets.QWidget):
         for button in buttons:
             if not button.assigned_objects:
                 continue
-                
-            for obj_data in button.assigned_objects:
-                try:
-                    if obj_data.get('is_bone', False):
-                        bone_info = self._resolve_bone(obj_data)
-                        if bone_info:
-                            resolved_items['bones'].append(bone_info)
-                        else:
-                            missing_objects.add(self._format_missing_bone(obj_data))
-                    else:
-                        obj_info = self._resolve_object(obj_data, current_namespace)
-                        if obj_info:
-                            resolved_items['objects'].append(obj_info)
-                        else:
-                            missing_objects.add(self._format_missing_object(obj_data))
-                except Exception as e:
-                    print(f"Error resolving selection item: {e}")
-                    continue
+            
+            button_items, button_missing = self._resolve_button_items(button, 'objects', current_namespace)
+            resolved_items['bones'].extend(button_items['bones'])
+            resolved_items['objects'].extend(button_items['objects'])
+            missing_objects.update(button_missing)
         
         return resolved_items, missing_objects
 
+    def _resolve_button_items(self, button, kind, current_namespace):
+        """Resolve one button's items ('objects' or 'counterparts'), reusing its cached result while valid"""
+        cached = button.get_cached_selection(kind, current_namespace)
+        if cached is not None and self._cached_items_exist(cached):
+            # A cache hit skips the resolver, so the misses it stored are reported from the cache
+            missing_report = MR.MissingObjectsReport.get_instance()
+            for obj_data, missing_kind in cached['missing_items']:
+                missing_report.record(button, obj_data, missing_kind, current_namespace)
+            return {'bones': cached['bones'], 'objects': cached['objects']}, cached['missing']
+        
+        generation = SE.scene_generation()
+        start_time = time.perf_counter()
+        
+        if kind == 'counterparts':
+            button_items, button_missing, missing_items = self._resolve_button_counterparts(button, current_namespace)
+        else:
+            button_items, button_missing, missing_items = self._resolve_button_selection(button, current_namespace)
+        
+        resolve_ms = (time.perf_counter() - start_time) * 1000.0
+        button.store_selection_cache(kind, current_namespace, generation, button_items, button_missing, resolve_ms, missing_items)
+        return button_items, button_missing
+
+    def prefetch_selection_cache(self, namespace):
+        """Fill the selection caches of all select buttons for namespace without touching the buttons"""
+        for button in self.buttons:
+            if button.mode != 'select' or not button.assigned_objects:
+                continue
+            if button.get_cached_selection('objects', namespace) is not None:
+                continue
+            try:
+                self._resolve_button_items(button, 'objects', namespace)
+            except Exception as e:
+                print(f"Error prefetching selection for button {button.unique_id}: {e}")
+
+    def _cached_items_exist(self, cached):
+        """Cheap existence check of cached names (catches renames the scene counter can miss)"""
+        objects = bpy.data.objects
+        for obj_info in cached['objects']:
+            if obj_info['name'] not in objects:
+                return False
+        for bone_info in cached['bones']:
+            armature_obj = objects.get(bone_info['armature'])
+            if armature_obj is None or armature_obj.type != 'ARMATURE' or bone_info['bone'] not in armature_obj.data.bones:
+                return False
+        return True
+
+    def _resolve_button_selection(self, button, current_namespace):
+        """Resolve a single button's assigned objects/bones. Returns (resolved items, missing messages, missing items)"""
+        resolved_items = {'bones': [], 'objects': []}
+        missing_objects = set()
+        missing_items = []
+        missing_report = MR.MissingObjectsReport.get_instance()
+        
+        for obj_data in button.assigned_objects:
+            try:
+                if obj_data.get('is_bone', False):
+                    bone_info = self._resolve_bone_with_namespace(obj_data, current_namespace)
+                    if bone_info:
+                        resolved_items['bones'].append(bone_info)
+                        missing_report.discard(button, obj_data, 'object')
+                    else:
+                        missing_objects.add(self._format_missing_bone(obj_data))
+                        missing_report.record(button, obj_data, 'object', current_namespace)
+                        missing_items.append((obj_data, 'object'))
+                else:
+                    obj_info = self._resolve_object(obj_data, current_namespace)
+                    if obj_info:
+                        resolved_items['objects'].append(obj_info)
+                        missing_report.discard(button, obj_data, 'object')
+                    else:
+                        missing_objects.add(self._format_missing_object(obj_data))
+                        missing_report.record(button, obj_data, 'object', current_namespace)
+                        missing_items.append((obj_data, 'object'))
+            except Exception as e:
+                print(f"Error resolving selection item: {e}")
+                continue
+        
+        return resolved_items, missing_objects, missing_items
+
     def _resolve_bone_with_namespace(self, obj_data, current_namespace):
         """Resolve bone data to Blender bone reference with namespace priority"""
         import bpy
@@ -1099,7 +1196,7 @@ class PickerCanvas(QtWidgets.QWidget):
         return None
 
     def _apply_blender_selection(self, resolved_items, add_to_selection, last_selected_button=None):
-        """Apply the actual selection in Blender"""
+        """Apply the actual selection in Blender through the data API (single undo step)"""
         import bpy
         
         bones = resolved_items['bones']
@@ -1127,238 +1224,39 @@ class PickerCanvas(QtWidgets.QWidget):
                             break
         
         try:
-            if bones:
-                self._select_bones_with_namespace(bones, add_to_selection, active_bone_info)
-            
-            if objects:
-                self._select_objects(objects, add_to_selection, has_bones=bool(bones), active_object_info=active_object_info)
+            # Group bones by armature object (bones are already resolved with namespace priority)
+            armature_bones = {}
+            for bone_info in bones:
+                armature_obj = bpy.data.objects.get(bone_info['armature'])
+                if armature_obj is None or armature_obj.type != 'ARMATURE':
+                    print(f"Warning: Armature '{bone_info['armature']}' not found")
+                    continue
+                armature_bones.setdefault(armature_obj, []).append(bone_info['bone'])
+            
+            selected_objects = [bpy.data.objects.get(obj_info['name']) for obj_info in objects]
+            
+            active_bone = None
+            if active_bone_info:
+                active_armature = bpy.data.objects.get(active_bone_info['armature'])
+                if active_armature is not None:
+                    active_bone = (active_armature, active_bone_info['bone'])
+            
+            active_object = None
+            if active_object_info and not armature_bones:
+                active_object = bpy.data.objects.get(active_object_info['name'])
+            
+            BS.apply_selection(
+                objects=selected_objects,
+                bones=armature_bones,
+                active_object=active_object,
+                active_bone=active_bone,
+                add_to_selection=add_to_selection,
+                undo_message="Select Object",
+            )
                 
         except Exception as e:
             print(f"Error during Blender selection: {e}")
 
-    def _deselect_bones(self, armature_name):
-        """Deselect all bones in an armature - OPTIMIZED VERSION"""
-        try:
-            if armature_name not in bpy.data.objects:
-                return []
-            
-            armature_obj = bpy.data.objects[armature_name]
-            if armature_obj.type != 'ARMATURE' or not armature_obj.data:
-                return []
-            
-            # Get all bone names
-            bone_names = [bone.name for bone in armature_obj.data.bones]
-            
-            # Deselect all bones at once
-            for bone_name in bone_names:
-                if bone_name in armature_obj.pose.bones:
-                    armature_obj.pose.bones[bone_name].bone.select = False
-            
-            return bone_names
-            
-        except Exception as e:
-            print(f"Error deselecting bones in armature {armature_name}: {e}")
-            return []
-
-    def _select_bones_with_namespace(self, bones, add_to_selection, active_bone_info=None):
-        """Updated bone selection with namespace priority and proper active bone"""
-        if not bones:
-            return
-        
-        # Get current namespace
-        current_namespace = self._get_current_namespace()
-        
-        selected_bones = []
-        armatures_processed = set()
-        
-        # Group bones by target armature (considering namespace)
-        armature_bones = {}
-        for bone_info in bones:
-            original_armature = bone_info['armature']
-            bone_name = bone_info['bone']
-            
-            # Determine target armature with namespace priority
-            target_armature = None
-            
-            # Priority 1: Current namespace if available
-            if (current_namespace and current_namespace != 'None' and 
-                current_namespace in bpy.data.objects and
-                bpy.data.objects[current_namespace].type == 'ARMATURE' and
-                bone_name in bpy.data.objects[current_namespace].pose.bones):
-                target_armature = current_namespace
-            
-            # Priority 2: Original armature (fallback)
-            elif (original_armature in bpy.data.objects and 
-                bpy.data.objects[original_armature].type == 'ARMATURE' and
-                bone_name in bpy.data.objects[original_armature].pose.bones):
-                target_armature = original_armature
-            
-            # Priority 3: Search all armatures
-            else:
-                for obj in bpy.context.scene.objects:
-                    if (obj.type == 'ARMATURE' and obj.pose and 
-                        bone_name in obj.pose.bones):
-                        target_armature = obj.name
-                        break
-            
-            if target_armature:
-                if target_armature not in armature_bones:
-                    armature_bones[target_armature] = []
-                armature_bones[target_armature].append(bone_name)
-            else:
-                print(f"Warning: Bone '{bone_name}' not found in any armature")
-        
-        # Clear bone selections once per armature (only if not adding to selection)
-        if not add_to_selection:
-            for armature_name in armature_bones.keys():
-                self._deselect_bones(armature_name)
-        
-        # Select all the bones by armature
-        active_bone_set = False
-        for armature_name, bone_names in armature_bones.items():
-            try:
-                armature_obj = bpy.data.objects[armature_name]
-                
-                for bone_name in bone_names:
-                    if bone_name in armature_obj.pose.bones:
-                        bone_to_select = armature_obj.pose.bones[bone_name].bone
-                        bone_to_select.select = True
-                        selected_bones.append(f"{bone_name} (in {armature_name})")
-                        
-                        # Set as active if this is the active bone or if no active bone specified and not set yet
-                        if ((active_bone_info and 
-                            active_bone_info['bone'] == bone_name and 
-                            active_bone_info['armature'] == armature_name) or
-                            (not active_bone_info and not active_bone_set)):
-                            armature_obj.data.bones.active = bone_to_select
-                            active_bone_set = True
-                            
-            except Exception as e:
-                print(f"Error selecting bones in armature {armature_name}: {e}")
-                continue
-        
-        if selected_bones:
-            #print(f"Selected bones: {', '.join(selected_bones)}")
-            pass
-        else:
-            print("No bones were selected")
-    
-    def _enter_pose_mode_for_bones(self, bones):
-        """Switch to pose mode for the armature containing the selected bones"""
-        import bpy
-        
-        if not bones:
-            return
-        
-        try:
-            with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-                # Get the first armature from the bone selection
-                first_bone = bones[0]
-                armature_name = first_bone['armature']
-                
-                if armature_name not in bpy.data.objects:
-                    print(f"Warning: Armature '{armature_name}' not found")
-                    return
-                
-                armature_obj = bpy.data.objects[armature_name]
-                
-                # First, ensure we're in object mode to properly set the active object
-                if bpy.context.mode != 'OBJECT':
-                    try:
-                        bpy.ops.object.mode_set(mode='OBJECT')
-                    except RuntimeError:
-                        # If we can't switch to object mode, clear selections manually
-                        pass
-                
-                # Clear all object selections using direct API instead of operators
-                for obj in bpy.context.scene.objects:
-                    obj.select_set(False)
-                
-                # Set the armature as the active and selected object
-                bpy.context.view_layer.objects.active = armature_obj
-                armature_obj.select_set(True)
-                
-                # Now switch to pose mode
-                if bpy.context.mode != 'POSE':
-                    try:
-                        bpy.ops.object.mode_set(mode='POSE')
-                    except RuntimeError as e:
-                        print(f"Failed to switch to pose mode: {e}")
-                        return
-                
-                # Clear any existing pose bone selections
-                if bpy.context.mode == 'POSE' and armature_obj.pose:
-                    for pose_bone in armature_obj.pose.bones:
-                        pose_bone.bone.select = False
-                
-                #print(f"Successfully switched to pose mode for armature: {armature_name}")
-            
-        except Exception as e:
-            print(f"Error entering pose mode for bones: {e}")
-            # Fallback: try without temp_override
-            try:
-                with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-                    # Get the first armature from the bone selection
-                    first_bone = bones[0]
-                    armature_name = first_bone['armature']
-                    
-                    if armature_name not in bpy.data.objects:
-                        return
-                    
-                    armature_obj = bpy.data.objects[armature_name]
-                    
-                    # Simple approach without operators that might fail
-                    # Clear selections using direct API
-                    for obj in bpy.context.scene.objects:
-                        obj.select_set(False)
-                    
-                    # Set active object
-                    bpy.context.view_layer.objects.active = armature_obj
-                    armature_obj.select_set(True)
-                    
-                    # Try to switch mode
-                    if bpy.context.active_object == armature_obj and armature_obj.type == 'ARMATURE':
-                        if bpy.context.mode != 'POSE':
-                            bpy.ops.object.mode_set(mode='POSE')
-                            
-                        #print(f"Fallback: Successfully switched to pose mode for armature: {armature_name}")
-            except Exception as fallback_error:
-                print(f"Fallback also failed: {fallback_error}")
-        
-    def _get_selected_bones(self):
-        """Get currently selected bones in pose mode"""
-        pass
-
-    def _select_objects(self, objects, add_to_selection, has_bones=False, active_object_info=None):
-        """Select regular objects with proper active object"""
-        import bpy
-        
-        # Only switch to object mode if we don't have bones selected
-        if not has_bones and bpy.context.mode != 'OBJECT':
-            bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Clear object selection if not adding and no bones
-        if not add_to_selection and not has_bones:
-            bpy.ops.object.select_all(action='DESELECT')
-        
-        selected_objects = []
-        active_object_set = False
-        
-        for obj_info in objects:
-            obj_name = obj_info['name']
-            if obj_name in bpy.data.objects:
-                bpy.data.objects[obj_name].select_set(True)
-                selected_objects.append(obj_name)
-                
-                # Set as active if this is the active object or if no active object specified and not set yet
-                if not has_bones:  # Only set active object if no bones are selected
-                    if ((active_object_info and active_object_info['name'] == obj_name) or
-                        (not active_object_info and not active_object_set)):
-                        bpy.context.view_layer.objects.active = bpy.data.objects[obj_name]
-                        active_object_set = True
-        
-        #print(f"Selected objects: {', '.join(selected_objects)}")
-
     def _get_current_namespace(self):
         """Get current namespace from main window"""
         main_window = self.window()
@@ -1385,9 +1283,9 @@ class PickerCanvas(QtWidgets.QWidget):
 
     def _handle_post_selection_updates(self, missing_objects):
         """Handle UI updates after selection"""
-        # Show missing objects dialog
+        # Missing objects go to the session report; never block the click on UI
         if missing_objects:
-            self._show_missing_objects_dialog(missing_objects)
+            self._report_missing_objects()
         
         # Update button visuals
         for button in self.buttons:
@@ -1398,25 +1296,117 @@ class PickerCanvas(QtWidgets.QWidget):
         self.button_selection_changed.emit()
         self.update_hud_counts()
 
-    def _show_missing_objects_dialog(self, missing_objects):
-        """Show dialog for missing objects"""
-        '''parent_widget = self.parentWidget()
-        dialog = CD.CustomDialog(parent_widget, title="Missing Objects", size=(250, -1), info_box=True)
-        message_label = QtWidgets.QLabel("The following objects were not found:")
-        details_label = QtWidgets.QLabel('\n'.join(sorted(f"<b><font color='#00ade6'>{objects}</font></b>" for objects in missing_objects)))
-        note_label = QtWidgets.QLabel("[Objects may have been deleted or renamed]")
+    def _on_missing_report_changed(self, has_new_entries):
+        """Missing objects report listener: keep the HUD count current and note new entries"""
+        if has_new_entries:
+            self._missing_report_has_new = True
+        self.hud.update_missing_count(len(MR.MissingObjectsReport.get_instance()))
+
+    def _report_missing_objects(self):
+        """Surface the session missing-objects report without blocking the caller.
+
+        The panel is opened only when the click added new entries; once the user has closed it,
+        known misses just show up in the HUD count.
+        """
+        if not self._missing_report_has_new:
+            return
+        self._missing_report_has_new = False
+        panel = getattr(self, 'missing_objects_panel', None)
+        if panel is not None and panel.isVisible():
+            return  # Panel refreshes itself from the report
+        QTimer.singleShot(0, self.show_missing_objects_panel)
+
+    def show_missing_objects_panel(self):
+        """Show the non-modal missing objects panel"""
+        if getattr(self, 'missing_objects_panel', None) is None:
+            self.missing_objects_panel = MR.MissingObjectsPanel(self)
+            self.missing_objects_panel.position_window()
+        self.missing_objects_panel.show()
+        self.missing_objects_panel.raise_()
+
+    def show_slowest_buttons_panel(self):
+        """Show the non-modal panel of script/pose button run times"""
+        if getattr(self, 'slowest_buttons_panel', None) is None:
+            self.slowest_buttons_panel = BPF.SlowestButtonsPanel(self)
+            self.slowest_buttons_panel.position_window()
+        self.slowest_buttons_panel.show()
+        self.slowest_buttons_panel.raise_()
+
+    def repair_missing_objects(self, namespace):
+        """Batch-remap every reported missing object/bone onto namespace.
+
+        Bones are remapped to the namespace armature, objects to the namespaced object name.
+        Counterpart entries remap their source the same way and are repaired once the counterpart
+        resolves. Entries whose items resolve again are dropped from the report.
+
+        Returns:
+            tuple: (repaired_count, remaining_count)
+        """
+        report = MR.MissingObjectsReport.get_instance()
+        entries = report.entries()
+        if not entries:
+            return 0, 0
+        
+        use_namespace = namespace and namespace != 'None'
+        objects = bpy.data.objects
+        namespace_armature = objects.get(namespace) if use_namespace else None
+        if namespace_armature is not None and namespace_armature.type != 'ARMATURE':
+            namespace_armature = None
+        
+        # Pair entries with their item data before any of it is remapped
+        buttons_by_id = {button.unique_id: button for button in self.buttons}
+        targets = []
+        for entry in entries:
+            button = buttons_by_id.get(entry['button_id'])
+            if button is None:
+                continue
+            obj_data = next((data for data in button.assigned_objects if MR.item_id(data) == entry['item_key']), None)
+            if obj_data is None:
+                # No longer assigned to the button
+                report.remove(entry['button_id'], entry['item_key'], entry['kind'])
+                continue
+            targets.append((entry, button, obj_data))
         
-        dialog.add_widget(message_label)
-        dialog.add_widget(details_label)
-        dialog.add_widget(note_label)
-        dialog.add_button_box()
-        dialog.exec_()'''
-        message_txt = "The following objects were not found:"
-        details_txt = '\n'.join(sorted(objects for objects in missing_objects))
-        note_txt = "[Objects may have been deleted or renamed]"
-        print(message_txt)
-        print(details_txt)
-        print(note_txt)
+        naming_conventions = self._get_naming_conventions("", "")
+        changed_buttons = set()
+        repaired = 0
+        
+        for entry, button, obj_data in targets:
+            remap = None
+            if use_namespace and entry['is_bone']:
+                if namespace_armature is not None and entry['name'] in namespace_armature.data.bones:
+                    remap = {'armature': namespace}
+            elif use_namespace:
+                for candidate in (f"{namespace}_{entry['name']}", f"{namespace}.{entry['name']}", f"{entry['name']}.{namespace}"):
+                    if candidate in objects:
+                        remap = {'name': candidate}
+                        break
+            
+            if remap is not None and any(obj_data.get(key) != value for key, value in remap.items()):
+                obj_data.update(remap)
+                changed_buttons.add(button)
+            
+            if entry['kind'] == 'counterpart':
+                if obj_data.get('is_bone', False):
+                    resolved = self._resolve_bone_counterpart(obj_data, naming_conventions, namespace)
+                else:
+                    resolved = self._resolve_object_counterpart(obj_data, naming_conventions, namespace)
+            elif obj_data.get('is_bone', False):
+                resolved = self._resolve_bone_with_namespace(obj_data, namespace)
+            else:
+                resolved = self._resolve_object(obj_data, namespace)
+            
+            if resolved:
+                report.remove(entry['button_id'], entry['item_key'], entry['kind'])
+                changed_buttons.add(button)
+                repaired += 1
+        
+        for button in changed_buttons:
+            button.invalidate_selection_cache()
+            button.update_tooltip()
+            button.changed.emit(button)
+        
+        return repaired, len(report)
     #------------------------------------------------------------------------------
     def _resolve_counterpart_items(self, buttons):
         """Resolve counterpart objects/bones for selected buttons"""
@@ -1426,33 +1416,53 @@ class PickerCanvas(QtWidgets.QWidget):
         # Get current namespace for object resolution
         current_namespace = self._get_current_namespace()
         
-        # Get naming conventions and mirror preferences
-        naming_conventions = self._get_naming_conventions("", "")
-        
         for button in buttons:
             if not button.assigned_objects:
                 continue
-                
-            for obj_data in button.assigned_objects:
-                try:
-                    if obj_data.get('is_bone', False):
-                        counterpart_bone = self._resolve_bone_counterpart(obj_data, naming_conventions, current_namespace)
-                        if counterpart_bone:
-                            resolved_items['bones'].append(counterpart_bone)
-                        else:
-                            missing_objects.add(f"- {obj_data.get('name', '')} (bone counterpart)")
-                    else:
-                        counterpart_obj = self._resolve_object_counterpart(obj_data, naming_conventions, current_namespace)
-                        if counterpart_obj:
-                            resolved_items['objects'].append(counterpart_obj)
-                        else:
-                            missing_objects.add(f"- {obj_data.get('name', '')} (object counterpart)")
-                except Exception as e:
-                    print(f"Error resolving counterpart item: {e}")
-                    continue
+            
+            button_items, button_missing = self._resolve_button_items(button, 'counterparts', current_namespace)
+            resolved_items['bones'].extend(button_items['bones'])
+            resolved_items['objects'].extend(button_items['objects'])
+            missing_objects.update(button_missing)
         
         return resolved_items, missing_objects
 
+    def _resolve_button_counterparts(self, button, current_namespace):
+        """Resolve counterpart objects/bones for a single button. Returns (resolved items, missing messages, missing items)"""
+        resolved_items = {'bones': [], 'objects': []}
+        missing_objects = set()
+        missing_items = []
+        missing_report = MR.MissingObjectsReport.get_instance()
+        
+        # Get naming conventions and mirror preferences
+        naming_conventions = self._get_naming_conventions("", "")
+        
+        for obj_data in button.assigned_objects:
+            try:
+                if obj_data.get('is_bone', False):
+                    counterpart_bone = self._resolve_bone_counterpart(obj_data, naming_conventions, current_namespace)
+                    if counterpart_bone:
+                        resolved_items['bones'].append(counterpart_bone)
+                        missing_report.discard(button, obj_data, 'counterpart')
+                    else:
+                        missing_objects.add(f"- {obj_data.get('name', '')} (bone counterpart)")
+                        missing_report.record(button, obj_data, 'counterpart', current_namespace)
+                        missing_items.append((obj_data, 'counterpart'))
+                else:
+                    counterpart_obj = self._resolve_object_counterpart(obj_data, naming_conventions, current_namespace)
+                    if counterpart_obj:
+                        resolved_items['objects'].append(counterpart_obj)
+                        missing_report.discard(button, obj_data, 'counterpart')
+                    else:
+                        missing_objects.add(f"- {obj_data.get('name', '')} (object counterpart)")
+                        missing_report.record(button, obj_data, 'counterpart', current_namespace)
+                        missing_items.append((obj_data, 'counterpart'))
+            except Exception as e:
+                print(f"Error resolving counterpart item: {e}")
+                continue
+        
+        return resolved_items, missing_objects, missing_items
+
     def _resolve_bone_counterpart(self, obj_data, naming_conventions, current_namespace):
         """Resolve bone counterpart using naming conventions"""
         import bpy
@@ -1659,9 +1669,30 @@ class PickerCanvas(QtWidgets.QWidget):
     #------------------------------------------------------------------------------
     # BUTTON MANAGEMENT
     #------------------------------------------------------------------------------
+    def button_by_id(self, unique_id):
+        """First button with unique_id, or None.
+
+        Lookups go through an id index that is rebuilt when buttons are added or removed (the list
+        length changed) or when the indexed button no longer carries the id.
+        """
+        button = self._button_index.get(unique_id)
+        if (button is not None and self._button_index_size == len(self.buttons) and
+                getattr(button, 'unique_id', None) == unique_id):
+            return button
+        
+        self._button_index = {}
+        for button in reversed(self.buttons):
+            self._button_index[getattr(button, 'unique_id', None)] = button
+        self._button_index_size = len(self.buttons)
+        return self._button_index.get(unique_id)
+
+    def _invalidate_button_index(self):
+        self._button_index_size = -1
+
     def add_button(self, button):
         # Preserve original functionality
         self.buttons.append(button)
+        self._invalidate_button_index()
         button.setParent(self)
         button.show()
         button.deleted.connect(self.remove_button)
@@ -1682,6 +1713,7 @@ class PickerCanvas(QtWidgets.QWidget):
                 self._hide_button_tooltip()
             
             self.buttons.remove(button)
+            self._invalidate_button_index()
             self.update_button_positions()
             main_window = self.window()
             if isinstance(main_window, UI.BlenderAnimPickerWindow):
@@ -2956,6 +2988,10 @@ class PickerCanvas(QtWidgets.QWidget):
             if isinstance(main_window, UI.BlenderAnimPickerWindow):
                 edit_mode_action.triggered.connect(main_window.toggle_edit_mode)
         
+        menu.addSeparator()
+        profiler_action = menu.addAction(QtGui.QIcon(UT.get_icon('code.png')), "Slowest Buttons")
+        profiler_action.triggered.connect(self.show_slowest_buttons_panel)
+        
         if menu.actions():
             menu.exec_(self.mapToGlobal(position))
 
@@ -3099,8 +3135,8 @@ class PickerCanvas(QtWidgets.QWidget):
                             button_data_for_db["thumbnail_path"] = new_button.thumbnail_path
                         
                         # Add pose data if available
-                        if hasattr(new_button, 'pose_data') and new_button.pose_data:
-                            button_data_for_db["pose_data"] = new_button.pose_data
+                        if new_button.has_pose():
+                            button_data_for_db["pose_data"] = new_button.pose_document_data()
                     
                     # CRITICAL FIX: Add to tab_data immediately
                     tab_data['buttons'].append(button_data_for_db)
@@ -3268,7 +3304,7 @@ class PickerCanvas(QtWidgets.QWidget):
                     "assigned_objects": getattr(button, 'assigned_objects', []),
                     "mode": getattr(button, 'mode', 'select'),
                     "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-                    "pose_data": getattr(button, 'pose_data', {}),
+                    "pose_data": button.pose_document_data(),
                     "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                     "shape_type": button.shape_type,
                     "svg_path_data": button.svg_path_data,  # This includes the mirrored path
@@ -3366,7 +3402,7 @@ class PickerCanvas(QtWidgets.QWidget):
                     "assigned_objects": getattr(button, 'assigned_objects', []),
                     "mode": getattr(button, 'mode', 'select'),
                     "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-                    "pose_data": getattr(button, 'pose_data', {}),
+                    "pose_data": button.pose_document_data(),
                     "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                     "shape_type": button.shape_type,
                     "svg_path_data": button.svg_path_data,  # This includes the mirrored path
@@ -3512,6 +3548,14 @@ class PickerCanvas(QtWidgets.QWidget):
         
         # Check HUD interaction
         hud_pos = self.hud.mapFromParent(event.pos())
+        if self.hud.script_queue_label.isVisible() and self.hud.script_queue_label.geometry().contains(hud_pos):
+            SQ.ScriptQueue.get_instance().cancel()
+            event.accept()
+            return
+        if self.hud.missing_objects_label.isVisible() and self.hud.missing_objects_label.geometry().contains(hud_pos):
+            self.show_missing_objects_panel()
+            event.accept()
+            return
         if self.hud.button_container.geometry().contains(hud_pos):
             self.hud.toggle_button.click()
             event.accept()
@@ -3556,11 +3600,7 @@ class PickerCanvas(QtWidgets.QWidget):
                     else:
                         # Clear Blender selection
                         try:
-                            with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-                                if bpy.context.mode == 'POSE':
-                                    bpy.ops.pose.select_all(action='DESELECT')
-                                elif bpy.context.mode == 'OBJECT':
-                                    bpy.ops.object.select_all(action='DESELECT')
+                            BS.deselect_all()
                         except:
                             pass
                         self.clear_selection()
@@ -3909,5 +3949,7 @@ class PickerCanvas(QtWidgets.QWidget):
             self.transform_guides.deleteLater()
         
         if hasattr(self, 'hud'):
+            SQ.ScriptQueue.get_instance().remove_listener(self.hud.update_script_queue_depth)
+            MR.MissingObjectsReport.get_instance().remove_listener(self._on_missing_report_changed)
             self.hud.deleteLater()
             
\ No newline at end of file
@@ -11,6 +11,7 @@ from PySide6 import QtWidgets
 
 # Import the data manager
 from . import data_management as DM
+from . import pose_library as PL
 
 def get_file_dialog_directory():
     """
@@ -230,6 +231,9 @@ def store_picker_data(file_path, current_tab_name=None, save_mode='all'):
     if not data or not data.get('tabs'):
         raise RuntimeError("No picker data available to save")
     
+    # Exported pickers carry their poses so they work without this machine's pose library
+    data = PL.inline_pose_refs(data)
+    
     # Ensure file has .json extension
     if not file_path.lower().endswith('.json'):
         file_path += '.json'
@@ -304,7 +308,8 @@ def load_picker_data(file_path):
         if tab_name not in merged_data['tabs']:
             merged_data['tabs'][tab_name] = tab_data
     
-    # Save the merged data to Blender addon preferences
+    # Save the merged data to Blender addon preferences (imported poses move into the pose library)
+    PL.externalize_pose_data(merged_data)
     try:
         save_picker_data(merged_data)
     except Exception as e:
@@ -0,0 +1,225 @@
+import numpy as np
+from PySide6 import QtWidgets, QtCore
+
+from . import blender_selection as BS
+
+#----------------------------------------------------------------------------------------------------------
+# POSE BLENDING
+#----------------------------------------------------------------------------------------------------------
+# A blend session packs the current and stored transforms of every posed bone/object into NumPy
+# buffers once. Each drag/slider tick is then one vectorized blend per channel: location, scale,
+# euler and axis-angle lerp, quaternions slerp. Bone channels are written back with a single
+# foreach_set on the armature's pose bones. Committing pushes one undo step for the whole blend.
+# Custom properties are not blended.
+
+BLEND_DRAG_DISTANCE = 200  # Pixels of horizontal drag for a full (0-100%) blend
+
+_CHANNELS = (
+    ('location', 3),
+    ('rotation_euler', 3),
+    ('rotation_quaternion', 4),
+    ('rotation_axis_angle', 4),
+    ('scale', 3),
+)
+
+def _channel_applies(target, channel):
+    """Same rule as applying a pose: only the rotation channel of the target's rotation mode is used"""
+    if channel == 'rotation_quaternion':
+        return target.rotation_mode == 'QUATERNION'
+    if channel == 'rotation_axis_angle':
+        return target.rotation_mode == 'AXIS_ANGLE'
+    if channel == 'rotation_euler':
+        return target.rotation_mode not in ('QUATERNION', 'AXIS_ANGLE')
+    return True
+
+def slerp(q0, q1, weight):
+    """Spherical interpolation between (N, 4) quaternion arrays (w, x, y, z)"""
+    dot = np.sum(q0 * q1, axis=1)
+
+    # Take the short way around
+    q1 = np.where(dot[:, None] < 0.0, -q1, q1)
+    dot = np.clip(np.abs(dot), 0.0, 1.0)
+
+    theta = np.arccos(dot)
+    sin_theta = np.sin(theta)
+    nearly_parallel = sin_theta < 1e-6
+    safe_sin = np.where(nearly_parallel, 1.0, sin_theta)
+
+    w0 = np.where(nearly_parallel, 1.0 - weight, np.sin((1.0 - weight) * theta) / safe_sin)
+    w1 = np.where(nearly_parallel, weight, np.sin(weight * theta) / safe_sin)
+    result = q0 * w0[:, None] + q1 * w1[:, None]
+
+    norm = np.linalg.norm(result, axis=1, keepdims=True)
+    return result / np.where(norm == 0.0, 1.0, norm)
+
+class _Channel:
+    """Start/goal buffers of one transform channel for a group of targets"""
+    def __init__(self, channel, start, goal):
+        self.channel = channel
+        self.start = np.asarray(start, dtype=np.float64)
+        self.goal = np.asarray(goal, dtype=np.float64)
+        self.delta = self.goal - self.start
+
+    def values(self, weight):
+        if self.channel == 'rotation_quaternion':
+            return slerp(self.start, self.goal, weight)
+        return self.start + self.delta * weight
+
+class _BoneChannel(_Channel):
+    """Channel of an armature's pose bones, read and written with foreach_get/foreach_set"""
+    def __init__(self, pose_bones, channel, size, indices, goal):
+        self.pose_bones = pose_bones
+        self.buffer = np.empty(len(pose_bones) * size, dtype=np.float32)
+        pose_bones.foreach_get(channel, self.buffer)
+        self.buffer = self.buffer.reshape(-1, size)
+        self.indices = np.array(indices, dtype=np.int64)
+        super(_BoneChannel, self).__init__(channel, self.buffer[self.indices], goal)
+
+    def write(self, values):
+        self.buffer[self.indices] = values
+        self.pose_bones.foreach_set(self.channel, self.buffer.ravel())
+
+class _ObjectChannel(_Channel):
+    """Channel of individual objects (object poses only hold a handful of objects)"""
+    def __init__(self, objects, channel, goal):
+        self.objects = objects
+        super(_ObjectChannel, self).__init__(channel, [list(getattr(obj, channel)) for obj in objects], goal)
+
+    def write(self, values):
+        for obj, value in zip(self.objects, values.tolist()):
+            setattr(obj, self.channel, value)
+
+class PoseBlendSession:
+    """Interpolates from the current pose to a stored pose.
+
+    Args:
+        bone_targets: Dict of armature object -> {bone name: stored attr values}.
+        object_targets: List of (object, stored attr values).
+    """
+    def __init__(self, bone_targets, object_targets):
+        self.channels = []
+        self.armatures = list(bone_targets)
+        self.weight = 0.0
+
+        for armature_obj, bones_data in bone_targets.items():
+            pose_bones = armature_obj.pose.bones
+            index_by_name = {bone.name: index for index, bone in enumerate(pose_bones)}
+            for channel, size in _CHANNELS:
+                indices = []
+                goal = []
+                for bone_name, attr_values in bones_data.items():
+                    index = index_by_name.get(bone_name)
+                    value = attr_values.get(channel)
+                    if index is None or not value or len(value) < size:
+                        continue
+                    if not _channel_applies(pose_bones[index], channel):
+                        continue
+                    indices.append(index)
+                    goal.append(value[:size])
+                if indices:
+                    self.channels.append(_BoneChannel(pose_bones, channel, size, indices, goal))
+
+        for channel, size in _CHANNELS:
+            objects = []
+            goal = []
+            for obj, attr_values in object_targets:
+                value = attr_values.get(channel)
+                if not value or len(value) < size or not _channel_applies(obj, channel):
+                    continue
+                objects.append(obj)
+                goal.append(value[:size])
+            if objects:
+                self.channels.append(_ObjectChannel(objects, channel, goal))
+
+    def __len__(self):
+        return len(self.channels)
+
+    def preview(self, weight):
+        """Write the blend for weight (0 = start pose, 1 = stored pose)"""
+        weight = min(max(weight, 0.0), 1.0)
+        for channel in self.channels:
+            channel.write(channel.values(weight))
+        for armature_obj in self.armatures:
+            armature_obj.update_tag()
+        BS.tag_view3d_redraw()
+        self.weight = weight
+
+    def commit(self):
+        """Make the current blend a single undo step"""
+        BS.push_undo("Blend Pose")
+
+    def cancel(self):
+        self.preview(0.0)
+        self.weight = 0.0
+
+class PoseBlendSlider(QtWidgets.QWidget):
+    """Popup slider blending the current pose towards a pose button's stored pose"""
+    def __init__(self, button, parent=None):
+        super(PoseBlendSlider, self).__init__(parent or button.window())
+        self.setWindowFlags(QtCore.Qt.Popup | QtCore.Qt.FramelessWindowHint | QtCore.Qt.NoDropShadowWindowHint)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+        self.button = button
+
+        self.main_layout = QtWidgets.QVBoxLayout(self)
+        self.main_layout.setContentsMargins(4, 4, 4, 4)
+
+        self.frame = QtWidgets.QFrame()
+        self.frame.setFixedWidth(200)
+        self.frame.setStyleSheet("""
+            QFrame {
+                background-color: rgba(36, 36, 36, .9);
+                border: 1px solid #444444;
+                border-radius: 4px;
+            }
+        """)
+        frame_layout = QtWidgets.QVBoxLayout(self.frame)
+        frame_layout.setContentsMargins(6, 6, 6, 6)
+        frame_layout.setSpacing(4)
+
+        self.title_label = QtWidgets.QLabel(f"Blend: {button.label or 'Pose'}")
+        self.title_label.setStyleSheet("color: #dddddd; background: transparent; border: none;")
+
+        self.slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
+        self.slider.setRange(0, 100)
+        self.slider.setStyleSheet("""
+            QSlider { background: transparent; border: none; }
+            QSlider::groove:horizontal { height: 4px; background: #1e1e1e; border-radius: 2px; }
+            QSlider::sub-page:horizontal { background: #5285a6; border-radius: 2px; }
+            QSlider::handle:horizontal { background: #dddddd; width: 10px; margin: -4px 0; border-radius: 5px; }
+        """)
+
+        frame_layout.addWidget(self.title_label)
+        frame_layout.addWidget(self.slider)
+        self.main_layout.addWidget(self.frame)
+
+        self.slider.sliderPressed.connect(self._on_slider_pressed)
+        self.slider.valueChanged.connect(self._on_value_changed)
+        self.slider.sliderReleased.connect(self._on_slider_released)
+
+    def _on_slider_pressed(self):
+        self.button.start_pose_blend()
+
+    def _on_value_changed(self, value):
+        self.title_label.setText(f"Blend: {self.button.label or 'Pose'}  {value}%")
+        if not self.button.is_pose_blending():
+            # Keyboard and click-on-groove changes are applied as one step each
+            if self.button.start_pose_blend():
+                self.button.update_pose_blend(value / 100.0)
+                self.button.finish_pose_blend()
+            return
+        self.button.update_pose_blend(value / 100.0)
+
+    def _on_slider_released(self):
+        self.button.finish_pose_blend()
+
+    def show_at(self, global_pos):
+        self.slider.blockSignals(True)
+        self.slider.setValue(0)
+        self.slider.blockSignals(False)
+        self.title_label.setText(f"Blend: {self.button.label or 'Pose'}")
+        self.move(global_pos)
+        self.show()
+
+    def closeEvent(self, event):
+        self.button.finish_pose_blend()
+        super().closeEvent(event)
@@ -0,0 +1,133 @@
+import bpy
+from bpy.app.handlers import persistent
+
+class SceneEvents:
+    """Cheap scene change counter driven by Blender app handlers.
+
+    Anything that caches resolved scene data (button selection sets, namespace lists, ...)
+    stores the generation it was built at and treats it as stale once the generation moves.
+    The counter only moves on structural changes (objects added/removed/renamed, collection
+    edits, file load), never on transforms or selection changes.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = SceneEvents()
+        return cls._instance
+
+    def __init__(self):
+        self.generation = 0
+        self._listeners = []
+        self._installed = False
+        self._object_count = -1
+        self._names_by_pointer = {}
+        self.updated_objects = []  # Objects reported by the update that caused the last bump
+
+    @property
+    def installed(self):
+        return self._installed
+
+    def install(self):
+        """Register the app handlers (safe to call more than once)"""
+        if self._installed:
+            return
+
+        if _on_depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_post)
+        if _on_load_post not in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.append(_on_load_post)
+
+        self._object_count = len(bpy.data.objects)
+        self._record_names()
+        self._installed = True
+
+    def remove(self):
+        """Remove the app handlers"""
+        if _on_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_post)
+        if _on_load_post in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(_on_load_post)
+        self._installed = False
+
+    def add_listener(self, listener):
+        """Register a callable(reason) that is notified whenever the generation changes"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def bump(self, reason='manual', updated_objects=None):
+        """Advance the generation so all caches built before now are stale.
+
+        updated_objects lists the objects behind the change when known (added or renamed objects),
+        so listeners can patch their caches instead of rebuilding them.
+        """
+        self.generation += 1
+        self.updated_objects = updated_objects or []
+        self._record_names()
+        for listener in list(self._listeners):
+            try:
+                listener(reason)
+            except Exception as e:
+                print(f"Error in scene change listener: {e}")
+
+    def is_current(self, generation):
+        """True if data built at generation is still valid"""
+        # Without handlers nothing tells us about changes, so nothing can be trusted
+        return self._installed and generation == self.generation
+
+    #------------------------------------------------------------------------------
+    def _record_names(self):
+        """Remember every object's name so the first rename after a bump is detected too"""
+        self._names_by_pointer = {obj.as_pointer(): obj.name for obj in bpy.data.objects}
+
+    def _handle_depsgraph_update(self, depsgraph):
+        object_count = len(bpy.data.objects)
+        if object_count != self._object_count:
+            self._object_count = object_count
+            added = [update.id.original for update in depsgraph.updates if isinstance(update.id, bpy.types.Object)]
+            self.bump('objects', added)
+            return
+
+        if depsgraph.id_type_updated('COLLECTION'):
+            self.bump('collection')
+            return
+
+        # Renames: only look at the objects in this update, so transforms stay O(updates)
+        for update in depsgraph.updates:
+            if update.is_updated_transform or update.is_updated_geometry:
+                continue
+            if not isinstance(update.id, bpy.types.Object):
+                continue
+            obj = update.id.original
+            pointer = obj.as_pointer()
+            previous_name = self._names_by_pointer.get(pointer)
+            self._names_by_pointer[pointer] = obj.name
+            if previous_name is not None and previous_name != obj.name:
+                self.bump('rename', [obj])
+                return
+
+@persistent
+def _on_depsgraph_update_post(scene, depsgraph=None):
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    try:
+        SceneEvents.get_instance()._handle_depsgraph_update(depsgraph)
+    except Exception as e:
+        print(f"Error tracking scene changes: {e}")
+
+@persistent
+def _on_load_post(*args):
+    events = SceneEvents.get_instance()
+    events._object_count = len(bpy.data.objects)
+    events.bump('load')
+
+def scene_generation():
+    """Current scene generation, installing the handlers on first use"""
+    events = SceneEvents.get_instance()
+    events.install()
+    return events.generation
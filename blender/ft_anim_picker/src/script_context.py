@@ -0,0 +1,24 @@
+import contextvars
+from contextlib import contextmanager
+
+#----------------------------------------------------------------------------------------------------------
+# SCRIPT EXECUTION CONTEXT
+#----------------------------------------------------------------------------------------------------------
+# The button running a script is published in a context variable for the duration of
+# execute_script_command. Tool functions called from the script (pb, button_appearance, ...) read
+# it to find their button and picker window instead of walking the call stack with inspect.
+
+_script_button = contextvars.ContextVar('ft_anim_picker_script_button', default=None)
+
+def current_script_button():
+    """The picker button whose script is executing, or None outside of button scripts"""
+    return _script_button.get()
+
+@contextmanager
+def script_button(button):
+    """Mark button as the script source for the duration of the with block (nesting restores the outer one)"""
+    token = _script_button.set(button)
+    try:
+        yield button
+    finally:
+        _script_button.reset(token)
@@ -4,6 +4,7 @@
 #from maya import OpenMayaUI as omui
 import bpy
 from functools import wraps
+from contextlib import contextmanager
 import re
 import json
 from typing import List, Dict, Optional, Tuple, Any
@@ -20,6 +21,9 @@ from . import custom_dialog as CD
 from . import blender_ui as UI
 from . import blender_main as MAIN
 from . import utils as UT
+from . import script_context as SC
+from . import blender_selection as BS
+from . import object_cache as OC
 
 class animation_tool_layout:
     def show_mirror_pose_dialog(self):
@@ -438,9 +442,8 @@ def mirror_selected_pose(mirror_mode: str = 'auto',
             # Get current namespace from picker window
             namespace = _get_current_namespace()
             
-            # Build object and mirror caches
-            object_cache = _build_object_cache(namespace)
-            mirror_cache = _build_mirror_cache(object_cache, namespace)
+            # Persistent mirror cache, patched from scene events instead of rebuilt per call
+            mirror_cache = OC.ObjectCache.get_instance().mirror_cache(namespace)
             
             # Get active object and context
             active_obj = bpy.context.view_layer.objects.active
@@ -472,6 +475,7 @@ def mirror_selected_pose(mirror_mode: str = 'auto',
             # Add summary message
             if results['success_count'] > 0:
                 results['messages'].append(f"Successfully mirrored {results['success_count']} items")
+                BS.push_undo("Mirror Pose")
             if results['error_count'] > 0:
                 results['messages'].append(f"Failed to mirror {results['error_count']} items")
                 
@@ -509,114 +513,6 @@ def _get_current_namespace():
     # Default to None if no namespace found
     return None
 
-def _build_object_cache(namespace: Optional[str]) -> Dict[str, Any]:
-    """Build optimized object lookup cache with namespace support."""
-    cache = {
-        'exact': {},
-        'namespace_prefix': {},
-        'namespace_suffix': {},
-        'partial': {},
-        'by_type': {'ARMATURE': [], 'MESH': [], 'OTHER': []}
-    }
-    
-    separators = ['_', '.']
-    
-    for obj in bpy.data.objects:
-        name = obj.name
-        
-        # Store exact name
-        cache['exact'][name] = obj
-        
-        # Store by type
-        obj_type = 'ARMATURE' if obj.type == 'ARMATURE' else ('MESH' if obj.type == 'MESH' else 'OTHER')
-        cache['by_type'][obj_type].append(obj)
-        
-        # Build namespace-aware cache
-        if namespace:
-            for sep in separators:
-                prefix_pattern = f"{namespace}{sep}"
-                if name.startswith(prefix_pattern):
-                    base_name = name[len(prefix_pattern):]
-                    cache['namespace_prefix'][base_name] = obj
-                
-                suffix_pattern = f"{sep}{namespace}"
-                if name.endswith(suffix_pattern):
-                    base_name = name[:-len(suffix_pattern)]
-                    cache['namespace_suffix'][base_name] = obj
-            
-            if name == namespace:
-                cache['namespace_prefix'][namespace] = obj
-                cache['namespace_suffix'][namespace] = obj
-        
-        # Build partial match cache
-        name_parts = name.lower().split('_') + name.lower().split('.')
-        for part in name_parts:
-            if part and len(part) > 2:
-                if part not in cache['partial']:
-                    cache['partial'][part] = []
-                cache['partial'][part].append(obj)
-    
-    return cache
-
-def _build_mirror_cache(object_cache: Dict[str, Any], namespace: Optional[str]) -> Dict[str, Any]:
-    """Build mirror object lookup cache with namespace awareness."""
-    mirror_cache = {}
-    
-    # Enhanced mirror patterns
-    mirror_patterns = [
-        # Suffix patterns
-        ('_L', '_R'), ('_l', '_r'), ('.L', '.R'), ('.l', '.r'),
-        ('Left', 'Right'), ('left', 'right'),
-        ('_Left', '_Right'), ('_left', '_right'),
-        ('.Left', '.Right'), ('.left', '.right'),
-        # Prefix patterns
-        ('L_', 'R_'), ('l_', 'r_'), ('L.', 'R.'), ('l.', 'r.'),
-        ('Left_', 'Right_'), ('left_', 'right_'),
-        ('Left.', 'Right.'), ('left.', 'right.')
-    ]
-    
-    # Check exact matches first
-    for obj_name, obj in object_cache['exact'].items():
-        for left_pat, right_pat in mirror_patterns:
-            mirror_name = None
-            
-            # Check suffix patterns
-            if obj_name.endswith(left_pat):
-                mirror_name = obj_name[:-len(left_pat)] + right_pat
-            elif obj_name.endswith(right_pat):
-                mirror_name = obj_name[:-len(right_pat)] + left_pat
-            # Check prefix patterns
-            elif obj_name.startswith(left_pat):
-                mirror_name = right_pat + obj_name[len(left_pat):]
-            elif obj_name.startswith(right_pat):
-                mirror_name = left_pat + obj_name[len(right_pat):]
-            # Check anywhere in name
-            elif left_pat in obj_name:
-                mirror_name = obj_name.replace(left_pat, right_pat)
-            elif right_pat in obj_name:
-                mirror_name = obj_name.replace(right_pat, left_pat)
-            
-            if mirror_name and mirror_name in object_cache['exact']:
-                mirror_cache[obj_name] = object_cache['exact'][mirror_name]
-                break
-    
-    # Check namespace-aware matches
-    if namespace:
-        for base_name, obj in object_cache['namespace_prefix'].items():
-            for left_pat, right_pat in mirror_patterns:
-                if left_pat in base_name:
-                    mirror_base = base_name.replace(left_pat, right_pat)
-                    if mirror_base in object_cache['namespace_prefix']:
-                        mirror_cache[base_name] = object_cache['namespace_prefix'][mirror_base]
-                        break
-                elif right_pat in base_name:
-                    mirror_base = base_name.replace(right_pat, left_pat)
-                    if mirror_base in object_cache['namespace_prefix']:
-                        mirror_cache[base_name] = object_cache['namespace_prefix'][mirror_base]
-                        break
-    
-    return mirror_cache
-
 def _mirror_selected_objects(mirror_cache: Dict[str, Any], 
                            axis: str, 
                            results: Dict[str, Any],
@@ -921,57 +817,47 @@ def _apply_bone_transform(bone: bpy.types.PoseBone, transform_data: Dict[str, An
 
 def _select_mirrored_items(results: Dict[str, Any], mirror_mode: str) -> None:
     """Select the mirrored objects/bones after mirroring."""
-    with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
-        try:
-            if mirror_mode == 'bones' and results['mirrored_bones']:
-                # Handle bone selection
-                armature_name = results['mirrored_bones'][0]['armature']
-                if armature_name in bpy.data.objects:
-                    armature_obj = bpy.data.objects[armature_name]
-                    bpy.context.view_layer.objects.active = armature_obj
-                    
-                    # Switch to pose mode if needed
-                    if bpy.context.mode != 'POSE':
-                        bpy.ops.object.mode_set(mode='POSE')
-                    
-                    # Clear selection and select only the result bones
-                    bpy.ops.pose.select_all(action='DESELECT')
-                    
-                    for bone_info in results['mirrored_bones']:
-                        mirrored_name = bone_info['mirrored']
-                        
-                        # If it's an in-place mirror, select the original bone
-                        if mirrored_name.endswith(' (in-place)'):
-                            original_name = bone_info['original']
-                            if original_name in armature_obj.pose.bones:
-                                armature_obj.pose.bones[original_name].bone.select = True
-                        else:
-                            # If it has a counterpart, select the counterpart
-                            if mirrored_name in armature_obj.pose.bones:
-                                armature_obj.pose.bones[mirrored_name].bone.select = True
-                    bpy.context.object.data.bones.active = bpy.context.object.data.bones[mirrored_name]
-                            
-            elif mirror_mode == 'objects' and results['mirrored_objects']:
-                # Handle object selection
-                bpy.ops.object.select_all(action='DESELECT')
+    try:
+        if mirror_mode == 'bones' and results['mirrored_bones']:
+            # Handle bone selection
+            armature_name = results['mirrored_bones'][0]['armature']
+            if armature_name in bpy.data.objects:
+                armature_obj = bpy.data.objects[armature_name]
+                bone_names = []
                 
-                for obj_info in results['mirrored_objects']:
-                    mirrored_name = obj_info['mirrored']
+                for bone_info in results['mirrored_bones']:
+                    mirrored_name = bone_info['mirrored']
                     
-                    # If it's an in-place mirror, select the original object
+                    # If it's an in-place mirror, select the original bone
                     if mirrored_name.endswith(' (in-place)'):
-                        original_name = obj_info['original']
-                        if original_name in bpy.data.objects:
-                            bpy.data.objects[original_name].select_set(True)
-                            bpy.context.view_layer.objects.active = bpy.data.objects[original_name]
+                        bone_names.append(bone_info['original'])
                     else:
                         # If it has a counterpart, select the counterpart
-                        if mirrored_name in bpy.data.objects:
-                            bpy.data.objects[mirrored_name].select_set(True)
-                            bpy.context.view_layer.objects.active = bpy.data.objects[mirrored_name]
+                        bone_names.append(mirrored_name)
+                
+                bone_names = [name for name in bone_names if name in armature_obj.pose.bones]
+                active_bone = (armature_obj, bone_names[-1]) if bone_names else None
+                BS.apply_selection(bones={armature_obj: bone_names}, active_bone=active_bone)
                         
-        except Exception as e:
-            results['messages'].append(f"Error selecting mirrored items: {str(e)}")
+        elif mirror_mode == 'objects' and results['mirrored_objects']:
+            # Handle object selection
+            objects = []
+            for obj_info in results['mirrored_objects']:
+                mirrored_name = obj_info['mirrored']
+                
+                # If it's an in-place mirror, select the original object
+                if mirrored_name.endswith(' (in-place)'):
+                    name = obj_info['original']
+                else:
+                    # If it has a counterpart, select the counterpart
+                    name = mirrored_name
+                if name in bpy.data.objects:
+                    objects.append(bpy.data.objects[name])
+            
+            BS.apply_selection(objects=objects, active_object=objects[-1] if objects else None)
+                    
+    except Exception as e:
+        results['messages'].append(f"Error selecting mirrored items: {str(e)}")
 #---------------------------------------------------------------------------------------------------------------
 @shortcuts(t='text', c='color', o='opacity', s='selectable', sb='source_button', tb='target_buttons')
 def button_appearance(text="", color="", opacity="", selectable="", source_button=None, target_buttons=None):
@@ -1033,82 +919,69 @@ def button_appearance(text="", color="", opacity="", selectable="", source_butto
     # Apply appearance changes to buttons
     modified_buttons = _apply_appearance_changes(buttons_to_modify, validated_params)
     
-    # Persist changes to database and update UI
+    # Persist changes to database and update UI (deferred to the end of an appearance_batch)
     if modified_buttons:
-        _persist_appearance_changes(modified_buttons, context, validated_params)
+        if _appearance_batch is not None:
+            _appearance_batch.add(context, modified_buttons)
+        else:
+            _persist_appearance_changes(modified_buttons, context, validated_params)
+
+def _find_picker_widget(source_button=None):
+    """Picker window containing source_button, else the first open picker window (None if there is none)"""
+    current_widget = source_button
+    while current_widget:
+        if current_widget.__class__.__name__ == 'BlenderAnimPickerWindow':
+            return current_widget
+        current_widget = current_widget.parent()
+    
+    manager = MAIN.PickerWindowManager.get_instance()
+    if manager and manager._picker_widgets:
+        return manager._picker_widgets[0]
+    return None
+
+def _find_canvas(picker_widget):
+    """Canvas of a picker window's current tab, or None"""
+    if hasattr(picker_widget, 'canvas'):
+        return picker_widget.canvas
+    if hasattr(picker_widget, 'tab_system') and picker_widget.tab_system.current_tab:
+        current_tab = picker_widget.tab_system.current_tab
+        if current_tab in picker_widget.tab_system.tabs:
+            return picker_widget.tab_system.tabs[current_tab]['canvas']
+    
+    for child in picker_widget.findChildren(QtWidgets.QWidget):
+        if hasattr(child, 'buttons') and isinstance(child.buttons, list):
+            return child
+    return None
+
+def _picker_buttons(picker_widget, canvas):
+    """All buttons of the canvas, or of the picker window's children if there is no canvas"""
+    if canvas and hasattr(canvas, 'buttons') and canvas.buttons:
+        return list(canvas.buttons)
+    return [child for child in picker_widget.findChildren(QtWidgets.QWidget)
+            if hasattr(child, 'mode') and hasattr(child, 'label') and hasattr(child, 'unique_id')]
 
 def _discover_execution_context(source_button):
     """
     Discover the execution context including source button, picker widget, and all available buttons.
     
+    The source button defaults to the button whose script is running (see script_context).
+    
     Returns:
         dict: Context containing 'source_button', 'picker_widget', 'all_buttons', and 'canvas'
         None: If no valid context could be established
     """
-    # Import needed modules
-    from . import blender_main as MAIN
-    import inspect
-    
-    # Detect source button from call stack if not provided
     if source_button is None:
-        for frame_info in inspect.stack():
-            if frame_info.function == 'execute_script_command':
-                if hasattr(frame_info, 'frame') and 'self' in frame_info.frame.f_locals:
-                    potential_button = frame_info.frame.f_locals['self']
-                    if hasattr(potential_button, 'mode') and hasattr(potential_button, 'script_data'):
-                        source_button = potential_button
-                        break
-    
-    # Find the target picker widget
-    picker_widget = None
-    if source_button:
-        # Walk up the widget hierarchy to find the picker window
-        current_widget = source_button
-        while current_widget:
-            if current_widget.__class__.__name__ == 'BlenderAnimPickerWindow':
-                picker_widget = current_widget
-                break
-            current_widget = current_widget.parent()
-    
-    # Fallback to manager approach if no picker widget found
-    if not picker_widget:
-        manager = MAIN.PickerWindowManager.get_instance()
-        if manager and manager._picker_widgets:
-            picker_widget = manager._picker_widgets[0]
+        source_button = SC.current_script_button()
     
+    picker_widget = _find_picker_widget(source_button)
     if not picker_widget:
         return None
     
-    # Get canvas from picker widget
-    canvas = None
-    if hasattr(picker_widget, 'canvas'):
-        canvas = picker_widget.canvas
-    elif hasattr(picker_widget, 'tab_system') and picker_widget.tab_system.current_tab:
-        current_tab = picker_widget.tab_system.current_tab
-        if current_tab in picker_widget.tab_system.tabs:
-            canvas = picker_widget.tab_system.tabs[current_tab]['canvas']
-    
-    if not canvas:
-        for child in picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'buttons') and isinstance(child.buttons, list):
-                canvas = child
-                break
-    
-    # Get all buttons from the picker widget
-    all_buttons = []
-    if canvas and hasattr(canvas, 'buttons'):
-        all_buttons.extend(canvas.buttons)
-    
-    # Fallback: search for buttons in all child widgets
-    if not all_buttons:
-        for child in picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'mode') and hasattr(child, 'label') and hasattr(child, 'unique_id'):
-                all_buttons.append(child)
-    
+    canvas = _find_canvas(picker_widget)
     return {
         'source_button': source_button,
         'picker_widget': picker_widget,
-        'all_buttons': all_buttons,
+        'all_buttons': _picker_buttons(picker_widget, canvas),
         'canvas': canvas
     }
 
@@ -1319,7 +1192,7 @@ def _persist_appearance_changes(modified_buttons, context, validated_params):
                     "assigned_objects": getattr(button, 'assigned_objects', []),
                     "mode": getattr(button, 'mode', 'select'),
                     "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-                    "pose_data": getattr(button, 'pose_data', {}),
+                    "pose_data": button.pose_document_data(),
                     "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                     "shape_type": getattr(button, 'shape_type', 'rect'),
                     "svg_path_data": getattr(button, 'svg_path_data', None),
@@ -1370,6 +1243,49 @@ def _persist_appearance_changes(modified_buttons, context, validated_params):
     # widget_name = getattr(picker_widget, 'objectName', lambda: 'Unknown')()
     # print(f"Updated {len(modified_buttons)} button(s) in widget '{widget_name}': {', '.join(changes)}")
     # print("Changes have been saved to the database.")
+
+class _AppearanceBatch:
+    """Buttons modified by button_appearance calls inside an appearance_batch, per picker window"""
+    def __init__(self):
+        self.pending = {}  # id(picker widget) -> (context, {button: None})
+
+    def add(self, context, buttons):
+        _, pending_buttons = self.pending.setdefault(id(context['picker_widget']), (context, {}))
+        pending_buttons.update(dict.fromkeys(buttons))
+
+    def flush(self):
+        for context, buttons in self.pending.values():
+            _persist_appearance_changes(list(buttons), context, None)
+        self.pending.clear()
+
+_appearance_batch = None
+
+@contextmanager
+def appearance_batch():
+    """
+    Coalesce button_appearance calls into one data write and one repaint per picker window.
+    
+    Buttons change as each call is made (so pb() sees the new values right away); saving the
+    picker data and refreshing the canvas happen once when the outermost batch ends. Button
+    scripts already run inside a batch.
+    
+    Example:
+        with TF.appearance_batch():
+            for button_id in ["arm_L", "arm_R", "leg_L", "leg_R"]:
+                TF.button_appearance(color="#FF0000", target_buttons=button_id)
+    """
+    global _appearance_batch
+    if _appearance_batch is not None:
+        # Nested batch: the outermost one persists
+        yield _appearance_batch
+        return
+    
+    _appearance_batch = _AppearanceBatch()
+    try:
+        yield _appearance_batch
+    finally:
+        batch, _appearance_batch = _appearance_batch, None
+        batch.flush()
 #---------------------------------------------------------------------------------------------------------------
 def tool_tip(tooltip_header="", tooltip_text=""):
     """
@@ -1435,9 +1351,6 @@ def pb(button_ids):
             print("Button not found")
     """
     # Import needed modules
-    from . import blender_main as MAIN
-    import inspect
-    
     class PickerButtonCollection:
         """
         Collection object that provides access to multiple picker buttons.
@@ -1681,79 +1594,25 @@ def pb(button_ids):
     else:
         single_button = False
     
-    # Get the correct picker window instance
-    target_picker_widget = None
-    
-    # Try to find the picker widget from the current context
-    # First, check if we're being called from a script and can find the source button
-    script_source_button = None
-    for frame_info in inspect.stack():
-        if frame_info.function == 'execute_script_command':
-            if hasattr(frame_info, 'frame') and 'self' in frame_info.frame.f_locals:
-                potential_button = frame_info.frame.f_locals['self']
-                if hasattr(potential_button, 'mode') and hasattr(potential_button, 'script_data'):
-                    script_source_button = potential_button
-                    break
-    
-    if script_source_button:
-        # Find the picker widget that contains this button
-        current_widget = script_source_button
-        while current_widget:
-            if current_widget.__class__.__name__ == 'BlenderAnimPickerWindow':
-                target_picker_widget = current_widget
-                break
-            current_widget = current_widget.parent()
-    
-    # If we couldn't find the specific window, fall back to manager approach
+    # The picker window comes from the button running the script (see script_context)
+    target_picker_widget = _find_picker_widget(SC.current_script_button())
     if not target_picker_widget:
-        manager = MAIN.PickerWindowManager.get_instance()
-        if not manager or not manager._picker_widgets:
-            print("No picker widgets found.")
-            return None
-        # Use the first available picker widget as fallback
-        target_picker_widget = manager._picker_widgets[0]
-    
-    # Get all buttons from the correct picker widget instance
-    all_buttons = []
-    
-    # Try different ways to access the canvas from the target picker widget
-    canvas = None
-    
-    # Method 1: Direct canvas attribute
-    if hasattr(target_picker_widget, 'canvas'):
-        canvas = target_picker_widget.canvas
-    
-    # Method 2: Look for canvas in tab system
-    elif hasattr(target_picker_widget, 'tab_system'):
-        if target_picker_widget.tab_system.current_tab:
-            current_tab = target_picker_widget.tab_system.current_tab
-            if current_tab in target_picker_widget.tab_system.tabs:
-                canvas = target_picker_widget.tab_system.tabs[current_tab]['canvas']
-    
-    # Method 3: Search for canvas in children of the target widget only
-    if not canvas:
-        for child in target_picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'buttons') and isinstance(child.buttons, list):
-                canvas = child
-                break
-    
-    # If we found a canvas, get its buttons
-    if canvas and hasattr(canvas, 'buttons'):
-        all_buttons.extend(canvas.buttons)
-    
-    # If we still don't have any buttons from the target widget, search more thoroughly
-    if not all_buttons:
-        for child in target_picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'mode') and hasattr(child, 'label') and hasattr(child, 'unique_id'):
-                all_buttons.append(child)
+        print("No picker widgets found.")
+        return None
+    canvas = _find_canvas(target_picker_widget)
     
-    # Find buttons with matching IDs
+    # Find buttons with matching IDs through the canvas id index
     found_buttons = []
-    for button_id in button_ids:
-        for button in all_buttons:
-            if hasattr(button, 'unique_id') and button.unique_id == button_id:
+    if canvas is not None and hasattr(canvas, 'button_by_id'):
+        for button_id in button_ids:
+            button = canvas.button_by_id(button_id)
+            if button is not None:
                 found_buttons.append(button)
-                break
+    else:
+        buttons_by_id = {}
+        for button in reversed(_picker_buttons(target_picker_widget, canvas)):
+            buttons_by_id[getattr(button, 'unique_id', None)] = button
+        found_buttons = [buttons_by_id[button_id] for button_id in button_ids if button_id in buttons_by_id]
     
     # Handle results based on input type
     if single_button:
@@ -1778,60 +1637,10 @@ def list_buttons():
     Returns:
         list: List of dictionaries containing button information
     """
-    from . import blender_main as MAIN
-    import inspect
-    
-    # Get picker widget (reusing logic from pb function)
-    target_picker_widget = None
-    script_source_button = None
-    
-    for frame_info in inspect.stack():
-        if frame_info.function == 'execute_script_command':
-            if hasattr(frame_info, 'frame') and 'self' in frame_info.frame.f_locals:
-                potential_button = frame_info.frame.f_locals['self']
-                if hasattr(potential_button, 'mode') and hasattr(potential_button, 'script_data'):
-                    script_source_button = potential_button
-                    break
-    
-    if script_source_button:
-        current_widget = script_source_button
-        while current_widget:
-            if current_widget.__class__.__name__ == 'BlenderAnimPickerWindow':
-                target_picker_widget = current_widget
-                break
-            current_widget = current_widget.parent()
-    
+    target_picker_widget = _find_picker_widget(SC.current_script_button())
     if not target_picker_widget:
-        manager = MAIN.PickerWindowManager.get_instance()
-        if not manager or not manager._picker_widgets:
-            return []
-        target_picker_widget = manager._picker_widgets[0]
-    
-    # Get all buttons
-    all_buttons = []
-    canvas = None
-    
-    if hasattr(target_picker_widget, 'canvas'):
-        canvas = target_picker_widget.canvas
-    elif hasattr(target_picker_widget, 'tab_system'):
-        if target_picker_widget.tab_system.current_tab:
-            current_tab = target_picker_widget.tab_system.current_tab
-            if current_tab in target_picker_widget.tab_system.tabs:
-                canvas = target_picker_widget.tab_system.tabs[current_tab]['canvas']
-    
-    if not canvas:
-        for child in target_picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'buttons') and isinstance(child.buttons, list):
-                canvas = child
-                break
-    
-    if canvas and hasattr(canvas, 'buttons'):
-        all_buttons.extend(canvas.buttons)
-    
-    if not all_buttons:
-        for child in target_picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'mode') and hasattr(child, 'label') and hasattr(child, 'unique_id'):
-                all_buttons.append(child)
+        return []
+    all_buttons = _picker_buttons(target_picker_widget, _find_canvas(target_picker_widget))
     
     # Return button info
     button_info = []
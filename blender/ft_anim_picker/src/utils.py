@@ -6,8 +6,10 @@ from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtGui import QColor
 from PySide6.QtCore import QTimer, QPropertyAnimation, QEasingCurve
 from shiboken6 import wrapInstance
+import os
 
-    
+# Extra diagnostics (resolution timings, cache status) in button tooltips
+DEBUG = os.environ.get('FT_ANIM_PICKER_DEBUG', '0') == '1'
 
 def undoable(func):
     @wraps(func)
@@ -69,6 +71,34 @@ def rgba_value(hex_color, factor, alpha=None):
     color.setRgbF(r, g, b, a)
     return color.name(QColor.HexArgb)
 
+def parse_frame_list(text):
+    """Sorted unique frames from a frame list such as "1, 12, 20-40, 50-100x10" (start-end[xstep]).
+
+    Raises ValueError for malformed entries.
+    """
+    frames = set()
+    for part in text.replace(';', ',').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        step = 1.0
+        if 'x' in part:
+            part, step_text = part.split('x', 1)
+            step = float(step_text)
+            if step <= 0:
+                raise ValueError(f"Frame step must be positive: {step_text}")
+        # A leading '-' is a negative frame, not a range separator
+        separator = part.find('-', 1)
+        if separator == -1:
+            frames.add(float(part))
+            continue
+        start, end = float(part[:separator]), float(part[separator + 1:])
+        if end < start:
+            start, end = end, start
+        count = int((end - start) / step + 1e-6)
+        frames.update(start + index * step for index in range(count + 1))
+    return sorted(frames)
+
 def get_icon(icon_name, opacity=1.0, size=24):
     package_dir = Path(__file__).parent
     icon_path = package_dir / 'ft_picker_icons' / icon_name
@@ -0,0 +1,402 @@
+import io
+import time
+import cProfile
+import pstats
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    from PySide6 import QtWidgets, QtCore, QtGui
+    from PySide6.QtCore import QTimer
+except ImportError:
+    from PySide2 import QtWidgets, QtCore, QtGui
+    from PySide2.QtCore import QTimer
+
+from . import utils as UT
+
+#----------------------------------------------------------------------------------------------------------
+# BUTTON PROFILER
+#----------------------------------------------------------------------------------------------------------
+# Script and pose buttons run through ButtonProfiler.measure, which times each run and keeps rolling
+# stats per button id (run count, mean and p95 of the last ROLLING_RUNS runs, last error). With
+# capture_profiles on, every run is also recorded with cProfile and the report of the button's last
+# run is kept. The SlowestButtonsPanel lists buttons by mean time, and buttons can draw their mean
+# time as a badge on the canvas.
+
+ROLLING_RUNS = 50          # Runs kept per button for mean/p95
+PROFILE_REPORT_LINES = 20  # Functions kept in a captured cProfile report
+
+class ButtonStats:
+    """Rolling timing stats of one button"""
+    def __init__(self, button_id, label, kind):
+        self.button_id = button_id
+        self.label = label
+        self.kind = kind
+        self.count = 0
+        self.durations = deque(maxlen=ROLLING_RUNS)  # ms
+        self.last_ms = 0.0
+        self.last_error = None
+        self.last_profile = None
+
+    def add(self, ms, error=None):
+        self.count += 1
+        self.durations.append(ms)
+        self.last_ms = ms
+        self.last_error = error
+
+    @property
+    def mean(self):
+        return sum(self.durations) / len(self.durations) if self.durations else 0.0
+
+    @property
+    def p95(self):
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+class ButtonProfiler:
+    """Session-wide execution stats of script and pose buttons"""
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = ButtonProfiler()
+        return cls._instance
+
+    def __init__(self):
+        self._stats = {}  # button id -> ButtonStats
+        self._listeners = []
+        self.capture_profiles = False
+        self.show_badges = False
+
+    @contextmanager
+    def measure(self, button, kind):
+        """Time the with block as a run of button ('script' or 'pose'). Exceptions are recorded and re-raised"""
+        profile = None
+        if self.capture_profiles:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                profile = None  # Another profiler is active
+
+        error = None
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            raise
+        finally:
+            ms = (time.perf_counter() - start) * 1000.0
+            if profile is not None:
+                profile.disable()
+            self._record(button, kind, ms, error, profile)
+
+    def _record(self, button, kind, ms, error, profile):
+        stats = self._stats.get(button.unique_id)
+        if stats is None:
+            stats = ButtonStats(button.unique_id, button.label, kind)
+            self._stats[button.unique_id] = stats
+        stats.label = button.label
+        stats.kind = kind
+        stats.add(ms, error)
+        if profile is not None:
+            stats.last_profile = self._profile_report(profile)
+
+        if self.show_badges:
+            button.update()
+        if UT.DEBUG:
+            print(f"{kind.capitalize()} button '{button.label}' ran in {ms:.2f}ms"
+                  f" (mean {stats.mean:.2f}ms, p95 {stats.p95:.2f}ms over {len(stats.durations)} runs)")
+        self._notify()
+
+    def _profile_report(self, profile):
+        stream = io.StringIO()
+        pstats.Stats(profile, stream=stream).sort_stats('cumulative').print_stats(PROFILE_REPORT_LINES)
+        return stream.getvalue()
+
+    def stats(self, button_id):
+        """ButtonStats of a button, or None if it has not run yet"""
+        return self._stats.get(button_id)
+
+    def slowest(self, limit=None):
+        """ButtonStats sorted by mean time, slowest first"""
+        ordered = sorted(self._stats.values(), key=lambda stats: stats.mean, reverse=True)
+        return ordered[:limit] if limit else ordered
+
+    def clear(self):
+        self._stats.clear()
+        self._notify()
+
+    def __len__(self):
+        return len(self._stats)
+
+    def add_listener(self, listener):
+        """Register a callable() notified after every recorded run"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self):
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"Error in button profiler listener: {e}")
+
+def measure(button, kind):
+    """ButtonProfiler.measure of the session profiler"""
+    return ButtonProfiler.get_instance().measure(button, kind)
+
+def format_ms(ms):
+    return f"{ms:.1f}ms" if ms < 10 else f"{ms:.0f}ms"
+
+def draw_badge(painter, button, rect):
+    """Draw the button's mean run time in the top left corner of rect (when badges are enabled)"""
+    profiler = ButtonProfiler.get_instance()
+    if not profiler.show_badges:
+        return
+    stats = profiler.stats(button.unique_id)
+    if stats is None:
+        return
+
+    font = QtGui.QFont()
+    font.setPixelSize(9)
+    painter.setFont(font)
+    text = format_ms(stats.mean)
+    text_rect = QtCore.QRectF(painter.fontMetrics().boundingRect(text)).adjusted(-3, -1, 3, 1)
+    text_rect.moveTopLeft(QtCore.QPointF(rect.left() + 2, rect.top() + 2))
+
+    painter.setPen(QtCore.Qt.NoPen)
+    painter.setBrush(QtGui.QColor(200, 40, 40, 220) if stats.last_error else QtGui.QColor(20, 20, 20, 200))
+    painter.drawRoundedRect(text_rect, 3, 3)
+    painter.setPen(QtGui.QColor('#eeeeee'))
+    painter.drawText(text_rect, QtCore.Qt.AlignCenter, text)
+
+#----------------------------------------------------------------------------------------------------------
+class SlowestButtonsPanel(QtWidgets.QWidget):
+    """Non-modal panel listing buttons by mean run time, with the last error/profile of the chosen one"""
+    def __init__(self, canvas, parent=None):
+        super(SlowestButtonsPanel, self).__init__(parent or canvas.window())
+        self.setWindowFlags(QtCore.Qt.Tool | QtCore.Qt.FramelessWindowHint)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+        self.setAttribute(QtCore.Qt.WA_ShowWithoutActivating)
+        self.canvas = canvas
+        self.profiler = ButtonProfiler.get_instance()
+
+        # Setup main layout
+        self.main_layout = QtWidgets.QVBoxLayout(self)
+        self.main_layout.setContentsMargins(4, 4, 4, 4)
+        self.main_layout.setSpacing(4)
+
+        # Create main frame
+        self.frame = QtWidgets.QFrame()
+        self.frame.setFixedWidth(300)
+        self.frame.setStyleSheet("""
+            QFrame {
+                background-color: rgba(36, 36, 36, .9);
+                border: 1px solid #444444;
+                border-radius: 4px;
+            }
+        """)
+        self.frame_layout = QtWidgets.QVBoxLayout(self.frame)
+        self.frame_layout.setContentsMargins(6, 6, 6, 6)
+        self.frame_layout.setSpacing(6)
+
+        # Title bar with draggable area and close button
+        self.title_bar = QtWidgets.QWidget()
+        self.title_bar.setFixedHeight(30)
+        self.title_bar.setStyleSheet("background: rgba(30, 30, 30, .9); border: none; border-radius: 3px;")
+        title_layout = QtWidgets.QHBoxLayout(self.title_bar)
+        title_layout.setContentsMargins(6, 6, 6, 6)
+        title_layout.setSpacing(6)
+
+        self.title_label = QtWidgets.QLabel("Slowest Buttons")
+        self.title_label.setStyleSheet("color: #dddddd; background: transparent;")
+        title_layout.addWidget(self.title_label)
+
+        self.close_button = QtWidgets.QPushButton("✕")
+        self.close_button.setFixedSize(16, 16)
+        self.close_button.setStyleSheet("""
+            QPushButton {
+                background-color: rgba(200, 0, 0, 0.6);
+                color: #ff9393;
+                border: none;
+                border-radius: 2px;
+                padding: 0px 0px 2px 0px;
+            }
+            QPushButton:hover {
+                background-color: rgba(255, 0, 0, 0.6);
+            }
+        """)
+        title_layout.addWidget(self.close_button)
+
+        # Slowest buttons list
+        self.stats_list = QtWidgets.QListWidget()
+        self.stats_list.setFixedHeight(180)
+        self.stats_list.setStyleSheet("""
+            QListWidget {
+                background-color: #1e1e1e;
+                border: none;
+                border-radius: 2px;
+                color: #dddddd;
+                outline: 0;
+            }
+            QListWidget::item {
+                padding: 3px;
+            }
+            QListWidget::item:selected {
+                background-color: #2c4759;
+            }
+        """)
+
+        # Last error / cProfile report of the selected button
+        self.details_text = QtWidgets.QPlainTextEdit()
+        self.details_text.setReadOnly(True)
+        self.details_text.setFixedHeight(120)
+        self.details_text.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.details_text.setPlaceholderText("Select a button to see its last error and profile")
+        self.details_text.setStyleSheet("background-color: #1e1e1e; color: #aaaaaa; border: none; border-radius: 2px; font-family: Consolas, monospace; font-size: 10px;")
+
+        # Options
+        options_layout = QtWidgets.QHBoxLayout()
+        checkbox_style = "QCheckBox { color: #dddddd; background: transparent; border: none; }"
+        self.badges_checkbox = QtWidgets.QCheckBox("Canvas Badges")
+        self.badges_checkbox.setStyleSheet(checkbox_style)
+        self.badges_checkbox.setChecked(self.profiler.show_badges)
+        self.profile_checkbox = QtWidgets.QCheckBox("cProfile")
+        self.profile_checkbox.setStyleSheet(checkbox_style)
+        self.profile_checkbox.setToolTip("Capture a cProfile report of every run (adds overhead)")
+        self.profile_checkbox.setChecked(self.profiler.capture_profiles)
+
+        self.clear_button = QtWidgets.QPushButton("Clear")
+        self.clear_button.setFixedHeight(20)
+        self.clear_button.setStyleSheet("""
+            QPushButton {
+                background-color: #494949;
+                color: white;
+                border: none;
+                border-radius: 3px;
+                padding: 0px 6px;
+            }
+            QPushButton:hover {
+                background-color: #5a5a5a;
+            }
+        """)
+        options_layout.addWidget(self.badges_checkbox)
+        options_layout.addWidget(self.profile_checkbox)
+        options_layout.addStretch(1)
+        options_layout.addWidget(self.clear_button)
+
+        self.frame_layout.addWidget(self.title_bar)
+        self.frame_layout.addWidget(self.stats_list)
+        self.frame_layout.addWidget(self.details_text)
+        self.frame_layout.addLayout(options_layout)
+        self.main_layout.addWidget(self.frame)
+
+        # Refreshes are coalesced so a burst of runs costs one repaint
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh_list)
+
+        # Connect signals
+        self.close_button.clicked.connect(self.close)
+        self.clear_button.clicked.connect(self.profiler.clear)
+        self.badges_checkbox.toggled.connect(self.set_show_badges)
+        self.profile_checkbox.toggled.connect(self.set_capture_profiles)
+        self.stats_list.currentItemChanged.connect(self.show_details)
+        self.profiler.add_listener(self._on_profiler_changed)
+
+        # Window dragging
+        self.dragging = False
+        self.offset = None
+        self.title_bar.mousePressEvent = self.title_bar_mouse_press
+        self.title_bar.mouseMoveEvent = self.title_bar_mouse_move
+        self.title_bar.mouseReleaseEvent = self.title_bar_mouse_release
+
+        self.refresh_list()
+
+    def _on_profiler_changed(self):
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start(100)
+
+    def refresh_list(self):
+        current = self.stats_list.currentItem()
+        current_id = current.data(QtCore.Qt.UserRole) if current else None
+
+        self.stats_list.blockSignals(True)
+        self.stats_list.clear()
+        for stats in self.profiler.slowest():
+            text = (f"{stats.label or stats.button_id}  —  {format_ms(stats.mean)} avg, "
+                    f"p95 {format_ms(stats.p95)}  ×{stats.count}")
+            item = QtWidgets.QListWidgetItem(text)
+            item.setData(QtCore.Qt.UserRole, stats.button_id)
+            if stats.last_error:
+                item.setForeground(QtGui.QColor('#ff7b7b'))
+            self.stats_list.addItem(item)
+            if stats.button_id == current_id:
+                self.stats_list.setCurrentItem(item)
+        self.stats_list.blockSignals(False)
+
+        self.title_label.setText(f"Slowest Buttons ({len(self.profiler)})")
+        self.show_details(self.stats_list.currentItem())
+        if self.profiler.show_badges:
+            self._update_canvas_buttons()
+
+    def show_details(self, item, previous=None):
+        stats = self.profiler.stats(item.data(QtCore.Qt.UserRole)) if item else None
+        if stats is None:
+            self.details_text.clear()
+            return
+        lines = [f"{stats.label or stats.button_id} ({stats.kind}): {stats.count} runs, last {format_ms(stats.last_ms)}"]
+        if stats.last_error:
+            lines.append(f"Last error: {stats.last_error}")
+        if stats.last_profile:
+            lines.append(stats.last_profile.strip())
+        self.details_text.setPlainText('\n'.join(lines))
+
+    def set_show_badges(self, enabled):
+        self.profiler.show_badges = enabled
+        self._update_canvas_buttons()
+
+    def set_capture_profiles(self, enabled):
+        self.profiler.capture_profiles = enabled
+
+    def _update_canvas_buttons(self):
+        for button in getattr(self.canvas, 'buttons', []):
+            button.update()
+
+    def position_window(self):
+        main_window = self.canvas.window()
+        global_pos = main_window.mapToGlobal(main_window.rect().topRight())
+        self.move(global_pos + QtCore.QPoint(10, 0))
+
+    # Window dragging methods
+    def title_bar_mouse_press(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            self.dragging = True
+            self.offset = event.globalPos() - self.pos()
+
+    def title_bar_mouse_move(self, event):
+        if self.dragging and event.buttons() == QtCore.Qt.LeftButton:
+            self.move(event.globalPos() - self.offset)
+
+    def title_bar_mouse_release(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            self.dragging = False
+
+    def showEvent(self, event):
+        self.profiler.add_listener(self._on_profiler_changed)
+        self.refresh_list()
+        super().showEvent(event)
+
+    def closeEvent(self, event):
+        self.profiler.remove_listener(self._on_profiler_changed)
+        super().closeEvent(event)
+        UT.maya_main_window().activateWindow()
@@ -4,6 +4,8 @@ from collections import OrderedDict
 import time
 from threading import Timer
 
+from . import pose_library as PL
+
 try:
     from PySide6 import QtWidgets
 except ImportError:
@@ -508,6 +510,8 @@ class PickerDataManager:
     def _perform_save(cls, data):
         """Actually perform the save operation"""
         try:
+            # Poses are kept in the pose library; the document only stores references
+            PL.externalize_pose_data(data)
             cmds.setAttr(f'defaultObjectSet.{cls.ATTR_NAME}', json.dumps(data), type='string')
             cls._last_save_time = time.time()
             cls._pending_updates = False
@@ -0,0 +1,190 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+#----------------------------------------------------------------------------------------------------------
+# IK/FK MATCH BAKING
+#----------------------------------------------------------------------------------------------------------
+# Matching over a frame range reads the chains at every frame through an MDGContext (with an
+# MDGContextGuard active, plug reads evaluate the graph at that time) instead of moving the
+# current time. Matrices come straight from the worldMatrix/parentMatrix plugs and the pole
+# vector position is plain vector math, so no temporary locators or matchTransform calls are
+# needed. All frames are computed first, then the keys are written in bulk at explicit times: each
+# channel is split into runs of frames holding the same value, and every run (shared by all
+# channels with the same run) is one setKeyframe call. Values are kept in internal units (cm,
+# radians) until they are keyed.
+
+POLE_DISTANCE = 0.25  # Pole offset from the mid joint, as a fraction of the chain length
+VALUE_TOLERANCE = 1e-6  # Consecutive baked values closer than this are keyed as one run
+
+def pole_vector_position(start, mid, end, distance=POLE_DISTANCE):
+    """World position of a pole vector control for a three joint chain (MVector or MPoint positions)"""
+    start, mid, end = om.MVector(start), om.MVector(mid), om.MVector(end)
+
+    start_to_end = (end - start).normal()
+    projection = start_to_end * ((mid - start) * start_to_end)
+    pole_direction = (mid - (start + projection)).normal()
+
+    chain_length = (mid - start).length() + (end - mid).length()
+    return mid + pole_direction * chain_length * distance
+
+class _Node:
+    """Transform plugs of one node, read under whatever DG context is active"""
+    def __init__(self, name):
+        selection = om.MSelectionList()
+        selection.add(name)
+        self.dag_path = selection.getDagPath(0)
+        self.path = self.dag_path.fullPathName()
+        self.fn = om.MFnDependencyNode(self.dag_path.node())
+        self.is_joint = self.dag_path.node().hasFn(om.MFn.kJoint)
+        self._world_matrix = self.fn.findPlug('worldMatrix', False).elementByLogicalIndex(0)
+        self._parent_matrix = self.fn.findPlug('parentMatrix', False).elementByLogicalIndex(0)
+
+    def plug(self, attr):
+        return self.fn.findPlug(attr, False)
+
+    def world_matrix(self):
+        return om.MFnMatrixData(self._world_matrix.asMObject()).matrix()
+
+    def parent_matrix(self):
+        return om.MFnMatrixData(self._parent_matrix.asMObject()).matrix()
+
+    def vector(self, attr):
+        return om.MVector(*(self.plug(f"{attr}{axis}").asDouble() for axis in 'XYZ'))
+
+    def world_position(self):
+        return om.MVector(om.MTransformationMatrix(self.world_matrix()).translation(om.MSpace.kWorld))
+
+def _rotation_matrix(matrix):
+    """Rotation part of a matrix, without scale or shear"""
+    return om.MTransformationMatrix(matrix).rotation(asQuaternion=True).asMatrix()
+
+def _evaluate_frames(frames, evaluate):
+    """{frame: evaluate()} with the graph evaluated at each frame"""
+    results = {}
+    unit = om.MTime.uiUnit()
+    for frame in frames:
+        with om.MDGContextGuard(om.MDGContext(om.MTime(frame, unit))):
+            results[frame] = evaluate()
+    return results
+
+def _translate_to(node, world_position):
+    """Translate values that put node's rotate pivot at world_position"""
+    world = node.world_matrix()
+    pivot = om.MPoint(node.vector('rotatePivot')) * world
+    world_delta = om.MVector(world_position) - om.MVector(pivot)
+    local_delta = world_delta * node.parent_matrix().inverse()
+    translate = node.vector('translate') + local_delta
+    return {'translateX': translate.x, 'translateY': translate.y, 'translateZ': translate.z}
+
+def ik_to_fk_values(ik_controls, fk_joints, frames, pole_distance=POLE_DISTANCE):
+    """Per frame translate values matching the IK controls to the FK chain.
+
+    Same layout as match_ik_to_fk: ik_controls[0] is the pole vector, ik_controls[1] the end
+    control, and fk_joints[2], [1], [0] the start, mid and end of the pole vector chain.
+    Returns {frame: {node path: {attr: value}}}.
+    """
+    pole, end_control = _Node(ik_controls[0]), _Node(ik_controls[1])
+    joints = [_Node(joint) for joint in fk_joints[:3]]
+
+    def evaluate():
+        positions = [joint.world_position() for joint in joints]
+        pole_position = pole_vector_position(positions[2], positions[1], positions[0], pole_distance)
+        return {
+            end_control.path: _translate_to(end_control, positions[2]),
+            pole.path: _translate_to(pole, pole_position),
+        }
+
+    return _evaluate_frames(frames, evaluate)
+
+def fk_to_ik_values(fk_controls, ik_joints, frames):
+    """Per frame rotate values matching each FK control's world rotation to its IK joint.
+
+    Controls parented under earlier controls of the list take their parent's new rotation into
+    account, so a whole FK chain is solved at once. Eulers follow each control's rotate order and
+    stay closest to the previous frame's solution to avoid flips.
+    Returns {frame: {node path: {attr: value}}}.
+    """
+    pairs = [(_Node(control), _Node(joint)) for control, joint in zip(fk_controls, ik_joints)]
+    previous = {}
+
+    def evaluate():
+        values = {}
+        desired_worlds = {}  # control path -> (evaluated world matrix, matched world matrix)
+        for control, joint in pairs:
+            world = control.world_matrix()
+            parent = control.parent_matrix()
+            local = world * parent.inverse()
+
+            # Re-parent onto the matched matrix of the nearest matched ancestor
+            ancestors = [path for path in desired_worlds if control.path.startswith(path + '|')]
+            if ancestors:
+                ancestor_world, ancestor_matched = desired_worlds[max(ancestors, key=len)]
+                parent = parent * ancestor_world.inverse() * ancestor_matched
+
+            local_rotation = _rotation_matrix(joint.world_matrix()) * _rotation_matrix(parent).inverse()
+
+            # Channel rotation: local rotation = rotateAxis * rotate * jointOrient
+            rotation = om.MEulerRotation(control.vector('rotateAxis')).asMatrix().inverse() * local_rotation
+            if control.is_joint:
+                rotation = rotation * om.MEulerRotation(control.vector('jointOrient')).asMatrix().inverse()
+
+            euler = om.MTransformationMatrix(rotation).rotation().reorder(control.plug('rotateOrder').asShort())
+            if control.path in previous:
+                euler.setToClosestSolution(previous[control.path])
+            previous[control.path] = om.MEulerRotation(euler)
+
+            matched_local = om.MTransformationMatrix(local)
+            matched_local.setRotation(om.MTransformationMatrix(local_rotation).rotation(asQuaternion=True))
+            desired_worlds[control.path] = (world, matched_local.asMatrix() * parent)
+
+            values[control.path] = {'rotateX': euler.x, 'rotateY': euler.y, 'rotateZ': euler.z}
+        return values
+
+    return _evaluate_frames(frames, evaluate)
+
+def key_values(values_by_frame):
+    """Key {frame: {node path: {attr: internal value}}} at explicit times. Returns the number of keys.
+
+    Locked channels are skipped. The current time is not changed.
+    """
+    distance_unit = om.MDistance.uiUnit()
+    angle_unit = om.MAngle.uiUnit()
+    locked = {}
+    channels = {}  # attribute path -> [(frame, ui value)]
+    for frame in sorted(values_by_frame):
+        for node_path, attr_values in values_by_frame[frame].items():
+            for attr, value in attr_values.items():
+                attr_path = f"{node_path}.{attr}"
+                if attr_path not in locked:
+                    locked[attr_path] = cmds.getAttr(attr_path, lock=True)
+                if locked[attr_path]:
+                    continue
+
+                if attr.startswith('translate'):
+                    value = om.MDistance(value).asUnits(distance_unit)
+                elif attr.startswith('rotate'):
+                    value = om.MAngle(value).asUnits(angle_unit)
+                channels.setdefault(attr_path, []).append((frame, value))
+
+    # Split every channel into runs of equal values; channels sharing a run are keyed together
+    attrs_by_run = {}  # (value, frames) -> [attribute paths]
+    for attr_path, frame_values in channels.items():
+        run_frames = []
+        run_value = None
+        for frame, value in frame_values:
+            if run_frames and abs(value - run_value) > VALUE_TOLERANCE:
+                attrs_by_run.setdefault((run_value, tuple(run_frames)), []).append(attr_path)
+                run_frames = []
+            if not run_frames:
+                run_value = value
+            run_frames.append(frame)
+        if run_frames:
+            attrs_by_run.setdefault((run_value, tuple(run_frames)), []).append(attr_path)
+
+    keys = 0
+    for (value, frames), attr_paths in attrs_by_run.items():
+        try:
+            keys += cmds.setKeyframe(attr_paths, time=list(frames), value=value) or 0
+        except Exception as e:
+            print(f"Error keying {', '.join(attr_paths)}: {e}")
+    return keys
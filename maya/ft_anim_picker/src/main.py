@@ -42,6 +42,11 @@ class PickerWindowManager:
         try:
             if widget in self._picker_widgets:
                 self._picker_widgets.remove(widget)
+            
+            # Stop listening to scene changes once the last picker is gone
+            if not self._picker_widgets:
+                from . import scene_events as SE
+                SE.SceneEvents.get_instance().remove()
         except Exception as e:
             print(f"Error removing widget: {e}")
     
@@ -10,6 +10,7 @@ import json
 from . import custom_dialog as CD
 from . import custom_button as CB
 from . import tool_functions as TF
+from . import mirror_table as MT
 from functools import partial
 from . import main as MAIN
 from . import utils as UT
@@ -768,6 +769,7 @@ class MirrorPreferencesWindow(QtWidgets.QWidget):
                     
                     # Set the attribute value
                     cmds.setAttr(f"{short_name}.mirrorPreference", prefs_json, type="string")
+                    MT.MirrorPreferenceStore.get_instance().set_preference(short_name, obj_prefs)
                     
                     # Update counterpart display for the first object
                     if obj_path == selected_objects[0]:
@@ -830,6 +832,7 @@ class MirrorPreferencesWindow(QtWidgets.QWidget):
             
             # Set the attribute value
             cmds.setAttr(f"{short_name}.mirrorPreference", prefs_json, type="string")
+            MT.MirrorPreferenceStore.get_instance().set_preference(short_name, obj_prefs)
         
         # Update UI state
         self.remove_button.setEnabled(True)
@@ -859,6 +862,7 @@ class MirrorPreferencesWindow(QtWidgets.QWidget):
             # Remove the attribute if it exists
             if cmds.attributeQuery("mirrorPreference", node=short_name, exists=True):
                 cmds.deleteAttr(f"{short_name}.mirrorPreference")
+            MT.MirrorPreferenceStore.get_instance().remove_preference(short_name)
         
         # Update UI state
         self.clear_preference_ui()
@@ -1005,6 +1009,7 @@ class MirrorPreferencesWindow(QtWidgets.QWidget):
                 short_name = selected_objects[0].split('|')[-1]
                 prefs_json = json.dumps(prefs)
                 cmds.setAttr(f"{short_name}.mirrorPreference", prefs_json, type="string")
+                MT.MirrorPreferenceStore.get_instance().set_preference(short_name, prefs)
             except Exception as e:
                 print(f"Error saving preferences on close: {e}")
                 
@@ -0,0 +1,266 @@
+import json
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from . import scene_events as SE
+from . import namespace_resolver as NR
+
+#----------------------------------------------------------------------------------------------------------
+# MIRROR TABLE
+#----------------------------------------------------------------------------------------------------------
+# Mirroring needs, per control, its counterpart, whether it is a center (self-mirroring) control and
+# the flip axes from its mirrorPreference. Those only change with the scene or the preferences, so
+# they are worked out once per (namespace, naming conventions) and kept in a MirrorTable: naming
+# patterns are scanned once per name and counterpart existence is checked in one OpenMaya pass.
+# mirrorPreference data comes from the MirrorPreferenceStore, which loads a whole namespace with a
+# single ls and keeps the parsed preferences. Tables are rebuilt when the scene generation changes;
+# preference edits go through the store, which updates its data and drops the tables.
+
+MIRROR_PREFERENCE_ATTR = 'mirrorPreference'
+FLIP_ATTRS = ('translateX', 'rotateY', 'rotateZ')  # Flipped by default when a control has no preference
+
+_mirror_tables = {}  # (namespace, naming conventions) -> MirrorTable
+
+def invalidate_mirror_tables():
+    """Drop all mirror tables (mirror preferences were added, edited or removed)"""
+    _mirror_tables.clear()
+
+def _on_scene_changed(reason):
+    if reason == 'scene':
+        invalidate_mirror_tables()
+        MirrorPreferenceStore.get_instance().clear()
+
+SE.SceneEvents.get_instance().add_listener(_on_scene_changed)
+
+def split_name(full_name):
+    """Return (namespace with trailing colon or '', short name) of a node name or path"""
+    leaf_name = full_name.split('|')[-1]
+    if ':' in leaf_name:
+        namespace, short_name = leaf_name.rsplit(':', 1)
+        return namespace + ':', short_name
+    return "", leaf_name
+
+def find_naming_counterpart(short_name, conventions):
+    """Mirror a short name through (left, right) patterns. Returns (counterpart, is_center)"""
+    for left_pattern, right_pattern in conventions:
+        if left_pattern in short_name:
+            return short_name.replace(left_pattern, right_pattern), False
+        if right_pattern in short_name:
+            return short_name.replace(right_pattern, left_pattern), False
+    return short_name, True
+
+#----------------------------------------------------------------------------------------------------------
+class MirrorPreferenceStore:
+    """Parsed mirrorPreference data per namespace.
+
+    All mirrorPreference attributes of a namespace are found with one cmds.ls('ns:*.mirrorPreference')
+    and read through OpenMaya plugs, then kept until the scene generation changes. The mirror
+    preferences window reports its edits with set_preference/remove_preference.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = MirrorPreferenceStore()
+        return cls._instance
+
+    def __init__(self):
+        self._namespaces = {}  # namespace -> {'generation': int, 'preferences': {short name: dict}}
+
+    def preferences(self, namespace):
+        """{short name: preference dict} for the nodes of a namespace ('' or 'ns:')"""
+        entry = self._namespaces.get(namespace)
+        if entry is None or not SE.SceneEvents.get_instance().is_current(entry['generation']):
+            generation = SE.scene_generation()
+            entry = {'generation': generation, 'preferences': self._load(namespace)}
+            self._namespaces[namespace] = entry
+        return entry['preferences']
+
+    def set_preference(self, node, preference):
+        """Record a preference written to node and drop everything resolved with the old one"""
+        namespace, short_name = split_name(node)
+        self._preferences_changed()
+        entry = self._namespaces.get(namespace)
+        if entry is not None:
+            entry['preferences'][short_name] = preference
+
+    def remove_preference(self, node):
+        namespace, short_name = split_name(node)
+        self._preferences_changed()
+        entry = self._namespaces.get(namespace)
+        if entry is not None:
+            entry['preferences'].pop(short_name, None)
+
+    def _preferences_changed(self):
+        """Drop the mirror tables and bump the scene generation so cached button counterparts are
+        resolved again. Store entries that were current are carried over, since they get the edit."""
+        events = SE.SceneEvents.get_instance()
+        current = [entry for entry in self._namespaces.values() if events.is_current(entry['generation'])]
+        events.bump('mirror_preference')
+        for entry in current:
+            entry['generation'] = events.generation
+        invalidate_mirror_tables()
+
+    def clear(self):
+        self._namespaces.clear()
+
+    def _load(self, namespace):
+        preferences = {}
+        selection = om.MSelectionList()
+        for plug_name in cmds.ls(f"{namespace}*.{MIRROR_PREFERENCE_ATTR}") or []:
+            try:
+                selection.add(plug_name)
+            except RuntimeError:
+                continue
+
+        for index in range(selection.length()):
+            try:
+                plug = selection.getPlug(index)
+                node_name = om.MFnDependencyNode(plug.node()).name()
+                preference = json.loads(plug.asString())
+                if isinstance(preference, dict):
+                    preferences[split_name(node_name)[1]] = preference
+            except (RuntimeError, TypeError, ValueError) as e:
+                print(f"Error loading mirror preferences from {selection.getSelectionStrings(index)}: {e}")
+        return preferences
+
+def get_mirror_table(namespace, naming_conventions):
+    """Cached MirrorTable for a namespace ('' or 'ns:') and naming convention list"""
+    conventions = tuple((convention["left"], convention["right"]) for convention in naming_conventions)
+    key = (namespace, conventions)
+
+    table = _mirror_tables.get(key)
+    if table is None or not SE.SceneEvents.get_instance().is_current(table.generation):
+        table = MirrorTable(namespace, conventions)
+        _mirror_tables[key] = table
+    return table
+
+class MirrorTable:
+    """Mirror entries of the controls of one namespace, built on first lookup.
+
+    An entry is {'target': counterpart node (the control itself for center controls, None if the
+    counterpart does not exist), 'center': bool, 'axes': {'translate': {axis: 'invert'|'none'},
+    'rotate': {...}}} where axes is empty for controls without a mirror preference.
+    """
+    def __init__(self, namespace, conventions):
+        self.namespace = namespace
+        self.conventions = conventions
+        self.generation = SE.scene_generation()
+        self._entries = {}  # short name -> entry
+        self._preferences = MirrorPreferenceStore.get_instance().preferences(namespace)
+
+        # short name -> short name of the control naming it as its counterpart
+        self._referenced_by = {}
+        for name, preference in self._preferences.items():
+            counterpart = preference.get("counterpart")
+            if counterpart:
+                self._referenced_by.setdefault(split_name(counterpart)[1], name)
+
+    def _full_name(self, short_name):
+        return f"{self.namespace}{short_name}" if self.namespace else short_name
+
+    def entries(self, short_names):
+        """Entries for short_names, building the missing ones in one batch"""
+        missing = [name for name in dict.fromkeys(short_names) if name not in self._entries]
+        if missing:
+            self._build_entries(missing)
+        return {name: self._entries[name] for name in short_names}
+
+    def entry(self, short_name):
+        return self.entries([short_name])[short_name]
+
+    def _build_entries(self, short_names):
+        naming = {name: find_naming_counterpart(name, self.conventions) for name in short_names}
+
+        resolved = {}
+        for name in short_names:
+            preference = self._preferences.get(name)
+            referencing = self._referenced_by.get(name)
+
+            if preference and preference.get("counterpart"):
+                counterpart, is_center = split_name(preference["counterpart"])[1], False
+            elif referencing:
+                counterpart, is_center = referencing, False
+            else:
+                counterpart, is_center = naming[name]
+
+            if not preference and referencing:
+                preference = self._preferences.get(referencing)
+            resolved[name] = (self._full_name(counterpart), is_center, preference)
+
+        existing = NR.existing_nodes([counterpart for counterpart, _, _ in resolved.values()])
+        for name, (counterpart, is_center, preference) in resolved.items():
+            if counterpart in existing:
+                target = counterpart
+            elif is_center:
+                target = self._full_name(name)
+            else:
+                target = None
+
+            axes = {}
+            if preference:
+                axes = {kind: preference.get(kind) or {} for kind in ("translate", "rotate")}
+            self._entries[name] = {'target': target, 'center': is_center, 'axes': axes}
+
+def should_flip_attribute(control_name, attr, custom_flip_controls):
+    """False if custom_flip_controls disables flipping attr on control_name"""
+    control_flips = custom_flip_controls.get(control_name)
+    if control_flips and attr in control_flips.get('attrs', []):
+        return control_flips.get('flip', {}).get(attr, True)
+    return True
+
+def mirror_attribute_values(entry, control_name, attr_values, custom_flip_controls):
+    """Mirrored copy of a control's attr_values for its counterpart.
+
+    Mirror preference axes take precedence, other attributes use the default flips. Center controls
+    only get the attributes that actually flip.
+    """
+    mirrored = {}
+    axes = entry['axes']
+    for attr, value in attr_values.items():
+        mirror_type = None
+        if attr.startswith('translate'):
+            mirror_type = axes.get('translate', {}).get(attr[-1].lower())
+        elif attr.startswith('rotate'):
+            mirror_type = axes.get('rotate', {}).get(attr[-1].lower())
+
+        uses_preference = mirror_type is not None
+        if uses_preference:
+            invert = mirror_type == "invert"
+        else:
+            invert = attr in FLIP_ATTRS and should_flip_attribute(control_name, attr, custom_flip_controls)
+
+        if entry['center'] and not (uses_preference or invert):
+            continue
+
+        if invert:
+            value = [-v for v in value] if isinstance(value, list) else -value
+        mirrored[attr] = value
+    return mirrored
+
+def mirror_pose(source_values, naming_conventions, custom_flip_controls=None):
+    """Mirror {source node: {attr: value}} to {counterpart node: {attr: mirrored value}}.
+
+    Sources whose counterpart does not exist are left out.
+    """
+    custom_flip_controls = custom_flip_controls or {}
+
+    by_namespace = {}
+    for source, attr_values in source_values.items():
+        namespace, short_name = split_name(source)
+        by_namespace.setdefault(namespace, []).append((short_name, attr_values))
+
+    mirrored_pose = {}
+    for namespace, items in by_namespace.items():
+        entries = get_mirror_table(namespace, naming_conventions).entries([short_name for short_name, _ in items])
+        for short_name, attr_values in items:
+            entry = entries[short_name]
+            if entry['target'] is None:
+                print(f"Mirrored object for {namespace}{short_name} does not exist")
+                continue
+
+            mirrored = mirror_attribute_values(entry, short_name, attr_values, custom_flip_controls)
+            if mirrored:
+                mirrored_pose.setdefault(entry['target'], {}).update(mirrored)
+    return mirrored_pose
@@ -0,0 +1,145 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+try:
+    from PySide6.QtCore import QTimer
+except ImportError:
+    from PySide2.QtCore import QTimer
+
+from . import scene_events as SE
+
+#----------------------------------------------------------------------------------------------------------
+# BATCH NAME RESOLUTION
+#----------------------------------------------------------------------------------------------------------
+# Resolution state that outlives PickerButton widgets. Canvas buttons are rebuilt on tab switches
+# and undo/redo, so per-button selection caches live here keyed by button id and are picked up
+# again by the new widgets. Each cache holds one entry per (kind, namespace), which keeps the
+# caches of previously used namespaces warm when switching a picker between references.
+
+_selection_caches = {}
+
+def selection_cache_for(button_id):
+    """Persistent selection cache dict for a button id (a private dict if the id is None)"""
+    if button_id is None:
+        return {}
+    return _selection_caches.setdefault(button_id, {})
+
+def clear_selection_caches():
+    _selection_caches.clear()
+
+def _on_scene_changed(reason):
+    # A new or reopened scene means new picker data; drop caches of buttons that no longer exist
+    if reason == 'scene':
+        clear_selection_caches()
+
+SE.SceneEvents.get_instance().add_listener(_on_scene_changed)
+
+def existing_nodes(names):
+    """Return the subset of names that exist, using one OpenMaya pass instead of objExists per name"""
+    existing = set()
+    selection = om.MSelectionList()
+    for name in names:
+        if not name:
+            continue
+        try:
+            selection.add(name)
+        except RuntimeError:
+            continue
+        existing.add(name)
+    return existing
+
+def nodes_from_uuids(uuids):
+    """Map UUID -> long node name for all live UUIDs with two cmds.ls calls.
+
+    Referenced copies of the same rig share UUIDs; the first node found wins, which matches
+    cmds.ls(uuid)[0] in the per-object resolver.
+    """
+    uuids = list({uuid for uuid in uuids if uuid})
+    if not uuids:
+        return {}
+
+    nodes = cmds.ls(uuids, long=True) or []
+    if not nodes:
+        return {}
+
+    node_uuids = cmds.ls(nodes, uuid=True) or []
+    found = {}
+    for uuid, node in zip(node_uuids, nodes):
+        found.setdefault(uuid, node)
+    return found
+
+#----------------------------------------------------------------------------------------------------------
+# NAMESPACE REGISTRY
+#----------------------------------------------------------------------------------------------------------
+class NamespaceRegistry:
+    """Top-level scene namespaces kept up to date from scene callbacks.
+
+    The picker windows read the list from here instead of querying namespaceInfo whenever the
+    dropdown is filled. Reference create/load/unload/remove, import, scene open/new, DAG node
+    add/remove and renames (namespace renames and moves arrive as node renames) mark the list
+    dirty and schedule one coalesced rescan. Listeners are called with the new list when it
+    actually changed.
+    """
+    _instance = None
+    EXCLUDED_NAMESPACES = ('UI', 'shared')
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = NamespaceRegistry()
+        return cls._instance
+
+    def __init__(self):
+        self._namespaces = None  # Sorted namespace list, None while dirty
+        self._notified_namespaces = None
+        self._listeners = []
+
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        SE.SceneEvents.get_instance().add_listener(self._on_scene_changed)
+
+    def namespaces(self):
+        """Dropdown entries ('None' first); only rescans the scene if the list is dirty"""
+        SE.scene_generation()  # Make sure the scene callbacks feeding this registry are installed
+        if self._namespaces is None or not SE.SceneEvents.get_instance().installed:
+            self._namespaces = self._scan()
+        return ['None'] + self._namespaces
+
+    def refresh(self):
+        """Rescan now and notify listeners if the namespace list changed"""
+        self._namespaces = self._scan()
+        if self._namespaces != self._notified_namespaces:
+            self._notified_namespaces = self._namespaces
+            self._notify()
+
+    def add_listener(self, listener):
+        """Register a callable(namespaces) notified when the namespace list changes"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _scan(self):
+        try:
+            namespaces = cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True) or []
+        except Exception as e:
+            print(f"Error listing namespaces: {e}")
+            return []
+        return sorted(ns for ns in namespaces if ns not in self.EXCLUDED_NAMESPACES and ':' not in ns)
+
+    def _notify(self):
+        namespaces = ['None'] + self._namespaces
+        for listener in list(self._listeners):
+            try:
+                listener(namespaces)
+            except Exception as e:
+                print(f"Error in namespace listener: {e}")
+
+    def _on_scene_changed(self, reason):
+        self._namespaces = None
+        # Coalesce bursts (file open, reference load) into a single rescan once Maya is idle
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start(200)
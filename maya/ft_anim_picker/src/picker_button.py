@@ -4,6 +4,7 @@ import maya.mel as mel
 import os
 import math
 import re
+import hashlib
 import xml.etree.ElementTree as ET
 try:
     from PySide6 import QtWidgets, QtCore, QtGui
@@ -26,6 +27,16 @@ from . import tool_functions as TF
 from . import custom_dialog as CD
 from . import main as MAIN
 from . import custom_color_picker as CCP
+from . import scene_events as SE
+from . import namespace_resolver as NR
+from . import pose_engine as PE
+from . import mirror_table as MT
+from . import pose_blend as PBL
+from . import pose_library as PL
+from . import script_context as SC
+from . import script_tokens as ST
+from . import button_profiler as BPF
+from . import script_queue as SQ
 
 from .pb_selection_manager import SelectionManagerWidget
 from .pb_script_manager import ScriptManagerWidget
@@ -79,7 +90,7 @@ class ButtonClipboard:
                 # Add pose-specific data if this is a pose button
                 if button.mode == 'pose':
                     button_data['thumbnail_path'] = button.thumbnail_path
-                    button_data['pose_data'] = button.pose_data.copy()  # Copy the pose data
+                    button_data['pose_data'] = button.pose_document_data()  # Copy the pose reference
                 
                 self.copied_buttons.append(button_data)
 
@@ -135,9 +146,16 @@ class PickerButton(QtWidgets.QWidget):
         self.edit_mode = False
         self.update_cursor()
         self.assigned_objects = []  
+        self._selection_cache = NR.selection_cache_for(unique_id)  # Resolved selection sets keyed by (kind, namespace)
+        self.last_pose_apply = None  # Stats of the last apply_pose (time, objects, attributes)
+        self._pose_blend = None  # Active PoseBlendSession while blending
+        self._blend_drag_origin = None
 
         self.mode = 'select'  # 'select', 'script', or 'pose'
         self.script_data = {}  # Store script data
+        self._script_cache = {}  # (code hash, namespace, script type) -> processed/compiled script, see _cached_script
+        self._script_runs = 0
+        self._script_cache_hits = 0
         self.pose_data = {}  # Store pose data
         
         # Rename mode properties
@@ -558,6 +576,9 @@ class PickerButton(QtWidgets.QWidget):
         else:
             if self.text_pixmap and not self.text_pixmap.isNull():
                 painter.drawPixmap(0, 0, self.text_pixmap)
+        
+        # Run time badge (script/pose profiler)
+        BPF.draw_badge(painter, self, rect)
     #---------------------------------------------------------------------------------------
     def _create_button_path(self, rect, radii, zoom_factor):
         """Create button path based on shape type"""
@@ -1530,8 +1551,27 @@ class PickerButton(QtWidgets.QWidget):
         
         info_layout.addStretch()
         
+        # Selection cache status (debug mode only)
+        if UT.DEBUG and self.mode == 'select':
+            if self._selection_cache:
+                cache_text = ' | '.join(
+                    f"{kind}: {entry['resolve_ms']:.2f}ms, {entry['hits']} hits"
+                    for (kind, _), entry in self._selection_cache.items()
+                )
+            else:
+                cache_text = "not cached"
+            cache_label = QtWidgets.QLabel(f"[{cache_text}]")
+            cache_label.setStyleSheet("color: rgba(255, 255, 255, 0.4); font-size: 9px; border:none;background-color: transparent;")
+            info_layout.addWidget(cache_label)
+        
         # Thumbnail info for pose mode
         if self.mode == 'pose':
+            if self.last_pose_apply:
+                keyed_text = f", {self.last_pose_apply['keyed']} keyed" if self.last_pose_apply.get('keyed') else ""
+                apply_label = QtWidgets.QLabel(f"[applied in {self.last_pose_apply['ms']:.1f}ms, "
+                                               f"{self.last_pose_apply['attributes']} written, {self.last_pose_apply['skipped']} skipped{keyed_text}]")
+                apply_label.setStyleSheet("color: rgba(255, 255, 255, 0.4); font-size: 9px; border:none;background-color: transparent;")
+                info_layout.addWidget(apply_label)
             if self.thumbnail_path:
                 thumb_label = QtWidgets.QLabel(f"[{os.path.basename(self.thumbnail_path).split('.')[0]}]")
                 thumb_label.setStyleSheet("color: rgba(255, 255, 255, 0.6); font-size: 10px; border:none;background-color: transparent;")
@@ -1663,6 +1703,53 @@ class PickerButton(QtWidgets.QWidget):
         # Apply the selection immediately with all modifier states
         canvas.apply_final_selection(shift_held, ctrl_held, alt_held)
 
+    #---------------------------------------------------------------------------------------
+    # SELECTION CACHE
+    #---------------------------------------------------------------------------------------
+    def _assigned_objects_signature(self):
+        """Cheap signature of assigned_objects, used to notice edits to the assignment"""
+        return tuple((obj_data.get('uuid'), obj_data.get('long_name')) for obj_data in self.assigned_objects)
+
+    def get_cached_selection(self, kind, namespace):
+        """Return the cached resolved node list for (kind, namespace) or None if it is stale.
+
+        kind is 'objects' or 'counterparts'. An entry is valid while the scene generation
+        (see scene_events) and the assigned objects are unchanged since it was stored.
+        """
+        entry = self._selection_cache.get((kind, namespace))
+        if entry is None:
+            return None
+        
+        if (not SE.SceneEvents.get_instance().is_current(entry['generation']) or 
+            entry['signature'] != self._assigned_objects_signature()):
+            del self._selection_cache[(kind, namespace)]
+            return None
+        
+        entry['hits'] += 1
+        if UT.DEBUG:
+            self._tooltip_needs_update = True
+        return entry
+
+    def store_selection_cache(self, kind, namespace, generation, nodes, missing, resolve_ms, missing_items=()):
+        """Store a freshly resolved node list for (kind, namespace).
+
+        missing_items holds the (object data, report kind) of each miss, so cache hits can report them too.
+        """
+        self._selection_cache[(kind, namespace)] = {
+            'generation': generation,
+            'signature': self._assigned_objects_signature(),
+            'nodes': list(nodes),
+            'missing': set(missing),
+            'missing_items': list(missing_items),
+            'resolve_ms': resolve_ms,
+            'hits': 0,
+        }
+        if UT.DEBUG:
+            self._tooltip_needs_update = True
+
+    def invalidate_selection_cache(self):
+        self._selection_cache.clear()
+
     def update_visual_state(self, selected):
         """Update only the visual selection state"""
         if self.is_selected != selected:
@@ -1987,6 +2074,18 @@ class PickerButton(QtWidgets.QWidget):
                 
                 remove_pose_action = menu.addAction(QtGui.QIcon(UT.get_icon('subtract.png')),"Remove Pose")
                 remove_pose_action.triggered.connect(self.remove_pose_for_selected_buttons)
+                
+                key_pose_action = menu.addAction(QtGui.QIcon(UT.get_icon('pose_01.png')),"Apply Pose + Key")
+                key_pose_action.triggered.connect(lambda: self.apply_pose(key=True))
+                key_pose_action.setEnabled(self.has_pose())
+                
+                key_range_action = menu.addAction(QtGui.QIcon(UT.get_icon('pose_01.png')),"Key Pose on Frames...")
+                key_range_action.triggered.connect(self.show_key_pose_range_dialog)
+                key_range_action.setEnabled(self.has_pose())
+                
+                blend_pose_action = menu.addAction(QtGui.QIcon(UT.get_icon('pose_01.png')),"Blend Pose")
+                blend_pose_action.triggered.connect(self.show_pose_blend_slider)
+                blend_pose_action.setEnabled(self.has_pose() and PBL.blending_available())
 
                 thumbnail_menu = QtWidgets.QMenu("Thumbnail")
                 thumbnail_menu.setWindowFlags(thumbnail_menu.windowFlags() | QtCore.Qt.FramelessWindowHint | QtCore.Qt.NoDropShadowWindowHint)
@@ -2310,33 +2409,13 @@ class PickerButton(QtWidgets.QWidget):
         # Store the current attribute values for all assigned objects
         pose_data = {}
         
-        for obj_data in self.assigned_objects:
-            try:
-                # Get the object from the data
-                obj = obj_data['long_name']
-                
-                if cmds.objExists(obj):
-                    # Extract the base name without namespace for storage
-                    # This makes poses reusable across different namespaces
-                    base_name = obj.split('|')[-1].split(':')[-1]
-                    
-                    # Get all keyable attributes
-                    attrs = cmds.listAttr(obj, keyable=True) or []
-                    attr_values = {}
-                    
-                    for attr in attrs:
-                        try:
-                            full_attr = f"{obj}.{attr}"
-                            if cmds.objExists(full_attr):
-                                attr_values[attr] = cmds.getAttr(full_attr)
-                        except:
-                            continue
-                            
-                    if attr_values:
-                        # Store with base name for namespace compatibility
-                        pose_data[base_name] = attr_values
-            except:
-                continue
+        # Capture all keyable, unlocked values in one pass (see pose_engine)
+        captured = PE.capture_keyable_values([obj_data['long_name'] for obj_data in self.assigned_objects])
+        for obj, attr_values in captured.items():
+            # Extract the base name without namespace for storage
+            # This makes poses reusable across different namespaces
+            base_name = obj.split('|')[-1].split(':')[-1]
+            pose_data[base_name] = attr_values
         
         # Update the tooltip with the new assigned objects
         #self.update_tooltip()
@@ -2378,7 +2457,7 @@ class PickerButton(QtWidgets.QWidget):
     def remove_pose_for_selected_buttons(self):
         """Remove the pose data for selected buttons"""
         for button in self.parent().get_selected_buttons():
-            if not button.pose_data:
+            if not button.has_pose():
                 # Use custom dialog instead of QMessageBox
                 dialog = CD.CustomDialog(self, title="No Pose", size=(200, 80), info_box=True)
                 message_label = QtWidgets.QLabel("There is no pose to remove.")
@@ -3428,10 +3507,47 @@ class PickerButton(QtWidgets.QWidget):
         dialog.exec_()
     
     #---------------------------------------------------------------------------------------
+    # POSE DATA
+    #---------------------------------------------------------------------------------------
+    @property
+    def pose_data(self):
+        """Stored pose, loaded from the pose library on first use"""
+        if self._pose_ref is not None:
+            return PL.PoseLibrary.get_instance().load(self._pose_ref) or {}
+        return self._pose_data
+
+    @pose_data.setter
+    def pose_data(self, value):
+        # Accepts either pose data or a pose library reference from the picker document
+        if PL.is_pose_ref(value):
+            self._pose_ref = dict(value)
+            self._pose_data = {}
+        else:
+            self._pose_ref = None
+            self._pose_data = value or {}
+
+    def has_pose(self):
+        """True if the button has a pose (without loading it)"""
+        return bool(self._pose_ref or self._pose_data)
+
+    def pose_document_data(self):
+        """Pose data as stored in the picker document: a pose library reference, or {} without a pose"""
+        if self._pose_ref is None and self._pose_data:
+            try:
+                self._pose_ref = PL.PoseLibrary.get_instance().store(self._pose_data)
+                self._pose_data = {}
+            except OSError as e:
+                print(f"Could not store pose in library, keeping it in the picker data: {e}")
+                return self._pose_data
+        return dict(self._pose_ref) if self._pose_ref else {}
+    #---------------------------------------------------------------------------------------
     # POSE APPLICATION
     #---------------------------------------------------------------------------------------        
-    def apply_pose(self):
-        """Apply the stored pose to the assigned objects"""
+    def apply_pose(self, key=False):
+        """Apply the stored pose to the assigned objects.
+
+        With key=True the attributes the pose touched are keyed at the current time, in the same undo chunk.
+        """
         import maya.cmds as cmds
         
         # Validate pose data
@@ -3440,18 +3556,20 @@ class PickerButton(QtWidgets.QWidget):
         
         pose_data = self.pose_data["default"]
         current_namespace = self._get_current_namespace()
-        successfully_posed_objects = []
         
-        # Apply pose within undo chunk
-        cmds.undoInfo(openChunk=True, chunkName="Apply Pose")
+        # Apply (and key) pose within one undo chunk
+        cmds.undoInfo(openChunk=True, chunkName="Apply and Key Pose" if key else "Apply Pose")
         
         try:
-            for obj_name, attr_values in pose_data.items():
-                resolved_obj = self._resolve_object_name(obj_name, current_namespace)
-                
-                if resolved_obj:
-                    if self._apply_object_attributes(resolved_obj, attr_values):
-                        successfully_posed_objects.append(self._get_full_path(resolved_obj))
+            # Targets and plugs are resolved once per pose and namespace (see pose_engine)
+            with BPF.measure(self, 'pose'):
+                successfully_posed_objects, stats = PE.apply_pose(self.unique_id, "default", pose_data, current_namespace, key=key)
+            self.last_pose_apply = stats
+            self._tooltip_needs_update = True
+            if UT.DEBUG:
+                print(f"Applied pose '{self.label}': {stats['objects']} objects, {stats['attributes']} written, "
+                      f"{stats['skipped']} unchanged, {stats['keyed']} keyed in {stats['ms']:.2f}ms "
+                      f"({'cached' if stats['cached'] else 'resolved'})")
             
             # Select successfully posed objects
             if successfully_posed_objects:
@@ -3462,6 +3580,102 @@ class PickerButton(QtWidgets.QWidget):
         finally:
             cmds.undoInfo(closeChunk=True)
 
+    def key_pose_range(self, frames):
+        """Key the stored pose at each of frames, without changing the current time"""
+        import maya.cmds as cmds
+        
+        if not self._validate_pose_data() or not frames:
+            return
+        
+        cmds.undoInfo(openChunk=True, chunkName="Key Pose Range")
+        try:
+            keyed_objects, stats = PE.key_pose_range(self.unique_id, "default", self.pose_data["default"],
+                                                     self._get_current_namespace(), frames)
+            if UT.DEBUG:
+                print(f"Keyed pose '{self.label}': {stats['keys']} keys on {stats['attributes']} attributes of "
+                      f"{stats['objects']} objects over {stats['frames']} frames in {stats['ms']:.2f}ms")
+        except Exception as e:
+            self._show_error_dialog("Error keying pose", str(e))
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+    def show_key_pose_range_dialog(self):
+        """Ask for a frame list (defaults to the playback range) and key the pose on those frames"""
+        import maya.cmds as cmds
+        
+        start = cmds.playbackOptions(query=True, minTime=True)
+        end = cmds.playbackOptions(query=True, maxTime=True)
+        
+        dialog = CD.CustomDialog(self, title="Key Pose Range", size=(240, 130))
+        dialog.add_widget(QtWidgets.QLabel("Frames (e.g. 1, 12, 20-40, 50-100x10):"))
+        frames_edit = QtWidgets.QLineEdit(f"{start:g}-{end:g}")
+        dialog.add_widget(frames_edit)
+        dialog.add_button_box()
+        
+        if dialog.exec_() != QtWidgets.QDialog.Accepted:
+            return
+        try:
+            frames = UT.parse_frame_list(frames_edit.text())
+        except ValueError as e:
+            print(f"Invalid frame list '{frames_edit.text()}': {e}")
+            return
+        self.key_pose_range(frames)
+
+    #---------------------------------------------------------------------------------------
+    # POSE BLENDING
+    #---------------------------------------------------------------------------------------
+    def is_pose_blending(self):
+        return self._pose_blend is not None
+
+    def start_pose_blend(self):
+        """Start blending from the current pose towards the stored pose. Returns True if blending"""
+        if self._pose_blend is not None:
+            return True
+        if not PBL.blending_available():
+            print("Pose blending requires NumPy, which is not available in this Maya version.")
+            return False
+        if not self._validate_pose_data():
+            return False
+        
+        try:
+            session = PBL.PoseBlendSession(self.unique_id, self.pose_data["default"], self._get_current_namespace())
+        except Exception as e:
+            print(f"Error starting pose blend: {e}")
+            return False
+        
+        if not len(session):
+            return False
+        self._pose_blend = session
+        return True
+
+    def update_pose_blend(self, weight):
+        """Preview the blend at weight (0 = pose at blend start, 1 = stored pose)"""
+        if self._pose_blend is None:
+            return
+        try:
+            self._pose_blend.preview(weight)
+        except Exception as e:
+            print(f"Error blending pose: {e}")
+
+    def finish_pose_blend(self):
+        """Commit the current blend as one undo step"""
+        session = self._pose_blend
+        self._pose_blend = None
+        if session is None:
+            return
+        try:
+            if session.weight > 0.0:
+                session.commit()
+            else:
+                session.cancel()
+        except Exception as e:
+            print(f"Error committing pose blend: {e}")
+
+    def show_pose_blend_slider(self):
+        if not hasattr(self, 'pose_blend_slider'):
+            self.pose_blend_slider = PBL.PoseBlendSlider(self)
+        self.pose_blend_slider.show_at(self.mapToGlobal(self.rect().bottomLeft()))
+
     def _validate_pose_data(self):
         """Validate that pose data exists and is not empty"""
         if not self.pose_data:
@@ -3511,49 +3725,6 @@ class PickerButton(QtWidgets.QWidget):
         
         return None
 
-    def _apply_object_attributes(self, obj_name, attr_values):
-        """Apply attribute values to an object"""
-        import maya.cmds as cmds
-        
-        success = False
-        for attr, value in attr_values.items():
-            if self._set_attribute(obj_name, attr, value):
-                success = True
-        
-        return success
-
-    def _set_attribute(self, obj_name, attr, value):
-        """Set a single attribute value with error handling"""
-        import maya.cmds as cmds
-        
-        try:
-            full_attr = f"{obj_name}.{attr}"
-            
-            if not cmds.objExists(full_attr) or cmds.getAttr(full_attr, lock=True):
-                return False
-            
-            if isinstance(value, list):
-                for i, val in enumerate(value):
-                    cmds.setAttr(f"{full_attr}[{i}]", val)
-            else:
-                cmds.setAttr(full_attr, value)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error setting attribute {full_attr}: {e}")
-            return False
-
-    def _get_full_path(self, obj_name):
-        """Get the full path of an object for unique identification"""
-        import maya.cmds as cmds
-        
-        try:
-            full_paths = cmds.ls(obj_name, long=True)
-            return full_paths[0] if full_paths else obj_name
-        except Exception:
-            return obj_name
-
     def _select_objects(self, objects):
         """Select the given objects with error handling"""
         import maya.cmds as cmds
@@ -3597,7 +3768,6 @@ class PickerButton(QtWidgets.QWidget):
                 need to be flipped based on the control's world orientation. Default is True.
         """
         import maya.cmds as cmds
-        import json
         
         # Validate pose data
         if not self._validate_pose_data():
@@ -3609,7 +3779,6 @@ class PickerButton(QtWidgets.QWidget):
         # Initialize mirroring components
         naming_conventions = self._get_naming_conventions(L, R)
         custom_flip_controls = custom_flip_controls or {}
-        successfully_posed_objects = []
         
         # Apply mirrored pose within undo chunk
         cmds.undoInfo(openChunk=True, chunkName="Apply Mirrored Pose")
@@ -3620,29 +3789,16 @@ class PickerButton(QtWidgets.QWidget):
                 orientation_data = self._collect_orientation_data_for_pose(pose_data, current_namespace, cmds)
                 custom_flip_controls = self._analyze_orientations_for_pose(pose_data, orientation_data, naming_conventions, custom_flip_controls, current_namespace, cmds)
             
-            # Load mirror preferences for all objects in pose data
-            mirror_preferences = self._load_mirror_preferences_for_pose(pose_data, current_namespace, cmds)
-            
-            # Process each object in the pose data
+            # Resolve the posed objects, then mirror their values through the cached mirror table
+            source_values = {}
             for obj_name, attr_values in pose_data.items():
-                resolved_source_obj = self._resolve_object_name(obj_name, current_namespace)
-                
-                if resolved_source_obj:
-                    # Find the mirrored object
-                    namespace, short_name = self._extract_namespace_and_name(resolved_source_obj)
-                    mirrored_name, is_center_object = self._find_mirrored_name(short_name, naming_conventions, mirror_preferences, namespace)
-                    
-                    if cmds.objExists(mirrored_name):
-                        # Apply mirrored attributes to the target object
-                        mirrored_attrs = self._calculate_mirrored_attributes(
-                            attr_values, short_name, is_center_object, custom_flip_controls, mirror_preferences
-                        )
-                        
-                        if self._apply_object_attributes(mirrored_name, mirrored_attrs):
-                            successfully_posed_objects.append(self._get_full_path(mirrored_name))
-                            #print(f"Applied mirrored pose from {resolved_source_obj} to {mirrored_name}")
-                    else:
-                        print(f"Mirrored object {mirrored_name} does not exist for {resolved_source_obj}")
+                resolved = PE.resolve_pose_node(obj_name, current_namespace)
+                if resolved:
+                    source_values[resolved[1]] = attr_values
+            mirrored_pose = MT.mirror_pose(source_values, naming_conventions, custom_flip_controls)
+            
+            # One batched write for all counterparts (locked and unchanged attributes are skipped)
+            successfully_posed_objects, _ = PE.apply_pose(self.unique_id, "mirror", mirrored_pose, current_namespace)
             
             # Select successfully posed objects
             if successfully_posed_objects:
@@ -3928,174 +4084,6 @@ class PickerButton(QtWidgets.QWidget):
                 }
         
         return custom_flip_controls
-
-    def _load_mirror_preferences_for_pose(self, pose_data, current_namespace, cmds):
-        """
-        Loads mirror preferences for all objects in the pose data and their potential counterparts.
-        
-        Args:
-            pose_data (dict): Dictionary of pose data
-            current_namespace (str): Current namespace
-            cmds: Maya commands module
-            
-        Returns:
-            dict: Dictionary of mirror preferences
-        """
-        import json
-        mirror_preferences = {}
-        naming_conventions = self._get_naming_conventions("", "")
-        
-        # Load mirror preferences for all objects in pose data
-        for obj_name in pose_data.keys():
-            resolved_obj = self._resolve_object_name(obj_name, current_namespace)
-            if resolved_obj and cmds.objExists(resolved_obj):
-                namespace, short_name = self._extract_namespace_and_name(resolved_obj)
-                
-                if cmds.attributeQuery("mirrorPreference", node=resolved_obj, exists=True):
-                    try:
-                        pref_data_str = cmds.getAttr(f"{resolved_obj}.mirrorPreference")
-                        mirror_preferences[short_name] = json.loads(pref_data_str)
-                    except (json.JSONDecodeError, Exception) as e:
-                        print(f"Error loading mirror preferences for {resolved_obj}: {e}")
-        
-        # Also load mirror preferences for potential counterparts
-        potential_counterparts = set()
-        for obj_name in pose_data.keys():
-            resolved_obj = self._resolve_object_name(obj_name, current_namespace)
-            if resolved_obj:
-                namespace, short_name = self._extract_namespace_and_name(resolved_obj)
-                # Find the potential counterpart name
-                counterpart_name, _ = self._find_mirrored_name(short_name, naming_conventions, namespace=namespace)
-                if counterpart_name != resolved_obj:
-                    potential_counterparts.add(counterpart_name)
-        
-        # Load preferences for counterparts if they exist
-        for counterpart in potential_counterparts:
-            if cmds.objExists(counterpart):
-                counterpart_namespace, counterpart_short = self._extract_namespace_and_name(counterpart)
-                if counterpart_short not in mirror_preferences:
-                    if cmds.attributeQuery("mirrorPreference", node=counterpart, exists=True):
-                        try:
-                            pref_data_str = cmds.getAttr(f"{counterpart}.mirrorPreference")
-                            mirror_preferences[counterpart_short] = json.loads(pref_data_str)
-                        except (json.JSONDecodeError, Exception) as e:
-                            print(f"Error loading mirror preferences for counterpart {counterpart}: {e}")
-        
-        return mirror_preferences
-
-    def _calculate_mirrored_attributes(self, attr_values, control_name, is_center_object, custom_flip_controls, mirror_preferences=None):
-        """
-        Calculates mirrored attribute values for an object.
-        
-        Args:
-            attr_values (dict): Dictionary of attribute values from pose data
-            control_name (str): Control name for custom flip lookup (short name without namespace)
-            is_center_object (bool): Whether this is a center object
-            custom_flip_controls (dict): Dictionary of custom flip controls
-            mirror_preferences (dict, optional): Dictionary of mirror preferences
-            
-        Returns:
-            dict: Dictionary of mirrored attribute values
-        """
-        mirrored_attrs = {}
-        
-        for attr, value in attr_values.items():
-            mirrored_val = value
-            
-            # Check if we have mirror preferences for this control or its counterpart
-            use_mirror_prefs = False
-            pref_data = None
-            
-            # First check if the object itself has mirror preferences
-            if mirror_preferences and control_name in mirror_preferences:
-                pref_data = mirror_preferences[control_name]
-            else:
-                # If not, check if we have the counterpart's preferences loaded
-                # We need to find the counterpart name first
-                for obj_name, prefs in mirror_preferences.items() if mirror_preferences else []:
-                    if "counterpart" in prefs and prefs["counterpart"] == control_name:
-                        # We found a counterpart that points to this control
-                        pref_data = prefs
-                        #print(f"Using counterpart {obj_name}'s mirror preferences for {control_name}")
-                        break
-            
-            if pref_data:
-                # Handle translation attributes
-                if attr.startswith('translate'):
-                    axis = attr[-1].lower()  # Get the axis (X, Y, or Z)
-                    if "translate" in pref_data and axis in pref_data["translate"]:
-                        use_mirror_prefs = True
-                        mirror_type = pref_data["translate"][axis]
-                        
-                        if mirror_type == "invert":
-                            if isinstance(value, list):
-                                mirrored_val = [-v for v in value]
-                            else:
-                                mirrored_val = -value
-                        else:  # "none"
-                            mirrored_val = value
-                
-                # Handle rotation attributes
-                elif attr.startswith('rotate'):
-                    axis = attr[-1].lower()  # Get the axis (X, Y, or Z)
-                    if "rotate" in pref_data and axis in pref_data["rotate"]:
-                        use_mirror_prefs = True
-                        mirror_type = pref_data["rotate"][axis]
-                        
-                        if mirror_type == "invert":
-                            if isinstance(value, list):
-                                mirrored_val = [-v for v in value]
-                            else:
-                                mirrored_val = -value
-                        else:  # "none"
-                            mirrored_val = value
-            
-            # If we didn't use mirror preferences, use the standard logic
-            if not use_mirror_prefs:
-                # Check if this attribute should be flipped
-                should_flip = self._should_flip_attribute(control_name, attr, custom_flip_controls)
-                
-                # Apply standard mirroring logic if should_flip is True
-                if should_flip and (attr == 'translateX' or attr == 'rotateY' or attr == 'rotateZ'):
-                    if isinstance(value, list):
-                        mirrored_val = [-v for v in value]
-                    else:
-                        mirrored_val = -value
-            
-            # For center objects, only include attributes that need to be flipped
-            if is_center_object:
-                if (use_mirror_prefs or 
-                    (self._should_flip_attribute(control_name, attr, custom_flip_controls) and 
-                    attr in ['translateX', 'rotateY', 'rotateZ'])):
-                    mirrored_attrs[attr] = mirrored_val
-            else:
-                # Include all attributes for regular mirroring
-                mirrored_attrs[attr] = mirrored_val
-        
-        return mirrored_attrs
-
-    def _should_flip_attribute(self, control_name, attr, custom_flip_controls):
-        """
-        Determines if an attribute should be flipped based on custom flip controls.
-        
-        Args:
-            control_name (str): Name of the control (short name without namespace)
-            attr (str): Attribute name
-            custom_flip_controls (dict): Dictionary of custom flip controls
-            
-        Returns:
-            bool: True if the attribute should be flipped, False otherwise
-        """
-        should_flip = True  # Default behavior
-        
-        # Check if this control is in the custom flip controls dictionary
-        if control_name in custom_flip_controls:
-            # Check if this attribute has custom flipping logic
-            if attr in custom_flip_controls[control_name].get('attrs', []):
-                # Get the custom flipping logic for this attribute
-                should_flip = custom_flip_controls[control_name].get('flip', {}).get(attr, True)
-        
-        return should_flip
     #---------------------------------------------------------------------------------------
     # SCRIPT MANAGEMENT
     #---------------------------------------------------------------------------------------
@@ -4117,18 +4105,54 @@ class PickerButton(QtWidgets.QWidget):
             return
         
         try:
-            # Get namespace info
-            current_ns, ns_prefix = self._get_namespace_info()
-            
-            # Process the code (handle tokens and imports)
-            modified_code = self._process_script_code(code, ns_prefix)
-            
-            # Execute the modified code
-            self._execute_processed_code(modified_code, script_type)
+            # Timed (and optionally cProfiled) per button, see button_profiler
+            with BPF.measure(self, 'script'):
+                # Get namespace info
+                current_ns, ns_prefix = self._get_namespace_info()
+                
+                # Process and compile the code (handle tokens and imports), cached per code/namespace/type
+                script = self._cached_script(code, ns_prefix, script_type)
+                
+                # Execute the modified code (tool functions find this button through the script context,
+                # appearance changes are saved once the script is done)
+                with SC.script_button(self), TF.appearance_batch():
+                    self._execute_processed_code(script['code'] or script['source'], script_type)
             
         except Exception as e:
             cmds.warning(f"Error executing {script_type} code: {str(e)}")
 
+    MAX_CACHED_SCRIPTS = 4  # Per button: one entry per namespace the script was run with
+
+    def _cached_script(self, code, ns_prefix, script_type):
+        """Processed source and compiled code object ('code', None for MEL) of a script.
+
+        Token processing and compile() run once per (code hash, namespace, script type); later
+        runs reuse the entry and count as cache hits.
+        """
+        key = (hashlib.sha1(code.encode('utf-8')).hexdigest(), ns_prefix, script_type)
+        self._script_runs += 1
+        
+        script = self._script_cache.get(key)
+        if script is not None:
+            script['hits'] += 1
+            self._script_cache_hits += 1
+            return script
+        
+        modified_code = self._process_script_code(code, ns_prefix, script_type)
+        compiled = None
+        if script_type == 'python':
+            compiled = compile(modified_code, f"<picker button {self.unique_id}>", 'exec')
+        
+        script = {'source': modified_code, 'code': compiled, 'hits': 0}
+        self._script_cache[key] = script
+        while len(self._script_cache) > self.MAX_CACHED_SCRIPTS:
+            self._script_cache.pop(next(iter(self._script_cache)))
+        return script
+
+    def script_cache_stats(self):
+        """Script cache counters: cached entries, runs and cache hits"""
+        return {'entries': len(self._script_cache), 'runs': self._script_runs, 'hits': self._script_cache_hits}
+
     def _get_namespace_info(self):
         """Get current namespace and prefix from picker window"""
         main_window = self.window()
@@ -4141,92 +4165,13 @@ class PickerButton(QtWidgets.QWidget):
         
         return current_ns, ns_prefix
 
-    def _process_script_code(self, code, ns_prefix):
-        """Process script code to handle tokens and imports"""
-        modified_code = code
-        
-        # Remove tooltip functions (already handled in script manager)
-        patterns_to_remove = [
-            r'@TF\.tool_tip\s*\(\s*["\'](.+?)["\']\s*\)',
-            r'@tool_tip\s*\(\s*["\'](.+?)["\']\s*\)',
-            r'@tt\s*\(\s*["\'](.+?)["\']\s*\)',
-        ]
-        for pattern in patterns_to_remove:
-            modified_code = re.sub(pattern, '', modified_code, flags=re.IGNORECASE)
-        
-        # Replace '@ns' tokens
-        modified_code = re.sub(r'@ns\.?([a-zA-Z0-9_])', fr'{ns_prefix}\1', modified_code, flags=re.IGNORECASE)  # Replace @ns. followed by identifier
-        modified_code = re.sub(r'@ns\.?(?!\w)', f'"{ns_prefix}"', modified_code, flags=re.IGNORECASE)
-        
-        #--------------------------------------------------------------------------------------------------------
-        needs_tf_import = False
-
-        # Handle general @TF.function_name calls
-        tf_pattern = r'(\s*)@TF\.(?!tool_tip|tt)(\w+)\s*\(([^)]*)\)'
-        if re.search(tf_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(tf_pattern, r'\1TF.\2(\3)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # Handle @pb function calls and add import if needed
-        pb_pattern = r'@pb\s*\(([^)]+)\)'
-        if re.search(pb_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(pb_pattern, r'TF.pb(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        # second pattern for @pb
-        pb_pattern_02 = r'@picker_button\s*\(([^)]+)\)'
-        if re.search(pb_pattern_02, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(pb_pattern_02, r'TF.pb(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # handle @ba calls and add import if needed
-        button_appearance_pattern = r'@ba\s*\(([^)]+)\)'
-        if re.search(button_appearance_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(button_appearance_pattern, r'TF.button_appearance(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        # second pattern for @ba
-        button_appearance_pattern_02 = r'@button_appearance\s*\(([^)]+)\)'
-        if re.search(button_appearance_pattern_02, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(button_appearance_pattern_02, r'TF.button_appearance(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # handle @reset_all, @reset_translate, @reset_rotate, @reset_scale
-        reset_all_pattern = r'@reset_all\b'
-        if re.search(reset_all_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(reset_all_pattern, r'TF.reset_all()', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        reset_translate_pattern = r'@reset_move\b'
-        if re.search(reset_translate_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(reset_translate_pattern, r'TF.reset_move()', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        reset_rotate_pattern = r'@reset_rotate\b'
-        if re.search(reset_rotate_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(reset_rotate_pattern, r'TF.reset_rotate()', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        reset_scale_pattern = r'@reset_scale\b'
-        if re.search(reset_scale_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(reset_scale_pattern, r'TF.reset_scale()', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # Handle Tool Tip calls and add import if needed
-        tool_tip_pattern = r'@tt\s*\(([^)]+)\)'
-        if re.search(tool_tip_pattern, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(tool_tip_pattern, r'TF.tool_tip(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        # second pattern for @tt
-        tool_tip_pattern_02 = r'@tool_tip\s*\(([^)]+)\)'
-        if re.search(tool_tip_pattern_02, modified_code, re.MULTILINE | re.IGNORECASE):
-            modified_code = re.sub(tool_tip_pattern_02, r'TF.tool_tip(\1)', modified_code, flags=re.MULTILINE | re.IGNORECASE)
-            needs_tf_import = True
-        #--------------------------------------------------------------------------------------------------------
-        # Add TF import if needed
-        if needs_tf_import and 'import ft_anim_picker.src.tool_functions as TF' not in modified_code:
-            modified_code = 'import ft_anim_picker.src.tool_functions as TF\n' + modified_code
-        #--------------------------------------------------------------------------------------------------------
-        
-        return modified_code
+    def _process_script_code(self, code, ns_prefix, script_type='python'):
+        """Process script code to handle tokens and imports (single pass, see script_tokens)"""
+        language = 'mel' if script_type == 'mel' else 'python'
+        return ST.process_script_code(code, ns_prefix, language)
 
     def _execute_processed_code(self, modified_code, script_type):
-        """Execute the processed code based on script type"""
+        """Execute the processed code (source or compiled code object) based on script type"""
         if script_type == 'python':
             #print(modified_code)
             exec(modified_code)
@@ -4627,10 +4572,18 @@ class PickerButton(QtWidgets.QWidget):
                     if self.mode == 'select':
                         self._handle_select_mode_click(event, canvas, shift_held, ctrl_held, alt_held)
                     elif self.mode == 'script':
-                        self.execute_script_command()
+                        # Deferred and coalesced so spamming the button never piles up runs (see script_queue)
+                        SQ.ScriptQueue.get_instance().submit(self)
                     elif self.mode == 'pose':
-                        if alt_held:
+                        if ctrl_held:
+                            # Ctrl+drag blends from the current pose towards the stored pose
+                            if self.start_pose_blend():
+                                self._blend_drag_origin = event.globalPos()
+                        elif alt_held:
                             self.apply_mirrored_pose()
+                        elif shift_held:
+                            # Shift+click applies and keys the pose in one step
+                            self.apply_pose(key=True)
                         else:
                             self.apply_pose()
                 
@@ -4685,7 +4638,14 @@ class PickerButton(QtWidgets.QWidget):
 
     def mouseMoveEvent(self, event):
         """Optimized mouse move with minimal updates during drag"""
-        if hasattr(self, 'duplicating') and self.duplicating and event.buttons() & QtCore.Qt.LeftButton:
+        if self._blend_drag_origin is not None and event.buttons() & QtCore.Qt.LeftButton:
+            weight = (event.globalPos().x() - self._blend_drag_origin.x()) / PBL.BLEND_DRAG_DISTANCE
+            weight = min(max(weight, 0.0), 1.0)
+            self.update_pose_blend(weight)
+            QtWidgets.QToolTip.showText(event.globalPos(), f"Blend {int(weight * 100)}%", self)
+            event.accept()
+            
+        elif hasattr(self, 'duplicating') and self.duplicating and event.buttons() & QtCore.Qt.LeftButton:
             self.handle_duplication_drag(event)
             event.accept()
             
@@ -4740,6 +4700,14 @@ class PickerButton(QtWidgets.QWidget):
         if event.button() == QtCore.Qt.LeftButton:
             canvas = self.parent()
             
+            # Handle pose blend completion
+            if self._blend_drag_origin is not None:
+                self._blend_drag_origin = None
+                QtWidgets.QToolTip.hideText()
+                self.finish_pose_blend()
+                event.accept()
+                return
+            
             # Handle duplication completion
             if hasattr(self, 'duplicating') and self.duplicating:
                 self.complete_duplication_drag(event)
@@ -10,6 +10,7 @@ except ImportError:
     from PySide2.QtCore import QTimer, QPropertyAnimation, QEasingCurve, Signal
     from shiboken2 import wrapInstance
 import os
+import time
 import maya.cmds as cmds
 from . import ui as UI
 from . import utils as UT
@@ -19,6 +20,12 @@ from . import tool_functions as TF
 from . import data_management as DM
 from . import custom_dialog as CD
 from . import pb_transform_guides as TG
+from . import scene_events as SE
+from . import missing_objects_report as MR
+from . import button_profiler as BPF
+from . import script_queue as SQ
+from . import namespace_resolver as NR
+from . import mirror_table as MT
 from .maya_curve_converter import create_buttons_from_maya_curves
 
 class HUDWidget(QtWidgets.QWidget):
@@ -73,6 +80,18 @@ class HUDWidget(QtWidgets.QWidget):
         #self.stats_layout.addWidget(self.selection_count_label)
         self.layout.addWidget(self.selection_count_label, 0, 1, QtCore.Qt.AlignBottom | QtCore.Qt.AlignRight)
 
+        # Script queue depth, shown while button scripts are waiting to run (click to cancel them)
+        self.script_queue_label = QtWidgets.QLabel()
+        self.script_queue_label.setStyleSheet("color: rgba(255, 200, 120, 0.7); background-color: rgba(35, 35, 35, 0.7); border-radius: 3px; padding: 2px 6px;")
+        self.script_queue_label.setVisible(False)
+        self.layout.addWidget(self.script_queue_label, 0, 0, 1, 2, QtCore.Qt.AlignBottom | QtCore.Qt.AlignHCenter)
+
+        # Missing objects count for the session, shown while the report has entries (click to open it)
+        self.missing_objects_label = QtWidgets.QLabel()
+        self.missing_objects_label.setStyleSheet("color: rgba(255, 140, 140, 0.7); background-color: rgba(35, 35, 35, 0.7); border-radius: 3px; padding: 2px 6px;")
+        self.missing_objects_label.setVisible(False)
+        self.layout.addWidget(self.missing_objects_label, 0, 0, 1, 2, QtCore.Qt.AlignTop | QtCore.Qt.AlignHCenter)
+
         self.reset_buttons()
         
         # Store all HUD elements (except toggle button)
@@ -91,6 +110,11 @@ class HUDWidget(QtWidgets.QWidget):
         self.update_timer.timeout.connect(self.update_selection_count)
         self.update_timer.start(100)  # Update every 100ms
 
+        # The queue outlives the HUD (tabs get deleted, windows closed), so unregister on destruction
+        queue_listener = self.update_script_queue_depth
+        SQ.ScriptQueue.get_instance().add_listener(queue_listener)
+        self.destroyed.connect(lambda *args: SQ.ScriptQueue.get_instance().remove_listener(queue_listener))
+
     def reset_buttons(self):
         button_size = 14
         br = 3
@@ -133,6 +157,16 @@ class HUDWidget(QtWidgets.QWidget):
         container_layout.setContentsMargins(0, 0, 0, 0)
         #container_layout.addWidget(self.reset_button_frame)
         
+    def update_script_queue_depth(self, depth):
+        """Script queue listener: show how many button scripts are queued or running"""
+        self.script_queue_label.setText(f"Scripts queued: {depth}  ✕")
+        self.script_queue_label.setVisible(depth > 0)
+
+    def update_missing_count(self, count):
+        """Show how many items the session missing-objects report holds"""
+        self.missing_objects_label.setText(f"Missing: {count}")
+        self.missing_objects_label.setVisible(count > 0)
+
     def toggle_hud(self):
         self.hud_visible = not self.hud_visible
         for element in self.hud_elements:
@@ -193,6 +227,8 @@ class PickerCanvas(QtWidgets.QWidget):
         self.last_pan_pos = None
 
         self.buttons = []
+        self._button_index = {}  # unique_id -> button, see button_by_id
+        self._button_index_size = -1
         self.setup_dot_texture()
         
         # Set size policy to allow expanding
@@ -214,6 +250,13 @@ class PickerCanvas(QtWidgets.QWidget):
         self.hud = HUDWidget(self)
         self.hud.raise_()
 
+        # The missing objects panel opens by itself only when the report gains new entries. The report
+        # outlives the canvas (tabs get deleted, windows closed), so the listener goes on destruction
+        self._missing_report_has_new = False
+        report_listener = self._on_missing_report_changed
+        MR.MissingObjectsReport.get_instance().add_listener(report_listener)
+        self.destroyed.connect(lambda *args: MR.MissingObjectsReport.get_instance().remove_listener(report_listener))
+
         self.minimal_mode = False
         self.last_selected_button = None
 
@@ -934,9 +977,9 @@ class PickerCanvas(QtWidgets.QWidget):
             # Apply Maya selection
             self._apply_maya_selection_with_modifiers(new_selection, add_to_selection, alt_held)
             
-            # Handle missing objects and UI updates
+            # Missing objects go to the session report; never block the click on UI
             if missing_objects:
-                self._show_missing_objects_dialog(missing_objects)
+                self._report_missing_objects()
             
             self._update_ui_state(uuid_updates)
             
@@ -958,19 +1001,15 @@ class PickerCanvas(QtWidgets.QWidget):
                     resolved_objects, _, _ = self._resolve_button_objects(button)
                     objects_to_deselect.extend(resolved_objects)
         
+        # Names are already resolved against the current namespace; drop the ones deleted since
+        existing = NR.existing_nodes(objects_to_deselect)
+        objects_to_deselect = [obj for obj in objects_to_deselect if obj in existing]
         if objects_to_deselect:
             cmds.undoInfo(openChunk=True)
             try:
-                main_window = self.window()
-                current_namespace = main_window.namespace_dropdown.currentText()
-                
-                for obj in objects_to_deselect:
-                    namespaced_obj = f"{current_namespace}:{obj}" if current_namespace and current_namespace != 'None' else obj
-                    if cmds.objExists(namespaced_obj):
-                        try:
-                            cmds.select(namespaced_obj, deselect=True)
-                        except:
-                            pass
+                cmds.select(objects_to_deselect, deselect=True)
+            except (ValueError, RuntimeError) as e:
+                print(f"Error deselecting objects: {e}")
             finally:
                 cmds.undoInfo(closeChunk=True)
 
@@ -982,30 +1021,11 @@ class PickerCanvas(QtWidgets.QWidget):
                 cmds.select(clear=True)
             
             if new_selection:
-                main_window = self.window()
-                current_namespace = main_window.namespace_dropdown.currentText()
-                
-                resolved_selection = []
-                resolved_names = []
-                
-                for sel in new_selection:
-                    namespaced_node = f"{current_namespace}:{sel}" if current_namespace and current_namespace != 'None' else sel
-                    if cmds.objExists(namespaced_node):
-                        resolved_selection.append(namespaced_node)
-                    else:
-                        resolved_selection.append(sel)
-                    
-                    sel_name = sel.split(':')[-1].split('|')[-1]
-                    resolved_names.append(sel_name)
-                
-                selection_type = "counterparts" if alt_held else "objects"
-                #print(f"Selecting {selection_type}: {', '.join(resolved_names)}")
-                
-                if resolved_selection:
-                    cmds.select(resolved_selection, add=True)
-                    # Make last node active
-                    cmds.select(resolved_selection[-1], toggle=True)
-                    cmds.select(resolved_selection[-1], add=True)
+                # Names are already resolved against the current namespace (and cached per button)
+                cmds.select(new_selection, add=True)
+                # Make last node active
+                cmds.select(new_selection[-1], toggle=True)
+                cmds.select(new_selection[-1], add=True)
         finally:
             cmds.undoInfo(closeChunk=True)
 
@@ -1060,8 +1080,20 @@ class PickerCanvas(QtWidgets.QWidget):
             return [], set(), False
         
         current_namespace = main_window.namespace_dropdown.currentText()
+        
+        # Fast path: reuse the button's resolved node list while the scene is unchanged
+        cached = button.get_cached_selection('objects', current_namespace)
+        if cached is not None:
+            self._record_cached_misses(button, cached, current_namespace)
+            return list(cached['nodes']), set(cached['missing']), False
+        
+        generation = SE.scene_generation()
+        start_time = time.perf_counter()
+        missing_report = MR.MissingObjectsReport.get_instance()
+        
         resolved_objects = []
         missing_objects = set()
+        missing_items = []
         updated_objects = []
         uuid_updates = False
         
@@ -1071,6 +1103,7 @@ class PickerCanvas(QtWidgets.QWidget):
             )
             
             if resolved_node:
+                missing_report.discard(button, obj_data, 'object')
                 resolved_objects.append(resolved_node)
                 updated_objects.append({
                     'uuid': new_uuid or obj_data['uuid'],
@@ -1081,6 +1114,8 @@ class PickerCanvas(QtWidgets.QWidget):
             else:
                 base_name = obj_data['long_name'].split('|')[-1].split(':')[-1]
                 missing_objects.add(f"- {base_name}")
+                missing_report.record(button, obj_data, 'object', current_namespace)
+                missing_items.append((obj_data, 'object'))
                 updated_objects.append(obj_data)
         
         # Update button's assigned objects with new UUIDs
@@ -1088,8 +1123,100 @@ class PickerCanvas(QtWidgets.QWidget):
         if uuid_updates:
             button.changed.emit(button)
         
+        resolved_objects = self._namespace_selection_nodes(resolved_objects, current_namespace)
+        resolve_ms = (time.perf_counter() - start_time) * 1000.0
+        button.store_selection_cache('objects', current_namespace, generation, resolved_objects, missing_objects, resolve_ms, missing_items)
+        
         return resolved_objects, missing_objects, uuid_updates
 
+    def _record_cached_misses(self, button, cached, namespace):
+        """A cache hit skips the resolver, so the misses it stored are reported from the cache"""
+        if cached['missing_items']:
+            missing_report = MR.MissingObjectsReport.get_instance()
+            for obj_data, kind in cached['missing_items']:
+                missing_report.record(button, obj_data, kind, namespace)
+
+    def prefetch_selection_cache(self, namespace):
+        """Resolve every select button for namespace in one batch and fill their selection caches.
+
+        Used on namespace switches: buttons stay untouched, only their caches for the new
+        namespace are filled, with a handful of batched queries instead of objExists per object.
+        """
+        buttons = [button for button in self.buttons 
+                   if button.mode == 'select' and button.assigned_objects and 
+                   button.get_cached_selection('objects', namespace) is None]
+        if not buttons:
+            return
+        
+        generation = SE.scene_generation()
+        start_time = time.perf_counter()
+        use_namespace = namespace and namespace != 'None'
+        
+        # Batch 1: UUIDs -> nodes
+        uuid_nodes = NR.nodes_from_uuids(obj_data.get('uuid') for button in buttons for obj_data in button.assigned_objects)
+        
+        # Per object: the name the click path would select before namespacing (same strategy order)
+        button_names = []
+        candidates = set()
+        for button in buttons:
+            names = []
+            for obj_data in button.assigned_objects:
+                long_name = obj_data['long_name']
+                base_name = long_name.split('|')[-1].split(':')[-1]
+                node = uuid_nodes.get(obj_data.get('uuid'))
+                if node:
+                    names.append((obj_data, node.split(':')[-1], base_name, None))
+                else:
+                    fallbacks = [long_name]
+                    if use_namespace:
+                        fallbacks.append(f"{namespace}:{base_name}")
+                    fallbacks.append(base_name)
+                    candidates.update(fallbacks)
+                    names.append((obj_data, None, base_name, fallbacks))
+            button_names.append(names)
+        
+        # Whatever name wins is tried with the namespace prefix first, as in _namespace_selection_nodes
+        if use_namespace:
+            for names in button_names:
+                for _, name, _, fallbacks in names:
+                    candidates.update(f"{namespace}:{candidate}" for candidate in (fallbacks or [name]))
+        
+        # Batch 2: existence of every candidate name in one OpenMaya pass
+        existing = NR.existing_nodes(candidates)
+        
+        elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+        per_button_ms = elapsed_ms / len(buttons)
+        # Later clicks hit these caches, so misses reach the session report here
+        missing_report = MR.MissingObjectsReport.get_instance()
+        for button, names in zip(buttons, button_names):
+            resolved_objects = []
+            missing_objects = set()
+            missing_items = []
+            for obj_data, name, base_name, fallbacks in names:
+                if name is None:
+                    name = next((candidate for candidate in fallbacks if candidate in existing), None)
+                    if name is None:
+                        missing_objects.add(f"- {base_name}")
+                        missing_report.record(button, obj_data, 'object', namespace)
+                        missing_items.append((obj_data, 'object'))
+                        continue
+                missing_report.discard(button, obj_data, 'object')
+                namespaced_node = f"{namespace}:{name}" if use_namespace else name
+                resolved_objects.append(namespaced_node if namespaced_node in existing else name)
+            
+            button.store_selection_cache('objects', namespace, generation, resolved_objects, missing_objects, per_button_ms, missing_items)
+
+    def _namespace_selection_nodes(self, nodes, current_namespace):
+        """Resolve short node names against the current namespace into selectable names"""
+        resolved_selection = []
+        for node in nodes:
+            namespaced_node = f"{current_namespace}:{node}" if current_namespace and current_namespace != 'None' else node
+            if cmds.objExists(namespaced_node):
+                resolved_selection.append(namespaced_node)
+            else:
+                resolved_selection.append(node)
+        return resolved_selection
+
     def _resolve_single_object(self, obj_data, current_namespace):
         """Resolve a single object using multiple fallback strategies"""
         uuid = obj_data['uuid']
@@ -1228,28 +1355,115 @@ class PickerCanvas(QtWidgets.QWidget):
             cmds.select(resolved_selection[-1], toggle=True)
             cmds.select(resolved_selection[-1], add=True)
 
-    def _show_missing_objects_dialog(self, missing_objects):
-        """Show dialog for missing objects"""
-        parent_widget = self.parentWidget()
-        dialog = CD.CustomDialog(
-            parent_widget, 
-            title="Missing Objects", 
-            size=(250, -1), 
-            info_box=True
-        )
+    def _on_missing_report_changed(self, has_new_entries):
+        """Missing objects report listener: keep the HUD count current and note new entries"""
+        if has_new_entries:
+            self._missing_report_has_new = True
+        self.hud.update_missing_count(len(MR.MissingObjectsReport.get_instance()))
+
+    def _report_missing_objects(self):
+        """Surface the session missing-objects report without blocking the caller.
+
+        The panel is opened only when the click added new entries; once the user has closed it,
+        known misses just show up in the HUD count.
+        """
+        if not self._missing_report_has_new:
+            return
+        self._missing_report_has_new = False
+        panel = getattr(self, 'missing_objects_panel', None)
+        if panel is not None and panel.isVisible():
+            return  # Panel refreshes itself from the report
+        QTimer.singleShot(0, self.show_missing_objects_panel)
+
+    def show_missing_objects_panel(self):
+        """Show the non-modal missing objects panel"""
+        if getattr(self, 'missing_objects_panel', None) is None:
+            self.missing_objects_panel = MR.MissingObjectsPanel(self)
+            self.missing_objects_panel.position_window()
+        self.missing_objects_panel.show()
+        self.missing_objects_panel.raise_()
+
+    def show_slowest_buttons_panel(self):
+        """Show the non-modal panel of script/pose button run times"""
+        if getattr(self, 'slowest_buttons_panel', None) is None:
+            self.slowest_buttons_panel = BPF.SlowestButtonsPanel(self)
+            self.slowest_buttons_panel.position_window()
+        self.slowest_buttons_panel.show()
+        self.slowest_buttons_panel.raise_()
+
+    def repair_missing_objects(self, namespace):
+        """Batch-remap every reported missing object onto namespace.
+
+        Object entries are remapped to the node of the same name in namespace. Counterpart entries
+        remap their source the same way and are repaired once the counterpart exists. Entries whose
+        objects resolve again are dropped from the report.
+
+        Returns:
+            tuple: (repaired_count, remaining_count)
+        """
+        report = MR.MissingObjectsReport.get_instance()
+        entries = report.entries()
+        if not entries:
+            return 0, 0
+        
+        prefix = f"{namespace}:" if namespace and namespace != 'None' else ""
+        
+        # One ls for the long names of all candidates and one for their UUIDs. Matches are keyed by
+        # leaf name, so non-unique names (which ls returns as paths) still map back to their candidate
+        found = {}
+        long_names = cmds.ls(list({f"{prefix}{entry['name']}" for entry in entries}), long=True) or []
+        if long_names:
+            uuids = cmds.ls(long_names, uuid=True) or []
+            for long_name, uuid in zip(long_names, uuids):
+                found.setdefault(long_name.split('|')[-1], (long_name, uuid))
+        
+        # Pair entries with their object data before any of it is remapped
+        buttons_by_id = {button.unique_id: button for button in self.buttons}
+        targets = []
+        for entry in entries:
+            button = buttons_by_id.get(entry['button_id'])
+            if button is None:
+                continue
+            obj_data = next((data for data in button.assigned_objects 
+                             if (data.get('uuid') or data.get('long_name')) == entry['item_key']), None)
+            if obj_data is None:
+                # No longer assigned to the button
+                report.remove(entry['button_id'], entry['item_key'], entry['kind'])
+                continue
+            targets.append((entry, button, obj_data))
         
-        message_label = QtWidgets.QLabel("The following objects were not found:")
-        details_label = QtWidgets.QLabel(
-            '\n'.join(sorted(f"<b><font color='#00ade6'>{obj}</font></b>" 
-                            for obj in missing_objects))
-        )
-        note_label = QtWidgets.QLabel("[Objects may have been deleted or renamed]")
+        naming_conventions = self._get_naming_conventions("", "")
+        preference_store = MT.MirrorPreferenceStore.get_instance()
+        changed_buttons = set()
+        repaired = 0
+        
+        for entry, button, obj_data in targets:
+            match = found.get(f"{prefix}{entry['name']}")
+            if match and (obj_data.get('long_name'), obj_data.get('uuid')) != match:
+                obj_data['long_name'], obj_data['uuid'] = match
+                changed_buttons.add(button)
+            
+            source = match[0] if match else self._resolve_object_name_from_data(obj_data, namespace)
+            if source and entry['kind'] == 'counterpart':
+                source_namespace, short_name = self._extract_namespace_and_name(source)
+                mirrored_name, _ = self._find_mirrored_name(
+                    short_name, naming_conventions, preference_store.preferences(source_namespace), source_namespace
+                )
+                resolved = cmds.objExists(mirrored_name)
+            else:
+                resolved = bool(source)
+            
+            if resolved:
+                report.remove(entry['button_id'], entry['item_key'], entry['kind'])
+                changed_buttons.add(button)
+                repaired += 1
         
-        dialog.add_widget(message_label)
-        dialog.add_widget(details_label)
-        dialog.add_widget(note_label)
-        dialog.add_button_box()
-        dialog.exec_()
+        for button in changed_buttons:
+            button.invalidate_selection_cache()
+            button.update_tooltip()
+            button.changed.emit(button)
+        
+        return repaired, len(report)
 
     def _update_ui_state(self, uuid_updates):
         """Update UI state after selection changes"""
@@ -1289,40 +1503,62 @@ class PickerCanvas(QtWidgets.QWidget):
             return [], set(), False
         
         current_namespace = main_window.namespace_dropdown.currentText()
+        
+        cached = button.get_cached_selection('counterparts', current_namespace)
+        if cached is not None:
+            self._record_cached_misses(button, cached, current_namespace)
+            return list(cached['nodes']), set(cached['missing']), False
+        
+        generation = SE.scene_generation()
+        start_time = time.perf_counter()
+        missing_report = MR.MissingObjectsReport.get_instance()
+        
         resolved_counterparts = []
         missing_objects = set()
+        missing_items = []
         uuid_updates = False
         
-        # Get naming conventions and mirror preferences
+        # Get naming conventions and mirror preferences (loaded once per namespace by the store)
         naming_conventions = self._get_naming_conventions("", "")
-        mirror_preferences = self._load_mirror_preferences_for_objects(button.assigned_objects, current_namespace)
+        preference_store = MT.MirrorPreferenceStore.get_instance()
         
         for obj_data in button.assigned_objects:
             resolved_source_obj = self._resolve_object_name_from_data(obj_data, current_namespace)
             
             if resolved_source_obj:
+                missing_report.discard(button, obj_data, 'object')
                 # Find the mirrored object
                 namespace, short_name = self._extract_namespace_and_name(resolved_source_obj)
                 mirrored_name, is_center_object = self._find_mirrored_name(
-                    short_name, naming_conventions, mirror_preferences, namespace
+                    short_name, naming_conventions, preference_store.preferences(namespace), namespace
                 )
                 
                 if cmds.objExists(mirrored_name) and mirrored_name != resolved_source_obj:
                     # Get the short name for selection
                     counterpart_short_name = mirrored_name.split('|')[-1].split(':')[-1]
                     resolved_counterparts.append(counterpart_short_name)
+                    missing_report.discard(button, obj_data, 'counterpart')
                 else:
                     if mirrored_name == resolved_source_obj:
                         # Center object - select itself
                         source_short_name = resolved_source_obj.split('|')[-1].split(':')[-1]
                         resolved_counterparts.append(source_short_name)
+                        missing_report.discard(button, obj_data, 'counterpart')
                     else:
                         # Missing counterpart
                         base_name = obj_data['long_name'].split('|')[-1].split(':')[-1]
                         missing_objects.add(f"- {base_name} (counterpart)")
+                        missing_report.record(button, obj_data, 'counterpart', current_namespace)
+                        missing_items.append((obj_data, 'counterpart'))
             else:
                 base_name = obj_data['long_name'].split('|')[-1].split(':')[-1]
                 missing_objects.add(f"- {base_name}")
+                missing_report.record(button, obj_data, 'object', current_namespace)
+                missing_items.append((obj_data, 'object'))
+        
+        resolved_counterparts = self._namespace_selection_nodes(resolved_counterparts, current_namespace)
+        resolve_ms = (time.perf_counter() - start_time) * 1000.0
+        button.store_selection_cache('counterparts', current_namespace, generation, resolved_counterparts, missing_objects, resolve_ms, missing_items)
         
         return resolved_counterparts, missing_objects, uuid_updates
 
@@ -1486,58 +1722,6 @@ class PickerCanvas(QtWidgets.QWidget):
         
         return None
 
-    def _load_mirror_preferences_for_objects(self, assigned_objects, current_namespace):
-        """
-        Load mirror preferences for assigned objects and their potential counterparts.
-        
-        Args:
-            assigned_objects (list): List of assigned object data
-            current_namespace (str): Current namespace
-            
-        Returns:
-            dict: Dictionary of mirror preferences
-        """
-        import json
-        mirror_preferences = {}
-        naming_conventions = self._get_naming_conventions("", "")
-        
-        # Load mirror preferences for all assigned objects
-        for obj_data in assigned_objects:
-            resolved_obj = self._resolve_object_name_from_data(obj_data, current_namespace)
-            if resolved_obj and cmds.objExists(resolved_obj):
-                namespace, short_name = self._extract_namespace_and_name(resolved_obj)
-                
-                if cmds.attributeQuery("mirrorPreference", node=resolved_obj, exists=True):
-                    try:
-                        pref_data_str = cmds.getAttr(f"{resolved_obj}.mirrorPreference")
-                        mirror_preferences[short_name] = json.loads(pref_data_str)
-                    except (json.JSONDecodeError, Exception) as e:
-                        print(f"Error loading mirror preferences for {resolved_obj}: {e}")
-        
-        # Also load mirror preferences for potential counterparts
-        potential_counterparts = set()
-        for obj_data in assigned_objects:
-            resolved_obj = self._resolve_object_name_from_data(obj_data, current_namespace)
-            if resolved_obj:
-                namespace, short_name = self._extract_namespace_and_name(resolved_obj)
-                # Find the potential counterpart name
-                counterpart_name, _ = self._find_mirrored_name(short_name, naming_conventions, namespace=namespace)
-                if counterpart_name != resolved_obj:
-                    potential_counterparts.add(counterpart_name)
-        
-        # Load preferences for counterparts if they exist
-        for counterpart in potential_counterparts:
-            if cmds.objExists(counterpart):
-                counterpart_namespace, counterpart_short = self._extract_namespace_and_name(counterpart)
-                if counterpart_short not in mirror_preferences:
-                    if cmds.attributeQuery("mirrorPreference", node=counterpart, exists=True):
-                        try:
-                            pref_data_str = cmds.getAttr(f"{counterpart}.mirrorPreference")
-                            mirror_preferences[counterpart_short] = json.loads(pref_data_str)
-                        except (json.JSONDecodeError, Exception) as e:
-                            print(f"Error loading mirror preferences for counterpart {counterpart}: {e}")
-        
-        return mirror_preferences
     #------------------------------------------------------------------------------
     def clear_selection(self):
         selection_changed = False
@@ -1604,9 +1788,30 @@ class PickerCanvas(QtWidgets.QWidget):
         if hasattr(self, 'transform_guides'):
             QtCore.QTimer.singleShot(10, self.transform_guides.update_selection)
     #------------------------------------------------------------------------------
+    def button_by_id(self, unique_id):
+        """First button with unique_id, or None.
+
+        Lookups go through an id index that is rebuilt when buttons are added or removed (the list
+        length changed) or when the indexed button no longer carries the id.
+        """
+        button = self._button_index.get(unique_id)
+        if (button is not None and self._button_index_size == len(self.buttons) and
+                getattr(button, 'unique_id', None) == unique_id):
+            return button
+        
+        self._button_index = {}
+        for button in reversed(self.buttons):
+            self._button_index[getattr(button, 'unique_id', None)] = button
+        self._button_index_size = len(self.buttons)
+        return self._button_index.get(unique_id)
+
+    def _invalidate_button_index(self):
+        self._button_index_size = -1
+
     def add_button(self, button):
         # Preserve original functionality
         self.buttons.append(button)
+        self._invalidate_button_index()
         button.setParent(self)
         button.show()
         button.deleted.connect(self.remove_button)
@@ -1627,6 +1832,7 @@ class PickerCanvas(QtWidgets.QWidget):
                 self._hide_button_tooltip()
             
             self.buttons.remove(button)
+            self._invalidate_button_index()
             self.update_button_positions()
             main_window = self.window()
             if isinstance(main_window, UI.AnimPickerWindow):
@@ -2879,6 +3085,10 @@ class PickerCanvas(QtWidgets.QWidget):
             if isinstance(main_window, UI.AnimPickerWindow):
                 edit_mode_action.triggered.connect(main_window.toggle_edit_mode)
         
+        menu.addSeparator()
+        profiler_action = menu.addAction(QtGui.QIcon(UT.get_icon('code.png')), "Slowest Buttons")
+        profiler_action.triggered.connect(self.show_slowest_buttons_panel)
+        
         if menu.actions():
             menu.exec_(self.mapToGlobal(position))
 
@@ -3021,8 +3231,8 @@ class PickerCanvas(QtWidgets.QWidget):
                 if new_button.mode == 'pose':
                     if hasattr(new_button, 'thumbnail_path') and new_button.thumbnail_path:
                         button_data_for_db["thumbnail_path"] = new_button.thumbnail_path
-                    if hasattr(new_button, 'pose_data') and new_button.pose_data:
-                        button_data_for_db["pose_data"] = new_button.pose_data
+                    if new_button.has_pose():
+                        button_data_for_db["pose_data"] = new_button.pose_document_data()
                 
                 new_buttons_data.append(button_data_for_db)
             
@@ -3112,7 +3322,7 @@ class PickerCanvas(QtWidgets.QWidget):
             # Apply counterpart mirroring to assigned objects if requested
             if apply_counterparts and button.assigned_objects:
                 mirrored_objects = []
-                mirror_preferences = self._load_mirror_preferences_for_objects(button.assigned_objects, current_namespace)
+                preference_store = MT.MirrorPreferenceStore.get_instance()
                 
                 for obj_data in button.assigned_objects:
                     try:
@@ -3123,7 +3333,7 @@ class PickerCanvas(QtWidgets.QWidget):
                             # Find counterpart using existing function
                             namespace, short_name = self._extract_namespace_and_name(resolved_obj)
                             mirrored_name, is_center_object = self._find_mirrored_name(
-                                short_name, naming_conventions, mirror_preferences, namespace
+                                short_name, naming_conventions, preference_store.preferences(namespace), namespace
                             )
                             
                             if cmds.objExists(mirrored_name):
@@ -3289,6 +3499,14 @@ class PickerCanvas(QtWidgets.QWidget):
         
         # Handle HUD events
         hud_pos = self.hud.mapFromParent(event.pos())
+        if self.hud.script_queue_label.isVisible() and self.hud.script_queue_label.geometry().contains(hud_pos):
+            SQ.ScriptQueue.get_instance().cancel()
+            event.accept()
+            return
+        if self.hud.missing_objects_label.isVisible() and self.hud.missing_objects_label.geometry().contains(hud_pos):
+            self.show_missing_objects_panel()
+            event.accept()
+            return
         if self.hud.button_container.geometry().contains(hud_pos):
             self.hud.toggle_button.click()
             return
@@ -3559,5 +3777,7 @@ class PickerCanvas(QtWidgets.QWidget):
             self.transform_guides.deleteLater()
         
         if hasattr(self, 'hud'):
+            SQ.ScriptQueue.get_instance().remove_listener(self.hud.update_script_queue_depth)
+            MR.MissingObjectsReport.get_instance().remove_listener(self._on_missing_report_changed)
             self.hud.deleteLater()
 
@@ -11,6 +11,7 @@ except ImportError:
 from . import custom_dialog as CD
 from . import main as MAIN
 from . import custom_button as CB
+from . import pose_library as PL
 
 def get_file_dialog_directory():
     """
@@ -240,6 +241,9 @@ def store_picker_data(file_path, current_tab_name=None, save_mode='all'):
     if not data or not data.get('tabs'):
         raise RuntimeError("No picker data available to save")
     
+    # Exported pickers carry their poses so they work without this machine's pose library
+    data = PL.inline_pose_refs(data)
+    
     # Ensure file has .json extension
     if not file_path.lower().endswith('.json'):
         file_path += '.json'
@@ -317,7 +321,8 @@ def load_picker_data(file_path):
         if tab_name not in merged_data['tabs']:
             merged_data['tabs'][tab_name] = tab_data
     
-    # Save the merged data
+    # Save the merged data (imported poses move into the pose library)
+    PL.externalize_pose_data(merged_data)
     try:
         cmds.setAttr('defaultObjectSet.PickerToolData', json.dumps(merged_data), type='string')
     except Exception as e:
@@ -0,0 +1,200 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+try:
+    from PySide6 import QtWidgets, QtCore
+except ImportError:
+    from PySide2 import QtWidgets, QtCore
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import pose_engine as PE
+
+#----------------------------------------------------------------------------------------------------------
+# POSE BLENDING
+#----------------------------------------------------------------------------------------------------------
+# A blend session packs the current and stored values of every scalar pose attribute into NumPy
+# buffers once. Each drag/slider tick is then one vectorized lerp (discrete attributes switch at
+# the halfway point) written through a single MDGModifier. Those preview writes bypass the undo
+# queue; committing restores the start values and writes the final pose through the undoable
+# pose_engine path, so the whole blend is one undo step.
+
+BLEND_DRAG_DISTANCE = 200  # Pixels of horizontal drag for a full (0-100%) blend
+
+_DISCRETE_KINDS = ('enum', 'bool', 'int')
+
+def blending_available():
+    return np is not None
+
+class PoseBlendSession:
+    """Interpolates from the current pose to a stored pose"""
+    def __init__(self, button_id, pose_data, namespace):
+        if np is None:
+            raise RuntimeError("Pose blending requires NumPy")
+
+        targets, _ = PE.get_pose_targets(button_id, "default", pose_data, namespace)
+
+        self.targets = []
+        self.entries = []  # (target index, attr, plug, kind)
+        start_values = []
+        goal_values = []
+        for target in targets:
+            if not target['handle'].isValid():
+                continue
+            attr_values = pose_data.get(target['name'], {})
+            target_index = len(self.targets)
+            self.targets.append(target)
+
+            for attr, plug in target['plugs'].items():
+                goal = attr_values.get(attr)
+                if isinstance(goal, list) or not isinstance(goal, (bool, int, float)) or plug.isLocked:
+                    continue
+                kind = PE.plug_value_kind(plug)
+                if kind is None:
+                    continue
+                try:
+                    current = PE.read_plug_value(plug, f"{target['path']}.{attr}", kind)
+                except Exception:
+                    continue
+                self.entries.append((target_index, attr, plug, kind))
+                start_values.append(float(current))
+                goal_values.append(float(goal))
+
+        self.start = np.array(start_values, dtype=np.float64)
+        self.goal = np.array(goal_values, dtype=np.float64)
+        self.delta = self.goal - self.start
+        self.discrete = np.array([entry[3] in _DISCRETE_KINDS for entry in self.entries], dtype=bool)
+        self.weight = 0.0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def values(self, weight):
+        """Blended values for weight (0 = start pose, 1 = stored pose)"""
+        blended = self.start + self.delta * weight
+        return np.where(self.discrete, self.goal if weight >= 0.5 else self.start, blended)
+
+    def preview(self, weight):
+        """Write the blend for weight in one MDGModifier pass (not undoable)"""
+        weight = min(max(weight, 0.0), 1.0)
+        self._write_preview(self.values(weight))
+        self.weight = weight
+
+    def commit(self):
+        """Make the current blend a single undoable step. Returns the number of attributes written"""
+        final_values = self.values(self.weight).tolist()
+        self._write_preview(self.start)
+
+        attr_values_by_target = {}
+        for (target_index, attr, plug, kind), value in zip(self.entries, final_values):
+            if kind in _DISCRETE_KINDS:
+                value = int(round(value)) if kind != 'bool' else bool(round(value))
+            attr_values_by_target.setdefault(target_index, {})[attr] = value
+
+        written = 0
+        cmds.undoInfo(openChunk=True, chunkName="Blend Pose")
+        try:
+            for target_index, attr_values in attr_values_by_target.items():
+                target_written, _ = PE.write_target(self.targets[target_index], attr_values)
+                written += target_written
+        finally:
+            cmds.undoInfo(closeChunk=True)
+        return written
+
+    def cancel(self):
+        self._write_preview(self.start)
+        self.weight = 0.0
+
+    def _write_preview(self, values):
+        modifier = om.MDGModifier()
+        for (target_index, attr, plug, kind), value in zip(self.entries, values.tolist()):
+            try:
+                if kind == 'angle':
+                    modifier.newPlugValueMAngle(plug, om.MAngle(value, om.MAngle.uiUnit()))
+                elif kind == 'distance':
+                    modifier.newPlugValueMDistance(plug, om.MDistance(value, om.MDistance.uiUnit()))
+                elif kind == 'time':
+                    modifier.newPlugValueMTime(plug, om.MTime(value, om.MTime.uiUnit()))
+                elif kind == 'bool':
+                    modifier.newPlugValueBool(plug, bool(round(value)))
+                elif kind in ('enum', 'int'):
+                    modifier.newPlugValueInt(plug, int(round(value)))
+                else:
+                    modifier.newPlugValueDouble(plug, value)
+            except RuntimeError:
+                continue
+        modifier.doIt()
+
+class PoseBlendSlider(QtWidgets.QWidget):
+    """Popup slider blending the current pose towards a pose button's stored pose"""
+    def __init__(self, button, parent=None):
+        super(PoseBlendSlider, self).__init__(parent or button.window())
+        self.setWindowFlags(QtCore.Qt.Popup | QtCore.Qt.FramelessWindowHint | QtCore.Qt.NoDropShadowWindowHint)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+        self.button = button
+
+        self.main_layout = QtWidgets.QVBoxLayout(self)
+        self.main_layout.setContentsMargins(4, 4, 4, 4)
+
+        self.frame = QtWidgets.QFrame()
+        self.frame.setFixedWidth(200)
+        self.frame.setStyleSheet("""
+            QFrame {
+                background-color: rgba(36, 36, 36, .9);
+                border: 1px solid #444444;
+                border-radius: 4px;
+            }
+        """)
+        frame_layout = QtWidgets.QVBoxLayout(self.frame)
+        frame_layout.setContentsMargins(6, 6, 6, 6)
+        frame_layout.setSpacing(4)
+
+        self.title_label = QtWidgets.QLabel(f"Blend: {button.label or 'Pose'}")
+        self.title_label.setStyleSheet("color: #dddddd; background: transparent; border: none;")
+
+        self.slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
+        self.slider.setRange(0, 100)
+        self.slider.setStyleSheet("""
+            QSlider { background: transparent; border: none; }
+            QSlider::groove:horizontal { height: 4px; background: #1e1e1e; border-radius: 2px; }
+            QSlider::sub-page:horizontal { background: #5285a6; border-radius: 2px; }
+            QSlider::handle:horizontal { background: #dddddd; width: 10px; margin: -4px 0; border-radius: 5px; }
+        """)
+
+        frame_layout.addWidget(self.title_label)
+        frame_layout.addWidget(self.slider)
+        self.main_layout.addWidget(self.frame)
+
+        self.slider.sliderPressed.connect(self._on_slider_pressed)
+        self.slider.valueChanged.connect(self._on_value_changed)
+        self.slider.sliderReleased.connect(self._on_slider_released)
+
+    def _on_slider_pressed(self):
+        self.button.start_pose_blend()
+
+    def _on_value_changed(self, value):
+        self.title_label.setText(f"Blend: {self.button.label or 'Pose'}  {value}%")
+        if not self.button.is_pose_blending():
+            # Keyboard and click-on-groove changes are applied as one step each
+            if self.button.start_pose_blend():
+                self.button.update_pose_blend(value / 100.0)
+                self.button.finish_pose_blend()
+            return
+        self.button.update_pose_blend(value / 100.0)
+
+    def _on_slider_released(self):
+        self.button.finish_pose_blend()
+
+    def show_at(self, global_pos):
+        self.slider.blockSignals(True)
+        self.slider.setValue(0)
+        self.slider.blockSignals(False)
+        self.title_label.setText(f"Blend: {self.button.label or 'Pose'}")
+        self.move(global_pos)
+        self.show()
+
+    def closeEvent(self, event):
+        self.button.finish_pose_blend()
+        super().closeEvent(event)
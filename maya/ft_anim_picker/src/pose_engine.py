@@ -0,0 +1,472 @@
+import time
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from . import scene_events as SE
+
+#----------------------------------------------------------------------------------------------------------
+# PLUG-CACHED POSE APPLICATION
+#----------------------------------------------------------------------------------------------------------
+# Pose targets (nodes and their MPlugs) are resolved once per (button, pose, namespace) and reused
+# until the scene generation changes. Applying a pose then only checks plug locks through the API
+# and writes values with setAttr, grouping compound children (translate/rotate/scale, ...) into a
+# single setAttr on the parent. Writes stay on cmds.setAttr so the whole pose lands in Maya's undo
+# queue; an MDGModifier would be faster but is not undoable outside of an MPxCommand.
+# Current values are read from the plugs first and attributes already within POSE_TOLERANCE of the
+# stored value are skipped, so re-applying a pose neither dirties the rig nor adds undo entries.
+# With key=True the attributes the pose touched (written or already at the pose value) are keyed
+# with a single setKeyframe call on that plug list.
+
+POSE_TOLERANCE = 1e-4
+
+_plug_caches = {}  # (button_id, pose_name, namespace) -> cache entry
+
+def clear_plug_caches():
+    _plug_caches.clear()
+
+def _on_scene_changed(reason):
+    if reason == 'scene':
+        clear_plug_caches()
+
+SE.SceneEvents.get_instance().add_listener(_on_scene_changed)
+
+def _pose_signature(pose_data):
+    """Objects and attribute names of a pose (values do not affect resolution)"""
+    return tuple((obj_name, tuple(attr_values)) for obj_name, attr_values in pose_data.items())
+
+def _get_node(name):
+    """Return (MObject, unique path) for name, or None if it does not exist"""
+    selection = om.MSelectionList()
+    try:
+        selection.add(name)
+    except RuntimeError:
+        return None
+
+    try:
+        dag_path = selection.getDagPath(0)
+        return dag_path.node(), dag_path.fullPathName()
+    except TypeError:
+        node = selection.getDependNode(0)
+        return node, om.MFnDependencyNode(node).name()
+
+def resolve_pose_node(obj_name, namespace):
+    """Resolve a stored pose object name: as stored, then namespace:base, then base name"""
+    node = _get_node(obj_name)
+    if node:
+        return node
+
+    base_name = obj_name.split('|')[-1].split(':')[-1]
+    if namespace:
+        node = _get_node(f"{namespace}:{base_name}")
+        if node:
+            return node
+
+    return _get_node(base_name)
+
+def _find_plug(node, node_path, attr):
+    try:
+        return om.MFnDependencyNode(node).findPlug(attr, False)
+    except RuntimeError:
+        pass
+
+    # Attribute paths such as compound children or indexed elements
+    selection = om.MSelectionList()
+    try:
+        selection.add(f"{node_path}.{attr}")
+        return selection.getPlug(0)
+    except (RuntimeError, TypeError):
+        return None
+
+def resolve_pose_targets(pose_data, namespace):
+    """Resolve every object and attribute of a pose to MPlugs.
+
+    Returns a list of target dicts: {'name', 'path', 'handle', 'plugs': {attr: MPlug}}.
+    """
+    targets = []
+    for obj_name, attr_values in pose_data.items():
+        resolved = resolve_pose_node(obj_name, namespace)
+        if not resolved:
+            continue
+
+        node, node_path = resolved
+        plugs = {}
+        for attr in attr_values:
+            plug = _find_plug(node, node_path, attr)
+            if plug is not None:
+                plugs[attr] = plug
+
+        targets.append({
+            'name': obj_name,
+            'path': node_path,
+            'handle': om.MObjectHandle(node),
+            'plugs': plugs,
+        })
+    return targets
+
+def get_pose_targets(button_id, pose_name, pose_data, namespace):
+    """Cached resolve_pose_targets. Returns (targets, cache_hit)"""
+    key = (button_id, pose_name, namespace)
+    signature = _pose_signature(pose_data)
+
+    entry = _plug_caches.get(key)
+    if (entry is not None and entry['signature'] == signature and
+        SE.SceneEvents.get_instance().is_current(entry['generation'])):
+        return entry['targets'], True
+
+    generation = SE.scene_generation()
+    targets = resolve_pose_targets(pose_data, namespace)
+    if button_id is not None:
+        _plug_caches[key] = {'generation': generation, 'signature': signature, 'targets': targets}
+    return targets, False
+
+def _set_value(attr_path, value):
+    try:
+        if isinstance(value, list):
+            for i, val in enumerate(value):
+                cmds.setAttr(f"{attr_path}[{i}]", val)
+        else:
+            cmds.setAttr(attr_path, value)
+        return True
+    except Exception as e:
+        print(f"Error setting attribute {attr_path}: {e}")
+        return False
+
+def _values_match(current, value, tolerance=POSE_TOLERANCE):
+    if isinstance(value, bool) or isinstance(current, bool):
+        return bool(current) == bool(value)
+    if isinstance(value, (int, float)) and isinstance(current, (int, float)):
+        return abs(current - value) <= tolerance
+    return False
+
+def _is_unchanged(plug, attr_path, value):
+    """True if the plug already holds value (lists and unreadable plugs count as changed)"""
+    if isinstance(value, list):
+        return False
+    try:
+        return _values_match(read_plug_value(plug, attr_path), value)
+    except Exception:
+        return False
+
+def write_target(target, attr_values, touched=None):
+    """Write the differing attr_values to one resolved target. Returns (written, skipped) counts.
+
+    If touched is a list, the paths of the attributes written or already at the pose value are
+    appended to it.
+    """
+    node_path = target['path']
+    written = 0
+    skipped = 0
+    compounds = {}  # parent attribute path -> (parent plug, [(child plug, value), ...])
+
+    for attr, plug in target['plugs'].items():
+        if attr not in attr_values:
+            continue
+        value = attr_values[attr]
+
+        if plug.isLocked:
+            continue
+
+        if _is_unchanged(plug, f"{node_path}.{attr}", value):
+            skipped += 1
+            if touched is not None:
+                touched.append(f"{node_path}.{attr}")
+            continue
+
+        if plug.isChild and not isinstance(value, list):
+            parent = plug.parent()
+            parent_path = f"{node_path}.{parent.partialName(useLongNames=True)}"
+            compounds.setdefault(parent_path, (parent, []))[1].append((plug, value))
+            continue
+
+        if _set_value(f"{node_path}.{attr}", value):
+            written += 1
+            if touched is not None:
+                touched.append(f"{node_path}.{attr}")
+
+    for parent_path, (parent, children) in compounds.items():
+        # One setAttr for the whole compound when every child changed and the parent is free
+        if len(children) == parent.numChildren() and not parent.isLocked:
+            ordered = []
+            for index in range(parent.numChildren()):
+                child_plug = parent.child(index)
+                ordered.extend(value for plug, value in children if plug == child_plug)
+            if len(ordered) == len(children):
+                try:
+                    cmds.setAttr(parent_path, *ordered)
+                    written += len(children)
+                    if touched is not None:
+                        touched.extend(f"{node_path}.{plug.partialName(useLongNames=True)}" for plug, _ in children)
+                    continue
+                except Exception:
+                    pass
+
+        for plug, value in children:
+            child_path = f"{node_path}.{plug.partialName(useLongNames=True)}"
+            if _set_value(child_path, value):
+                written += 1
+                if touched is not None:
+                    touched.append(child_path)
+
+    return written, skipped
+
+def apply_pose(button_id, pose_name, pose_data, namespace, key=False):
+    """Apply pose_data through the plug cache, optionally keying the touched attributes.
+
+    Returns (posed object paths, stats) where stats holds the apply time in ms, the number of
+    objects, the attributes written, skipped (already at the pose value) and keyed, and whether
+    the resolved targets came from the cache.
+    """
+    start_time = time.perf_counter()
+    targets, cache_hit = get_pose_targets(button_id, pose_name, pose_data, namespace)
+
+    posed_objects = []
+    touched = [] if key else None
+    written = 0
+    skipped = 0
+    for target in targets:
+        if not target['handle'].isValid():
+            continue
+        attr_values = pose_data.get(target['name'], {})
+        target_written, target_skipped = write_target(target, attr_values, touched)
+        if target_written or target_skipped:
+            posed_objects.append(target['path'])
+            written += target_written
+            skipped += target_skipped
+
+    keyed = 0
+    if touched:
+        try:
+            keyed = cmds.setKeyframe(touched) or 0
+        except Exception as e:
+            print(f"Error keying pose attributes: {e}")
+
+    stats = {
+        'ms': (time.perf_counter() - start_time) * 1000.0,
+        'objects': len(posed_objects),
+        'attributes': written,
+        'skipped': skipped,
+        'keyed': keyed,
+        'cached': cache_hit,
+    }
+    return posed_objects, stats
+
+#----------------------------------------------------------------------------------------------------------
+# FRAME RANGE KEYING
+#----------------------------------------------------------------------------------------------------------
+# Stamping a pose on many frames keys the stored values straight into the animation curves:
+# setKeyframe with explicit time and value lists never changes the current time, so the rig is
+# not evaluated per frame. Attributes sharing a value (zeroed translates, unit scales, ...) are
+# keyed together, so the number of setKeyframe calls follows the distinct pose values and the
+# work follows the keys written.
+
+def key_pose_range(button_id, pose_name, pose_data, namespace, frames):
+    """Key pose_data at every frame in frames without changing the current time or pose.
+
+    Returns (keyed object paths, stats) where stats holds the time in ms, the number of objects,
+    attributes and frames, and the keys written.
+    """
+    start_time = time.perf_counter()
+    targets, cache_hit = get_pose_targets(button_id, pose_name, pose_data, namespace)
+    frames = list(frames)
+
+    attrs_by_value = {}  # value -> [attribute paths]
+    keyed_objects = []
+    for target in targets:
+        if not target['handle'].isValid():
+            continue
+        node_path = target['path']
+        attr_values = pose_data.get(target['name'], {})
+        target_attrs = 0
+        for attr, plug in target['plugs'].items():
+            value = attr_values.get(attr)
+            if value is None or plug.isLocked:
+                continue
+            if isinstance(value, list):
+                for index, element in enumerate(value):
+                    attrs_by_value.setdefault(element, []).append(f"{node_path}.{attr}[{index}]")
+            elif isinstance(value, (bool, int, float)):
+                attrs_by_value.setdefault(value, []).append(f"{node_path}.{attr}")
+            else:
+                continue
+            target_attrs += 1
+        if target_attrs:
+            keyed_objects.append(node_path)
+
+    keys = 0
+    attributes = 0
+    if frames:
+        for value, attr_paths in attrs_by_value.items():
+            try:
+                keys += cmds.setKeyframe(attr_paths, time=frames, value=float(value)) or 0
+                attributes += len(attr_paths)
+            except Exception as e:
+                print(f"Error keying {', '.join(attr_paths)}: {e}")
+
+    stats = {
+        'ms': (time.perf_counter() - start_time) * 1000.0,
+        'objects': len(keyed_objects),
+        'attributes': attributes,
+        'frames': len(frames),
+        'keys': keys,
+        'cached': cache_hit,
+    }
+    return keyed_objects, stats
+
+#----------------------------------------------------------------------------------------------------------
+# TRANSFORM RESET
+#----------------------------------------------------------------------------------------------------------
+# Resetting walks the selection through OpenMaya instead of getAttr(lock)/connectionInfo/nodeType
+# per channel: plugs come from one findPlug each, lock state and incoming connections are read
+# from the plugs, and channels driven by anything other than an animation curve are left alone.
+# Default values are the attribute defaults (so rigs that set their own with addAttr -dv are
+# respected). The writes go through write_target, which skips channels already at their default
+# and sets each compound (translate/rotate/scale) with a single setAttr.
+
+RESET_MOVE_ATTRS = ('translateX', 'translateY', 'translateZ')
+RESET_ROTATE_ATTRS = ('rotateX', 'rotateY', 'rotateZ')
+RESET_SCALE_ATTRS = ('scaleX', 'scaleY', 'scaleZ')
+RESET_ALL_ATTRS = RESET_MOVE_ATTRS + RESET_ROTATE_ATTRS + RESET_SCALE_ATTRS
+
+def attribute_default(plug):
+    """Default value of a scalar plug's attribute in UI units, or None if it has none"""
+    attr = plug.attribute()
+    try:
+        if attr.hasFn(om.MFn.kUnitAttribute):
+            default = om.MFnUnitAttribute(attr).default
+            if isinstance(default, (om.MAngle, om.MDistance, om.MTime)):
+                return default.asUnits(type(default).uiUnit())
+            return default
+        if attr.hasFn(om.MFn.kEnumAttribute):
+            return om.MFnEnumAttribute(attr).default
+        if attr.hasFn(om.MFn.kNumericAttribute):
+            return om.MFnNumericAttribute(attr).default
+    except (RuntimeError, TypeError):
+        pass
+    return None
+
+def _driven_by_non_key(plug):
+    """True if the plug (or its compound parent) has an incoming connection that is not an anim curve"""
+    plugs = [plug, plug.parent()] if plug.isChild else [plug]
+    for current in plugs:
+        if not current.isDestination:
+            continue
+        source = current.source()
+        if source.isNull or not source.node().hasFn(om.MFn.kAnimCurve):
+            return True
+    return False
+
+def reset_attributes(nodes, attrs):
+    """Reset attrs on every node to their default values. Returns the number of attributes written"""
+    written = 0
+    for node_name in nodes:
+        resolved = _get_node(node_name)
+        if not resolved:
+            continue
+        node, node_path = resolved
+        target = {'path': node_path, 'plugs': {}}
+        defaults = {}
+        for attr in attrs:
+            plug = _find_plug(node, node_path, attr)
+            if plug is None or plug.isLocked or _driven_by_non_key(plug):
+                continue
+            default = attribute_default(plug)
+            if default is None:
+                continue
+            target['plugs'][attr] = plug
+            defaults[attr] = default
+
+        if defaults:
+            target_written, _ = write_target(target, defaults)
+            written += target_written
+    return written
+
+#----------------------------------------------------------------------------------------------------------
+# KEYABLE ATTRIBUTE CAPTURE
+#----------------------------------------------------------------------------------------------------------
+# Pose capture reads values straight from MPlugs instead of objExists + getAttr per attribute.
+# Attribute names come from one listAttr(keyable, unlocked) per node, which filters locked plugs in
+# the same query and keeps the exact naming of listAttr (leaf children, multi elements). Values are
+# converted to UI units so the captured dict matches what getAttr returned before.
+
+_INT_TYPES = (om.MFnNumericData.kByte, om.MFnNumericData.kChar, om.MFnNumericData.kShort,
+              om.MFnNumericData.kInt, om.MFnNumericData.kAddr)
+_FLOAT_TYPES = (om.MFnNumericData.kFloat, om.MFnNumericData.kDouble)
+
+def plug_value_kind(plug):
+    """Value kind of a scalar plug: 'angle', 'distance', 'time', 'enum', 'bool', 'int', 'float' or None"""
+    attr = plug.attribute()
+
+    if attr.hasFn(om.MFn.kUnitAttribute):
+        unit_type = om.MFnUnitAttribute(attr).unitType()
+        if unit_type == om.MFnUnitAttribute.kAngle:
+            return 'angle'
+        if unit_type == om.MFnUnitAttribute.kDistance:
+            return 'distance'
+        if unit_type == om.MFnUnitAttribute.kTime:
+            return 'time'
+    elif attr.hasFn(om.MFn.kEnumAttribute):
+        return 'enum'
+    elif attr.hasFn(om.MFn.kNumericAttribute):
+        numeric_type = om.MFnNumericAttribute(attr).numericType()
+        if numeric_type == om.MFnNumericData.kBoolean:
+            return 'bool'
+        if numeric_type in _INT_TYPES:
+            return 'int'
+        if numeric_type in _FLOAT_TYPES:
+            return 'float'
+    return None
+
+def read_plug_value(plug, attr_path, kind=None):
+    """Value of a plug as cmds.getAttr would return it"""
+    kind = kind or plug_value_kind(plug)
+
+    if kind == 'angle':
+        return plug.asMAngle().asUnits(om.MAngle.uiUnit())
+    if kind == 'distance':
+        return plug.asMDistance().asUnits(om.MDistance.uiUnit())
+    if kind == 'time':
+        return plug.asMTime().asUnits(om.MTime.uiUnit())
+    if kind == 'enum':
+        return plug.asShort()
+    if kind == 'bool':
+        return plug.asBool()
+    if kind == 'int':
+        return plug.asInt()
+    if kind == 'float':
+        return plug.asDouble()
+
+    # Compound, typed and other attributes keep getAttr's formatting
+    return cmds.getAttr(attr_path)
+
+def capture_keyable_values(nodes, skip_locked=True):
+    """Read the keyable attribute values of nodes.
+
+    Returns {node: {attr: value}} with the node names as passed in; nodes without readable
+    keyable attributes are left out.
+    """
+    captured = {}
+    for node_name in nodes:
+        resolved = _get_node(node_name)
+        if not resolved:
+            continue
+        node, node_path = resolved
+
+        if skip_locked:
+            attrs = cmds.listAttr(node_path, keyable=True, unlocked=True) or []
+        else:
+            attrs = cmds.listAttr(node_path, keyable=True) or []
+
+        attr_values = {}
+        for attr in attrs:
+            attr_path = f"{node_path}.{attr}"
+            try:
+                plug = _find_plug(node, node_path, attr)
+                if plug is None:
+                    continue
+                attr_values[attr] = read_plug_value(plug, attr_path)
+            except Exception as e:
+                print(f"Error getting attribute {attr} from {node_name}: {e}")
+
+        if attr_values:
+            captured[node_name] = attr_values
+    return captured
@@ -0,0 +1,119 @@
+import os
+import json
+import hashlib
+from collections import OrderedDict
+
+import maya.cmds as cmds
+
+#----------------------------------------------------------------------------------------------------------
+# POSE LIBRARY
+#----------------------------------------------------------------------------------------------------------
+# Pose data lives outside the picker document as content-addressed JSON files (<sha1>.json) in the
+# pose library directory; buttons and the document only keep a {'library_ref': <sha1>} reference.
+# Identical poses share one file and a file never changes once written. Loaded poses are kept in
+# a small LRU so applying a pose only reads from disk the first time. Exported picker files get
+# their poses inlined again (see inline_pose_refs) so they stay self-contained.
+
+LIBRARY_REF_KEY = 'library_ref'
+LIBRARY_DIR_ENV = 'FT_ANIM_PICKER_POSE_LIBRARY'
+
+def is_pose_ref(value):
+    return isinstance(value, dict) and LIBRARY_REF_KEY in value
+
+def default_library_directory():
+    """$FT_ANIM_PICKER_POSE_LIBRARY, or ft_anim_picker/pose_library in the Maya user app directory"""
+    directory = os.environ.get(LIBRARY_DIR_ENV)
+    if directory:
+        return directory
+    return os.path.join(cmds.internalVar(userAppDir=True), 'ft_anim_picker', 'pose_library')
+
+class PoseLibrary:
+    """Content-addressed pose store with an LRU of loaded poses"""
+    _instance = None
+    MAX_CACHED_POSES = 64
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = PoseLibrary()
+        return cls._instance
+
+    def __init__(self, directory=None):
+        self.directory = directory or default_library_directory()
+        self._cache = OrderedDict()  # digest -> pose data
+
+    def _path(self, digest):
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def store(self, pose_data):
+        """Write pose_data to the library (if not there yet) and return its reference"""
+        content = json.dumps(pose_data, sort_keys=True, separators=(',', ':'))
+        digest = hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+        path = self._path(digest)
+        if not os.path.exists(path):
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'w') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+
+        self._remember(digest, pose_data)
+        return {LIBRARY_REF_KEY: digest}
+
+    def load(self, pose_ref):
+        """Pose data for a reference, or None if the library file is missing"""
+        digest = pose_ref.get(LIBRARY_REF_KEY)
+        if not digest:
+            return None
+
+        if digest in self._cache:
+            self._cache.move_to_end(digest)
+            return self._cache[digest]
+
+        try:
+            with open(self._path(digest), 'r') as f:
+                pose_data = json.load(f, object_pairs_hook=OrderedDict)
+        except (OSError, ValueError) as e:
+            print(f"Could not load pose {digest} from library {self.directory}: {e}")
+            return None
+
+        self._remember(digest, pose_data)
+        return pose_data
+
+    def _remember(self, digest, pose_data):
+        self._cache[digest] = pose_data
+        self._cache.move_to_end(digest)
+        while len(self._cache) > self.MAX_CACHED_POSES:
+            self._cache.popitem(last=False)
+
+def externalize_pose_data(data):
+    """Replace inline button pose data in a picker document with library references (in place)"""
+    library = PoseLibrary.get_instance()
+    for tab_data in data.get('tabs', {}).values():
+        for button_data in tab_data.get('buttons', []):
+            pose_data = button_data.get('pose_data')
+            if pose_data and not is_pose_ref(pose_data):
+                try:
+                    button_data['pose_data'] = library.store(pose_data)
+                except OSError as e:
+                    print(f"Could not store pose in library, keeping it in the picker data: {e}")
+    return data
+
+def inline_pose_refs(data):
+    """Copy of a picker document with library references replaced by the pose data itself"""
+    library = PoseLibrary.get_instance()
+    inlined = dict(data)
+    inlined['tabs'] = OrderedDict()
+    for tab_name, tab_data in data.get('tabs', {}).items():
+        tab_copy = dict(tab_data)
+        tab_copy['buttons'] = []
+        for button_data in tab_data.get('buttons', []):
+            pose_data = button_data.get('pose_data')
+            if is_pose_ref(pose_data):
+                loaded = library.load(pose_data)
+                if loaded is not None:
+                    button_data = dict(button_data, pose_data=loaded)
+            tab_copy['buttons'].append(button_data)
+        inlined['tabs'][tab_name] = tab_copy
+    return inlined
@@ -0,0 +1,101 @@
+import maya.api.OpenMaya as om
+
+class SceneEvents:
+    """Cheap scene change counter driven by OpenMaya message callbacks.
+
+    Anything that caches resolved scene data (button selection sets, namespace lists, ...)
+    stores the generation it was built at and treats it as stale once the generation moves.
+    The counter only moves on structural changes (DAG nodes added/removed/renamed, scene
+    open/new, reference load/unload), never on transforms or selection changes.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = SceneEvents()
+        return cls._instance
+
+    def __init__(self):
+        self.generation = 0
+        self._callback_ids = []
+        self._listeners = []
+
+    @property
+    def installed(self):
+        return bool(self._callback_ids)
+
+    def install(self):
+        """Register the Maya callbacks (safe to call more than once)"""
+        if self._callback_ids:
+            return
+
+        try:
+            self._callback_ids.append(om.MDGMessage.addNodeAddedCallback(self._on_node_changed, 'dagNode'))
+            self._callback_ids.append(om.MDGMessage.addNodeRemovedCallback(self._on_node_changed, 'dagNode'))
+            self._callback_ids.append(om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, self._on_name_changed))
+
+            scene_messages = (
+                om.MSceneMessage.kAfterNew,
+                om.MSceneMessage.kAfterOpen,
+                om.MSceneMessage.kAfterImport,
+                om.MSceneMessage.kAfterCreateReference,
+                om.MSceneMessage.kAfterRemoveReference,
+                om.MSceneMessage.kAfterLoadReference,
+                om.MSceneMessage.kAfterUnloadReference,
+            )
+            for message in scene_messages:
+                self._callback_ids.append(om.MSceneMessage.addCallback(message, self._on_scene_changed))
+        except Exception as e:
+            print(f"Could not set up scene change callbacks: {e}")
+
+    def remove(self):
+        """Remove all registered Maya callbacks"""
+        for callback_id in self._callback_ids:
+            try:
+                om.MMessage.removeCallback(callback_id)
+            except Exception as e:
+                print(f"Error removing callback: {e}")
+        self._callback_ids = []
+
+    def add_listener(self, listener):
+        """Register a callable(reason) that is notified whenever the generation changes"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def bump(self, reason='manual'):
+        """Advance the generation so all caches built before now are stale"""
+        self.generation += 1
+        for listener in list(self._listeners):
+            try:
+                listener(reason)
+            except Exception as e:
+                print(f"Error in scene change listener: {e}")
+
+    def is_current(self, generation):
+        """True if data built at generation is still valid"""
+        # Without callbacks nothing tells us about changes, so nothing can be trusted
+        return self.installed and generation == self.generation
+
+    #------------------------------------------------------------------------------
+    def _on_node_changed(self, node, *args):
+        self.bump('node')
+
+    def _on_name_changed(self, node, previous_name, *args):
+        # Newly created nodes get a name change with an empty previous name, already covered by node added.
+        # Only DAG renames matter: keying creates and renames animCurves, which must not drop the caches
+        if previous_name and node.hasFn(om.MFn.kDagNode):
+            self.bump('rename')
+
+    def _on_scene_changed(self, *args):
+        self.bump('scene')
+
+def scene_generation():
+    """Current scene generation, installing the callbacks on first use"""
+    events = SceneEvents.get_instance()
+    events.install()
+    return events.generation
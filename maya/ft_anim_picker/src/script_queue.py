@@ -0,0 +1,116 @@
+import time
+from collections import OrderedDict
+
+import maya.utils
+
+try:
+    from PySide6 import QtWidgets
+    from shiboken6 import isValid
+except ImportError:
+    from PySide2 import QtWidgets
+    from shiboken2 import isValid
+
+#----------------------------------------------------------------------------------------------------------
+# SCRIPT QUEUE
+#----------------------------------------------------------------------------------------------------------
+# Clicking a script button queues its script instead of running it inside the mouse handler. Queued
+# scripts run one per maya.utils.executeDeferred callback, so Maya and the picker process their
+# events (and further clicks) between scripts. A button is queued at most once: clicking it again
+# while it is waiting, or a second click within the double-click interval, is coalesced into the
+# queued run. Queued runs can be cancelled; listeners (the canvas HUD) are told the queue depth.
+
+class ScriptQueue:
+    """Deferred, coalescing queue of script button runs"""
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = ScriptQueue()
+        return cls._instance
+
+    def __init__(self):
+        # Keyed by the button itself: unique ids are only unique within one canvas
+        self._pending = OrderedDict()  # button -> None, in submit order
+        self._last_submit = None       # (button, perf_counter time) of the last accepted click
+        self._running = None
+        self._scheduled = False
+        self._listeners = []
+        self.coalesced = 0
+
+    def submit(self, button):
+        """Queue a run of button's script. Returns False if it was coalesced into a pending or recent run"""
+        now = time.perf_counter()
+        interval = QtWidgets.QApplication.doubleClickInterval() / 1000.0
+        is_double_click = (self._last_submit is not None and self._last_submit[0] is button and 
+                           now - self._last_submit[1] < interval)
+        if button in self._pending or is_double_click:
+            self.coalesced += 1
+            return False
+
+        self._last_submit = (button, now)
+        self._pending[button] = None
+        self._schedule()
+        self._notify()
+        return True
+
+    def cancel(self, button=None):
+        """Drop the queued run of button (all queued runs without a button). Returns the number dropped"""
+        if button is None:
+            cancelled = len(self._pending)
+            self._pending.clear()
+        else:
+            cancelled = 1 if button in self._pending else 0
+            self._pending.pop(button, None)
+        if cancelled:
+            self._notify()
+        return cancelled
+
+    def is_queued(self, button):
+        return button in self._pending
+
+    def depth(self):
+        """Queued runs, including the one executing"""
+        return len(self._pending) + (1 if self._running is not None else 0)
+
+    def _schedule(self):
+        if not self._scheduled and self._pending:
+            self._scheduled = True
+            maya.utils.executeDeferred(self._run_next)
+
+    def _run_next(self):
+        self._scheduled = False
+        if not self._pending:
+            return
+
+        button, _ = self._pending.popitem(last=False)
+        if isValid(button):
+            self._running = button
+            self._notify()
+            try:
+                button.execute_script_command()
+            except Exception as e:
+                print(f"Error running queued script of button '{button.unique_id}': {e}")
+            finally:
+                self._running = None
+
+        # Next run in its own callback so pending events are processed first
+        self._schedule()
+        self._notify()
+
+    def add_listener(self, listener):
+        """Register a callable(depth) notified when the queue changes"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self):
+        depth = self.depth()
+        for listener in list(self._listeners):
+            try:
+                listener(depth)
+            except Exception as e:
+                print(f"Error in script queue listener: {e}")
@@ -0,0 +1,124 @@
+import re
+import time
+
+#----------------------------------------------------------------------------------------------------------
+# SCRIPT TOKENS
+#----------------------------------------------------------------------------------------------------------
+# Button scripts use picker tokens (@ns, @TF., @pb, @ba, @reset_*, @tt) that are turned into plain
+# Python before the script is compiled. All token families, string literals and comments are matched
+# by one scanner regex, so the script is walked once, left to right, whatever the number of tokens.
+# Outside of strings and comments every token is rewritten; inside strings only namespace tokens
+# are (that is where object names live), and comments are left alone.
+
+TF_IMPORT = 'import ft_anim_picker.src.tool_functions as TF'
+
+_TOOL_CALLS = {
+    'pb': 'TF.pb', 'picker_button': 'TF.pb',
+    'ba': 'TF.button_appearance', 'button_appearance': 'TF.button_appearance',
+    'tt': 'TF.tool_tip', 'tool_tip': 'TF.tool_tip',
+}
+
+_NS_PATTERN = r'@ns(?:\.?(?P<{0}>[A-Za-z0-9_][A-Za-z0-9_-]*)|\.?(?![\w.]))'  # The dot is optional: @nsL_arm == @ns.L_arm
+
+_PYTHON_SCANNER = re.compile(r'''
+    (?P<string>'{3}(?:[^\\]|\\.)*?'{3}|"{3}(?:[^\\]|\\.)*?"{3}|'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+  | (?P<comment>\#[^\n]*)
+  | (?P<tooltip>@(?:TF\.)?(?:tool_tip|tt)\s*\(\s*(?:"[^"\n]*"|'[^'\n]*')\s*\))
+  | (?P<ns>''' + _NS_PATTERN.format('qualifier') + r''')
+  | (?P<reset>@(?P<reset_name>reset_(?:all|move|rotate|scale))\b(?P<reset_call>(?=\s*\())?)
+  | (?P<call>@(?P<call_name>picker_button|button_appearance|tool_tip|pb|ba|tt)(?=\s*\())
+  | (?P<tf>@TF\.(?=\w))
+''', re.VERBOSE | re.IGNORECASE | re.DOTALL)
+
+_MEL_SCANNER = re.compile(r'''
+    (?P<string>"(?:[^"\\\n]|\\.)*")
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<ns>''' + _NS_PATTERN.format('qualifier') + r''')
+''', re.VERBOSE | re.IGNORECASE | re.DOTALL)
+
+_STRING_NS = re.compile(_NS_PATTERN.format('qualifier'), re.IGNORECASE)
+
+def _qualified_name(namespace, qualifier):
+    """@ns.qualifier -> the qualifier in the namespace (namespace is '' or 'ns:')"""
+    return f"{namespace}{qualifier}"
+
+def process_script_code(code, namespace, language='python'):
+    """Replace picker tokens in a button script. Returns the processed code.
+
+    namespace is the prefix of the picker's namespace ('' or 'ns:'). Tooltip calls with a literal
+    text are removed (the script manager reads them), and the tool_functions import is added
+    when the script uses TF tokens. MEL scripts only get their namespace tokens replaced.
+    """
+    if '@' not in code:
+        return code
+
+    def replace_string_ns(match):
+        qualifier = match.group('qualifier')
+        return _qualified_name(namespace, qualifier) if qualifier else namespace
+
+    uses_tf = False
+
+    def replace(match):
+        nonlocal uses_tf
+        kind = match.lastgroup
+        if kind == 'string':
+            text = match.group(0)
+            return _STRING_NS.sub(replace_string_ns, text) if '@' in text else text
+        if kind == 'comment':
+            return match.group(0)
+        if kind == 'tooltip':
+            return ''
+        if kind == 'ns':
+            qualifier = match.group('qualifier')
+            return _qualified_name(namespace, qualifier) if qualifier else f'"{namespace}"'
+
+        uses_tf = True
+        if kind == 'tf':
+            return 'TF.'
+        if kind == 'call':
+            return _TOOL_CALLS[match.group('call_name').lower()]
+        # @reset_* runs the reset; when the script calls it itself (@reset_all()) only the name is replaced
+        name = f"TF.{match.group('reset_name').lower()}"
+        return name if match.group('reset_call') is not None else f"{name}()"
+
+    scanner = _MEL_SCANNER if language == 'mel' else _PYTHON_SCANNER
+    modified_code = scanner.sub(replace, code)
+
+    if uses_tf and TF_IMPORT not in modified_code:
+        modified_code = f"{TF_IMPORT}\n{modified_code}"
+    return modified_code
+
+#----------------------------------------------------------------------------------------------------------
+def benchmark_script(lines):
+    """A script of roughly `lines` lines mixing every token family, strings and comments"""
+    block = [
+        "# Select the arm controls of @ns and key them",
+        "@TF.tool_tip('Select and key the arm')",
+        "controls = ['@ns.L_arm_ctrl', \"@ns.L_elbow_ctrl\", '@ns.L_wrist_ctrl']",
+        "cmds.select(controls, add=True)",
+        "prefix = @ns",
+        "@pb('arm_button').set_selected(True)",
+        "@ba(text='@ns', color='#5285a6')",
+        "note = '''tokens in strings (@pb, @reset_all) are left alone",
+        "but @ns.L_hand_ctrl is resolved'''",
+        "@reset_move",
+        "@TF.select_all_in_namespace(@ns)",
+        "value = compute(1 + 2) * 3  # @reset_all in a comment",
+    ]
+    return '\n'.join(block * max(1, lines // len(block)))
+
+def benchmark(lines=5000, repeat=20):
+    """Time process_script_code on a large generated script. Returns {'lines', 'chars', 'ms'} (best of repeat)"""
+    code = benchmark_script(lines)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process_script_code(code, 'char01:')
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {'lines': code.count('\n') + 1, 'chars': len(code), 'ms': best * 1000.0}
+
+if __name__ == "__main__":
+    for line_count in (500, 5000, 50000):
+        result = benchmark(line_count)
+        print(f"{result['lines']:>6} lines, {result['chars']:>8} chars: {result['ms']:.2f} ms")
@@ -3,6 +3,7 @@ import maya.mel as mel
 import maya.api.OpenMaya as om
 from maya import OpenMayaUI as omui
 from functools import wraps
+from contextlib import contextmanager
 import re
 import json
 
@@ -21,6 +22,11 @@ from . utils import undoable, shortcuts
 from . import custom_button as CB
 from . import custom_slider as CS
 from . import custom_dialog as CD
+from . import pose_engine as PE
+from . import mirror_table as MT
+from . import ik_fk_match as IKM
+from . import utils as UT
+from . import script_context as SC
 from . import ui as UI
 from . import main as MAIN
 
@@ -102,6 +108,39 @@ class animation_tool_layout:
         # Show the dialog
         dialog.exec_()
     
+    def show_position_slot_dialog(self, store=False):
+        """
+        Shows a dialog to pick a named position slot, then stores the current position in it
+        (store=True) or moves the selected objects to it.
+        """
+        manager = MAIN.PickerWindowManager.get_instance()
+        parent = manager._picker_widgets[0] if manager._picker_widgets else None
+        dialog = CD.CustomDialog(parent=parent, title="Store Position" if store else "Move to Position", size=(220, 110))
+
+        slot_input = QtWidgets.QComboBox()
+        slot_input.setEditable(store)
+        slot_input.addItems(sorted(stored_position_slots()))
+        if store:
+            slot_input.setCurrentText("")
+            slot_input.lineEdit().setPlaceholderText("Slot name")
+        elif not slot_input.count():
+            cmds.warning("No stored positions found. Please store a position first.")
+            return
+
+        dialog.add_widget(QtWidgets.QLabel("Position slot:"))
+        dialog.add_widget(slot_input)
+        dialog.add_button_box()
+
+        if dialog.exec_() != QtWidgets.QDialog.Accepted:
+            return
+        slot = slot_input.currentText().strip()
+        if not slot:
+            return
+        if store:
+            store_component_position(slot)
+        else:
+            move_objects_to_stored_position(slot)
+
     def __init__(self):
         self.layout = QtWidgets.QVBoxLayout()
         lm = 1 # layout margin
@@ -182,10 +221,12 @@ class animation_tool_layout:
         match_transforms_button.addToMenu("Scale", match_scale, icon='ghostingObjectTypeLocator.png', position=(2,0))
         match_transforms_button.addToMenu("All", match_all, icon='ghostingObjectTypeLocator.png', position=(3,0))
 
-        store_pos_button = CB.CustomButton(text='Store Pos', color='#16AAA6', tooltip="Store Position: Stores the position of selected Vertices, Edges or Faces. Double Click to make locator visible",
-                                           text_size=ts, height=bh)
-        move_to_pos_button = CB.CustomButton(text='Move to Pos', color='#D58C09', tooltip="Move to Position: Move selected object(s) to the stored position.",
-                                             text_size=ts, height=bh)
+        store_pos_button = CB.CustomButton(text='Store Pos', color='#16AAA6', tooltip="Store Position: Stores the position of selected Vertices, Edges or Faces. Double Click to make locator visible. Right click to store a named position",
+                                           text_size=ts, height=bh, ContextMenu=True, onlyContext=False)
+        store_pos_button.addToMenu("Store Named...", lambda: self.show_position_slot_dialog(store=True), icon='ghostingObjectTypeLocator.png', position=(0,0))
+        move_to_pos_button = CB.CustomButton(text='Move to Pos', color='#D58C09', tooltip="Move to Position: Move selected object(s) to the stored position. Right click to pick a named position",
+                                             text_size=ts, height=bh, ContextMenu=True, onlyContext=False)
+        move_to_pos_button.addToMenu("Move to Named...", lambda: self.show_position_slot_dialog(store=False), icon='ghostingObjectTypeLocator.png', position=(0,0))
         #---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
         #reset_move_button.singleClicked.connect(reset_move)
         #reset_rotate_button.singleClicked.connect(reset_rotate)
@@ -231,130 +272,19 @@ class animation_tool_layout:
 
 @undoable
 def reset_move():
-    # Get the list of selected objects
-    sel_objs = cmds.ls(sl=True)
-
-    # Loop through each selected object
-    for obj in sel_objs:
-        attrs = ['tx', 'ty', 'tz']
-        
-        for attr in attrs:
-            attr_path = f"{obj}.{attr}"
-            
-            # Check if attribute is locked
-            is_locked = cmds.getAttr(attr_path, lock=True)
-            
-            # Check if attribute has non-keyed connections
-            has_non_keyed_connection = False
-            if cmds.connectionInfo(attr_path, isDestination=True):
-                # Get the source of the connection
-                source = cmds.connectionInfo(attr_path, sourceFromDestination=True)
-                
-                # Check if the connection is from an animation curve (keyed)
-                is_keyed = source and "animCurve" in cmds.nodeType(source.split('.')[0])
-                
-                # If there's a connection and it's not from an animation curve
-                has_non_keyed_connection = not is_keyed
-            
-            # Reset the attribute if it's not locked and has no non-keyed connections
-            if not is_locked and not has_non_keyed_connection:
-                cmds.setAttr(attr_path, 0)
+    PE.reset_attributes(cmds.ls(sl=True), PE.RESET_MOVE_ATTRS)
 
 @undoable
 def reset_rotate():
-    # Get the list of selected objects
-    sel_objs = cmds.ls(sl=True)
-
-    # Loop through each selected object
-    for obj in sel_objs:
-        attrs = ['rx', 'ry', 'rz']
-        
-        for attr in attrs:
-            attr_path = f"{obj}.{attr}"
-            
-            # Check if attribute is locked
-            is_locked = cmds.getAttr(attr_path, lock=True)
-            
-            # Check if attribute has non-keyed connections
-            has_non_keyed_connection = False
-            if cmds.connectionInfo(attr_path, isDestination=True):
-                # Get the source of the connection
-                source = cmds.connectionInfo(attr_path, sourceFromDestination=True)
-                
-                # Check if the connection is from an animation curve (keyed)
-                is_keyed = source and "animCurve" in cmds.nodeType(source.split('.')[0])
-                
-                # If there's a connection and it's not from an animation curve
-                has_non_keyed_connection = not is_keyed
-            
-            # Reset the attribute if it's not locked and has no non-keyed connections
-            if not is_locked and not has_non_keyed_connection:
-                cmds.setAttr(attr_path, 0)
+    PE.reset_attributes(cmds.ls(sl=True), PE.RESET_ROTATE_ATTRS)
 
 @undoable
 def reset_scale():
-    # Get the list of selected objects
-    sel_objs = cmds.ls(sl=True)
-
-    # Loop through each selected object
-    for obj in sel_objs:
-        attrs = ['sx', 'sy', 'sz']
-        
-        for attr in attrs:
-            attr_path = f"{obj}.{attr}"
-            
-            # Check if attribute is locked
-            is_locked = cmds.getAttr(attr_path, lock=True)
-            
-            # Check if attribute has non-keyed connections
-            has_non_keyed_connection = False
-            if cmds.connectionInfo(attr_path, isDestination=True):
-                # Get the source of the connection
-                source = cmds.connectionInfo(attr_path, sourceFromDestination=True)
-                
-                # Check if the connection is from an animation curve (keyed)
-                is_keyed = source and "animCurve" in cmds.nodeType(source.split('.')[0])
-                
-                # If there's a connection and it's not from an animation curve
-                has_non_keyed_connection = not is_keyed
-            
-            # Reset the attribute if it's not locked and has no non-keyed connections
-            if not is_locked and not has_non_keyed_connection:
-                # Scale attributes need to be set to 1 instead of 0
-                cmds.setAttr(attr_path, 1)
+    PE.reset_attributes(cmds.ls(sl=True), PE.RESET_SCALE_ATTRS)
 
 @undoable
 def reset_all():
-    # Get the list of selected objects
-    sel_objs = cmds.ls(sl=True)
-
-    # Loop through each selected object
-    for obj in sel_objs:
-        # Define the attributes to check
-        attrs = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz']
-        default_values = {'tx': 0, 'ty': 0, 'tz': 0, 'rx': 0, 'ry': 0, 'rz': 0, 'sx': 1, 'sy': 1, 'sz': 1}
-        
-        for attr in attrs:
-            attr_path = f"{obj}.{attr}"
-            
-            # Check if attribute is locked
-            is_locked = cmds.getAttr(attr_path, lock=True)
-            
-            # Check if attribute has non-keyed connections
-            has_non_keyed_connection = False
-            if cmds.connectionInfo(attr_path, isDestination=True):
-                # Get the source of the connection
-                source = cmds.connectionInfo(attr_path, sourceFromDestination=True)
-                
-                # Check if the connection is from an animation curve (keyed)
-                is_keyed = source and "animCurve" in cmds.nodeType(source.split('.')[0])
-                
-                # If there's a connection and it's not from an animation curve
-                has_non_keyed_connection = not is_keyed
-            
-            # Reset the attribute if it's not locked and has no non-keyed connections
-            if not is_locked and not has_non_keyed_connection:
-                cmds.setAttr(attr_path, default_values[attr])
+    PE.reset_attributes(cmds.ls(sl=True), PE.RESET_ALL_ATTRS)
      
 #---------------------------------------------------------------------------------------------------------------
 def set_key():
@@ -444,21 +374,8 @@ def copy_pose():
         cmds.warning("No objects selected for copying pose.")
         return
     
-    # For each selected object, store its keyable attributes
-    for obj in selected_objects:
-        keyable_attrs = cmds.listAttr(obj, keyable=True) or []
-        attr_values = {}
-        
-        for attr in keyable_attrs:
-            try:
-                full_attr = f"{obj}.{attr}"
-                if cmds.objExists(full_attr) and not cmds.getAttr(full_attr, lock=True):
-                    attr_values[attr] = cmds.getAttr(full_attr)
-            except Exception as e:
-                print(f"Error getting attribute {attr} from {obj}: {e}")
-        
-        if attr_values:
-            _copied_pose_data[obj] = attr_values
+    # Store the keyable, unlocked attributes of all selected objects in one pass
+    _copied_pose_data = PE.capture_keyable_values(selected_objects)
     
     print(f"Copied pose from {len(_copied_pose_data)} objects.")
 
@@ -599,50 +516,20 @@ def match_ik_to_fk(ik_controls, fk_joints):
     Matches IK controls to FK joint positions and calculates the pole vector position.
     
     Args:
-        ik_controls (list): List of IK controls where ik_controls[1] is the pole vector and ik_controls[2] is the end control
+        ik_controls (list): List of IK controls where ik_controls[0] is the pole vector and ik_controls[1] is the end control
         fk_joints (list): List of FK joints
-        pole_distance (float): Distance multiplier for pole vector positioning (default: 0.25)
     """
     # Match end IK control to end FK joint
     cmds.matchTransform(ik_controls[1], fk_joints[2], pos=True, rot=False)
     
-    # Calculate pole vector position
-    # Get world space positions of the joints
+    # Pole vector position from the world space positions of the joints
     start_pos = cmds.xform(fk_joints[2], query=True, worldSpace=True, translation=True)
     mid_pos = cmds.xform(fk_joints[1], query=True, worldSpace=True, translation=True)
     end_pos = cmds.xform(fk_joints[0], query=True, worldSpace=True, translation=True)
+    pole_pos = IKM.pole_vector_position(start_pos, mid_pos, end_pos)
 
-    # Convert to MVector for calculations
-    start_vec = om.MVector(start_pos)
-    mid_vec = om.MVector(mid_pos)
-    end_vec = om.MVector(end_pos)
-
-    # Calculate the pole vector position
-    start_to_end = end_vec - start_vec
-    start_to_mid = mid_vec - start_vec
-
-    # Calculate the projection manually
-    start_to_end_normalized = start_to_end.normal()
-    projection_length = start_to_mid * start_to_end_normalized
-    projection = start_to_end_normalized * projection_length
-
-    # Calculate the pole vector direction
-    pole_vec = (mid_vec - (start_vec + projection)).normal()
-
-    # Calculate the final pole vector position
-    pole_distance=.25
-    chain_length = (mid_vec - start_vec).length() + (end_vec - mid_vec).length()
-    pole_pos = mid_vec + (pole_vec * chain_length * pole_distance)
-
-    # Create a temporary locator for positioning
-    temp_locator = cmds.spaceLocator(name="temp_pole_locator")[0]
-    cmds.xform(temp_locator, worldSpace=True, translation=pole_pos)
-
-    # Match the pole vector control to the locator
-    cmds.matchTransform(ik_controls[0], temp_locator, position=True)
-
-    # Clean up
-    cmds.delete(temp_locator)
+    # Move the pole vector control's rotate pivot onto the position (same as matchTransform on a locator)
+    cmds.move(pole_pos.x, pole_pos.y, pole_pos.z, ik_controls[0], worldSpace=True, rotatePivotRelative=True)
 
     print(f"IK controls and pole vector have been matched to FK chain.")
 
@@ -654,30 +541,86 @@ def match_fk_to_ik(fk_controls, ik_joints):
     for fk_ctrl, ik_jnt in zip(fk_controls, ik_joints):
         cmds.matchTransform(fk_ctrl, ik_jnt, pos=False, rot=True)
     print("FK controls matched to IK joints.")
+
+def _bake_frames(frames):
+    """Frames to bake: a list, a frame list string ("1-24x2"), or the playback range if None"""
+    if frames is None:
+        start = cmds.playbackOptions(query=True, minTime=True)
+        end = cmds.playbackOptions(query=True, maxTime=True)
+        return UT.parse_frame_list(f"{start}-{end}")
+    if isinstance(frames, str):
+        return UT.parse_frame_list(frames)
+    return sorted(set(frames))
+
+@undoable
+def bake_ik_to_fk(ik_controls, fk_joints, frames=None):
+    """
+    Keys match_ik_to_fk on every frame without changing the current time.
+    
+    Args:
+        ik_controls (list): Pole vector and end IK controls, as for match_ik_to_fk
+        fk_joints (list): List of FK joints
+        frames: Frames to bake (list or frame list string such as "1-24"), default the playback range
+    """
+    frames = _bake_frames(frames)
+    keys = IKM.key_values(IKM.ik_to_fk_values(ik_controls, fk_joints, frames))
+    print(f"IK controls baked to FK chain: {keys} keys over {len(frames)} frames.")
+
+@undoable
+def bake_fk_to_ik(fk_controls, ik_joints, frames=None):
+    """
+    Keys match_fk_to_ik on every frame without changing the current time.
+    
+    Args:
+        fk_controls (list): FK controls, root first
+        ik_joints (list): Corresponding IK joints
+        frames: Frames to bake (list or frame list string such as "1-24"), default the playback range
+    """
+    frames = _bake_frames(frames)
+    keys = IKM.key_values(IKM.fk_to_ik_values(fk_controls, ik_joints, frames))
+    print(f"FK controls baked to IK chain: {keys} keys over {len(frames)} frames.")
 #---------------------------------------------------------------------------------------------------------------
+# Stored positions live on defaultObjectSet so they are saved with the scene. The default slot keeps
+# using the Stored_Location double3; named slots are a JSON {name: [x, y, z]} in Stored_Locations.
+STORED_POSITION_SET = 'defaultObjectSet'
+DEFAULT_POSITION_SLOT = 'default'
+
+def _manipulator_position():
+    """Position of the active move/rotate/scale manipulator, or None"""
+    current_ctx = cmds.currentCtx()
+    if current_ctx == 'moveSuperContext':
+        return cmds.manipMoveContext('Move', q=True, position=True)
+    elif current_ctx == 'RotateSuperContext':
+        return cmds.manipRotateContext('Rotate', q=True, position=True)
+    elif current_ctx == 'scaleSuperContext':
+        return cmds.manipScaleContext('Scale', q=True, position=True)
+    return None
+
+def stored_position_slots():
+    """{slot name: [x, y, z]} of all stored positions"""
+    slots = {}
+    if cmds.attributeQuery('Stored_Location', node=STORED_POSITION_SET, exists=True):
+        slots[DEFAULT_POSITION_SLOT] = list(cmds.getAttr(f'{STORED_POSITION_SET}.Stored_Location')[0])
+    if cmds.attributeQuery('Stored_Locations', node=STORED_POSITION_SET, exists=True):
+        try:
+            named_slots = json.loads(cmds.getAttr(f'{STORED_POSITION_SET}.Stored_Locations') or '{}')
+            slots.update((name, list(position)) for name, position in named_slots.items())
+        except (ValueError, TypeError) as e:
+            print(f"Error reading stored positions: {e}")
+    return slots
+
 @undoable
-def store_component_position():
+def store_component_position(slot=DEFAULT_POSITION_SLOT):
     # Get the active selection
     selection = cmds.ls(sl=True)
     
-    # Get the defaultObjectSet
-    default_set = 'defaultObjectSet'
-    
     # Initialize the stored position
     stored_position = [0, 0, 0]  # Default to world origin
     
     # Check if there's an active selection
     if selection:
         # Get the manipulator position
-        manipulator_pos = None
-        current_ctx = cmds.currentCtx()
-        if current_ctx == 'moveSuperContext':
-            manipulator_pos = cmds.manipMoveContext('Move', q=True, position=True)
-        elif current_ctx == 'RotateSuperContext':
-            manipulator_pos = cmds.manipRotateContext('Rotate', q=True, position=True)
-        elif current_ctx == 'scaleSuperContext':
-            manipulator_pos = cmds.manipScaleContext('Scale', q=True, position=True)
-
+        manipulator_pos = _manipulator_position()
         if manipulator_pos:
             stored_position = manipulator_pos
         else:
@@ -685,49 +628,74 @@ def store_component_position():
     else:
         cmds.warning("Nothing selected. Using world origin.")
 
-    # Check if the 'Stored Location' attribute exists, if not, create it
-    if not cmds.attributeQuery('Stored_Location', node=default_set, exists=True):
-        cmds.addAttr(default_set, longName='Stored_Location', attributeType='double3')
-        cmds.addAttr(default_set, longName='Stored_Location_X', attributeType='double', parent='Stored_Location')
-        cmds.addAttr(default_set, longName='Stored_Location_Y', attributeType='double', parent='Stored_Location')
-        cmds.addAttr(default_set, longName='Stored_Location_Z', attributeType='double', parent='Stored_Location')
+    if slot == DEFAULT_POSITION_SLOT:
+        # Check if the 'Stored Location' attribute exists, if not, create it
+        if not cmds.attributeQuery('Stored_Location', node=STORED_POSITION_SET, exists=True):
+            cmds.addAttr(STORED_POSITION_SET, longName='Stored_Location', attributeType='double3')
+            cmds.addAttr(STORED_POSITION_SET, longName='Stored_Location_X', attributeType='double', parent='Stored_Location')
+            cmds.addAttr(STORED_POSITION_SET, longName='Stored_Location_Y', attributeType='double', parent='Stored_Location')
+            cmds.addAttr(STORED_POSITION_SET, longName='Stored_Location_Z', attributeType='double', parent='Stored_Location')
 
-    # Store the position in the custom attribute
-    cmds.setAttr(f'{default_set}.Stored_Location', *stored_position)
+        # Store the position in the custom attribute
+        cmds.setAttr(f'{STORED_POSITION_SET}.Stored_Location', *stored_position)
+    else:
+        if not cmds.attributeQuery('Stored_Locations', node=STORED_POSITION_SET, exists=True):
+            cmds.addAttr(STORED_POSITION_SET, longName='Stored_Locations', dataType='string')
+        named_slots = {name: position for name, position in stored_position_slots().items() if name != DEFAULT_POSITION_SLOT}
+        named_slots[slot] = list(stored_position)
+        cmds.setAttr(f'{STORED_POSITION_SET}.Stored_Locations', json.dumps(named_slots), type='string')
 
-    print(f"Position stored in {default_set}.Stored_Location:", stored_position)
+    print(f"Position stored in slot '{slot}':", stored_position)
 
 @undoable
-def move_objects_to_stored_position():
-    selected_objects = cmds.ls(selection=True, long=True)
-    default_set = 'defaultObjectSet'
-    
-    # Check if the stored position attribute exists
-    if not cmds.attributeQuery('Stored_Location', node=default_set, exists=True):
-        cmds.warning("No stored position found. Please store a position first.")
-        return
+def remove_stored_position(slot):
+    """Remove a named position slot"""
+    named_slots = {name: position for name, position in stored_position_slots().items() if name != DEFAULT_POSITION_SLOT}
+    if named_slots.pop(slot, None) is not None:
+        cmds.setAttr(f'{STORED_POSITION_SET}.Stored_Locations', json.dumps(named_slots), type='string')
 
-    # Get the stored position
-    stored_position = cmds.getAttr(f'{default_set}.Stored_Location')[0]
+@undoable
+def move_objects_to_stored_position(slot=DEFAULT_POSITION_SLOT):
+    """Move the selected transforms so their rotate pivots sit on a stored position.
 
-    # Check if there are any objects selected
-    if not selected_objects:
+    Pivots are read for the whole selection in one OpenMaya pass; objects not already there are
+    moved together by a single absolute, pivot-relative move.
+    """
+    stored_position = stored_position_slots().get(slot)
+    if stored_position is None:
+        cmds.warning(f"No stored position found for '{slot}'. Please store a position first.")
+        return
+
+    selection = om.MGlobal.getActiveSelectionList()
+    if selection.isEmpty():
         cmds.warning("Please select at least one object to move.")
         return
 
-    # Loop through the selected objects and move them to the stored position
-    for obj in selected_objects:
-        # Get the current world space rotate pivot of the object
-        current_position = cmds.xform(obj, query=True, worldSpace=True, rotatePivot=True)
-        
-        # Calculate the difference between the stored position and current position
-        offset = [stored_position[i] - current_position[i] for i in range(3)]
-        
-        # Move the object by the calculated offset
-        cmds.move(offset[0], offset[1], offset[2], obj, relative=True, worldSpace=True)
+    target = om.MPoint(stored_position)
+    selected_objects = []
+    objects_to_move = []
+    for index in range(selection.length()):
+        try:
+            dag_path = selection.getDagPath(index)
+        except TypeError:
+            continue
+        if not dag_path.node().hasFn(om.MFn.kTransform):
+            continue
+        object_path = dag_path.fullPathName()
+        selected_objects.append(object_path)
+        # rotatePivot is in internal units (cm); the stored position and cmds.move use UI units
+        pivot = om.MFnTransform(dag_path).rotatePivot(om.MSpace.kWorld)
+        pivot = om.MPoint(om.MDistance.internalToUI(pivot.x), om.MDistance.internalToUI(pivot.y),
+                          om.MDistance.internalToUI(pivot.z))
+        if not pivot.isEquivalent(target):
+            objects_to_move.append(object_path)
+
+    if objects_to_move:
+        cmds.move(stored_position[0], stored_position[1], stored_position[2], objects_to_move,
+                  absolute=True, worldSpace=True, rotatePivotRelative=True)
     
     cmds.select(selected_objects)
-    print(f"Moved {len(selected_objects)} object(s) to stored position: {stored_position}")
+    print(f"Moved {len(objects_to_move)} object(s) to stored position '{slot}': {stored_position}")
 #---------------------------------------------------------------------------------------------------------------
 def match_move():
     mel.eval('''MatchTranslation;''')
@@ -789,11 +757,12 @@ def apply_mirror_pose(L="", R="", custom_flip_controls=None, auto_detect_orienta
         orientation_data = _collect_orientation_data(selected_objects, cmds)
         custom_flip_controls = _analyze_orientations(selected_objects, orientation_data, naming_conventions, custom_flip_controls, cmds)
     
-    # Process each selected object to collect mirror data
-    mirror_data = _collect_mirror_data(selected_objects, naming_conventions, custom_flip_controls, cmds)
+    # Read the current values from the plugs and mirror them through the cached mirror table
+    source_values = PE.capture_keyable_values(selected_objects, skip_locked=False)
+    mirror_data = MT.mirror_pose(source_values, naming_conventions, custom_flip_controls)
     
-    # Apply the collected mirror data
-    mirrored_objects = _apply_mirror_data(mirror_data, cmds)
+    # Write all mirrored values in one pass (locked and unchanged attributes are skipped)
+    mirrored_objects, _ = PE.apply_pose(None, "mirror", mirror_data, None)
     
     # Select the mirrored objects and show feedback
     if mirrored_objects:
@@ -1069,314 +1038,6 @@ def _analyze_orientations(objects, orientation_data, naming_conventions, custom_
                 }
     
     return custom_flip_controls
-
-def _should_flip_attribute(control_name, attr, custom_flip_controls):
-    """
-    Determines if an attribute should be flipped based on custom flip controls.
-    
-    Args:
-        control_name (str): Name of the control (short name without namespace)
-        attr (str): Attribute name
-        custom_flip_controls (dict): Dictionary of custom flip controls
-        
-    Returns:
-        bool: True if the attribute should be flipped, False otherwise
-    """
-    should_flip = True  # Default behavior
-    
-    # Check if this control is in the custom flip controls dictionary
-    if control_name in custom_flip_controls:
-        # Check if this attribute has custom flipping logic
-        if attr in custom_flip_controls[control_name].get('attrs', []):
-            # Get the custom flipping logic for this attribute
-            should_flip = custom_flip_controls[control_name].get('flip', {}).get(attr, True)
-    
-    return should_flip
-
-def _collect_mirror_data(objects, naming_conventions, custom_flip_controls, cmds):
-    """
-    Collects mirror data for the given objects.
-    
-    Args:
-        objects (list): List of object names
-        naming_conventions (list): List of naming conventions
-        custom_flip_controls (dict): Dictionary of custom flip controls
-        cmds: Maya commands module
-        
-    Returns:
-        dict: Dictionary mapping target objects to attribute values
-    """
-    import json
-    mirror_data = {}
-    
-    # Load mirror preferences for all objects if they exist
-    mirror_preferences = {}
-    for obj in objects:
-        namespace, short_name = _extract_namespace_and_name(obj)
-        if cmds.attributeQuery("mirrorPreference", node=obj, exists=True):
-            try:
-                pref_data_str = cmds.getAttr(f"{obj}.mirrorPreference")
-                mirror_preferences[short_name] = json.loads(pref_data_str)
-            except (json.JSONDecodeError, Exception) as e:
-                print(f"Error loading mirror preferences for {obj}: {e}")
-    
-    # Also load mirror preferences for potential counterparts
-    potential_counterparts = set()
-    for obj in objects:
-        namespace, short_name = _extract_namespace_and_name(obj)
-        # Find the potential counterpart name
-        counterpart_name, _ = _find_mirrored_name(short_name, naming_conventions, namespace=namespace)
-        if counterpart_name != obj:
-            potential_counterparts.add(counterpart_name)
-    
-    # Load preferences for counterparts if they exist
-    for counterpart in potential_counterparts:
-        counterpart_namespace, counterpart_short = _extract_namespace_and_name(counterpart)
-        if counterpart_short not in mirror_preferences and cmds.objExists(counterpart):
-            if cmds.attributeQuery("mirrorPreference", node=counterpart, exists=True):
-                try:
-                    pref_data_str = cmds.getAttr(f"{counterpart}.mirrorPreference")
-                    mirror_preferences[counterpart_short] = json.loads(pref_data_str)
-                except (json.JSONDecodeError, Exception) as e:
-                    print(f"Error loading mirror preferences for counterpart {counterpart}: {e}")
-    
-    for obj in objects:
-        # Extract namespace and short name
-        namespace, short_name = _extract_namespace_and_name(obj)
-        
-        # Try to find the corresponding mirrored object
-        mirrored_obj = None
-        
-        # Find mirrored name, using mirror preferences if available
-        mirrored_name, is_center_object = _find_mirrored_name(short_name, naming_conventions, mirror_preferences, namespace)
-        print(f"Found potential mirror: {mirrored_name}")
-        
-        # Check if mirrored object exists
-        if cmds.objExists(mirrored_name):
-            mirrored_obj = mirrored_name
-        # If no mirrored object was found but it's a center object, use the object itself
-        elif is_center_object:
-            print(f"{obj} appears to be a center object, will mirror its pose values")
-            mirrored_obj = obj
-        
-        # If we found a mirrored object, collect the attribute values
-        if mirrored_obj:
-            # Initialize attribute dictionary for this mirrored object if not already done
-            if mirrored_obj not in mirror_data:
-                mirror_data[mirrored_obj] = {}
-            
-            # Get all keyable attributes of the source object
-            attrs = cmds.listAttr(obj, keyable=True) or []
-            print(f"Collecting attributes for {obj} -> {mirrored_obj}: {attrs}")
-            
-            # Check if this is a center object (self-mirroring)
-            is_self_mirroring = (obj == mirrored_obj)
-            
-            # Collect attribute values, passing mirror preferences
-            _collect_attribute_values(obj, mirrored_obj, attrs, short_name, is_self_mirroring, custom_flip_controls, mirror_data, cmds, mirror_preferences)
-    
-    return mirror_data
-
-def _collect_attribute_values(source_obj, target_obj, attrs, control_name, is_self_mirroring, custom_flip_controls, mirror_data, cmds, mirror_preferences=None):
-    """
-    Collects attribute values from source object to target object.
-    
-    Args:
-        source_obj (str): Source object name
-        target_obj (str): Target object name
-        attrs (list): List of attributes
-        control_name (str): Control name for custom flip lookup (short name without namespace)
-        is_self_mirroring (bool): Whether this is a self-mirroring (center) object
-        custom_flip_controls (dict): Dictionary of custom flip controls
-        mirror_data (dict): Dictionary to store mirror data
-        cmds: Maya commands module
-        mirror_preferences (dict, optional): Dictionary of mirror preferences
-    """
-    for attr in attrs:
-        try:
-            # Check if the attribute exists on both objects and is not locked on target
-            if (cmds.objExists(f"{source_obj}.{attr}") and 
-                cmds.objExists(f"{target_obj}.{attr}") and 
-                not cmds.getAttr(f"{target_obj}.{attr}", lock=True)):
-                
-                # Get the value from the source object
-                value = cmds.getAttr(f"{source_obj}.{attr}")
-                
-                # Handle different attribute types
-                if isinstance(value, list):
-                    _handle_multi_attribute(source_obj, attr, value, control_name, custom_flip_controls, target_obj, mirror_data)
-                else:
-                    _handle_simple_attribute(attr, value, control_name, custom_flip_controls, target_obj, mirror_data, is_self_mirroring, mirror_preferences)
-        except Exception as e:
-            print(f"Error collecting attribute {attr} from {source_obj} to {target_obj}: {e}")
-
-def _handle_multi_attribute(source_obj, attr, value, control_name, custom_flip_controls, target_obj, mirror_data):
-    """
-    Handles multi-attributes like matrices or arrays.
-    
-    Args:
-        source_obj (str): Source object name
-        attr (str): Attribute name
-        value (list): Attribute value
-        control_name (str): Control name for custom flip lookup (short name without namespace)
-        custom_flip_controls (dict): Dictionary of custom flip controls
-        target_obj (str): Target object name
-        mirror_data (dict): Dictionary to store mirror data
-    """
-    multi_values = []
-    for i, val in enumerate(value[0]):
-        # Check if we need to mirror the value
-        mirrored_val = val
-        
-        # Check if this attribute should be flipped
-        should_flip = _should_flip_attribute(control_name, attr, custom_flip_controls)
-        
-        # Apply standard mirroring logic if should_flip is True
-        if should_flip and attr in ['translateX', 'rotateY', 'rotateZ']:
-            mirrored_val = -val
-        
-        multi_values.append(mirrored_val)
-    
-    # Store the multi-attribute values
-    mirror_data[target_obj][attr] = {'multi': True, 'values': multi_values}
-
-def _handle_simple_attribute(attr, value, control_name, custom_flip_controls, target_obj, mirror_data, is_self_mirroring, mirror_preferences=None):
-    """
-    Handles simple (non-multi) attributes.
-    
-    Args:
-        attr (str): Attribute name
-        value: Attribute value
-        control_name (str): Control name for custom flip lookup (short name without namespace)
-        custom_flip_controls (dict): Dictionary of custom flip controls
-        target_obj (str): Target object name
-        mirror_data (dict): Dictionary to store mirror data
-        is_self_mirroring (bool): Whether this is a self-mirroring (center) object
-        mirror_preferences (dict, optional): Dictionary of mirror preferences
-    """
-    mirrored_val = value
-    
-    # Check if we have mirror preferences for this control or its counterpart
-    use_mirror_prefs = False
-    pref_data = None
-    
-    # First check if the object itself has mirror preferences
-    if mirror_preferences and control_name in mirror_preferences:
-        pref_data = mirror_preferences[control_name]
-    else:
-        # If not, check if we have the counterpart's preferences loaded
-        # We need to find the counterpart name first
-        for obj_name, prefs in mirror_preferences.items():
-            if "counterpart" in prefs and prefs["counterpart"] == control_name:
-                # We found a counterpart that points to this control
-                pref_data = prefs
-                print(f"Using counterpart {obj_name}'s mirror preferences for {control_name}")
-                break
-    
-    if pref_data:
-        # Handle translation attributes
-        if attr.startswith('translate'):
-            axis = attr[-1].lower()  # Get the axis (X, Y, or Z)
-            if "translate" in pref_data and axis in pref_data["translate"]:
-                use_mirror_prefs = True
-                mirror_type = pref_data["translate"][axis]
-                
-                if mirror_type == "invert":
-                    mirrored_val = -value
-                else:  # "none"
-                    mirrored_val = value
-        
-        # Handle rotation attributes
-        elif attr.startswith('rotate'):
-            axis = attr[-1].lower()  # Get the axis (X, Y, or Z)
-            if "rotate" in pref_data and axis in pref_data["rotate"]:
-                use_mirror_prefs = True
-                mirror_type = pref_data["rotate"][axis]
-                
-                if mirror_type == "invert":
-                    mirrored_val = -value
-                else:  # "none"
-                    mirrored_val = value
-    
-    # If we didn't use mirror preferences, use the standard logic
-    if not use_mirror_prefs:
-        # Check if this attribute should be flipped
-        should_flip = _should_flip_attribute(control_name, attr, custom_flip_controls)
-        
-        # Apply standard mirroring logic if should_flip is True
-        if should_flip and (attr == 'translateX' or attr == 'rotateY' or attr == 'rotateZ'):
-            mirrored_val = -value
-    
-    # For center objects, only mirror specific attributes
-    if is_self_mirroring:
-        # Only store attributes that need to be flipped for center objects
-        if (use_mirror_prefs or (should_flip and attr in ['translateX', 'rotateY', 'rotateZ'])):
-            mirror_data[target_obj][attr] = {'multi': False, 'value': mirrored_val}
-    else:
-        # Store all attributes for regular mirroring
-        mirror_data[target_obj][attr] = {'multi': False, 'value': mirrored_val}
-
-def _apply_mirror_data(mirror_data, cmds):
-    """
-    Applies the collected mirror data to the target objects.
-    
-    Args:
-        mirror_data (dict): Dictionary mapping target objects to attribute values
-        cmds: Maya commands module
-        
-    Returns:
-        list: List of mirrored objects
-    """
-    mirrored_objects = []
-    locked_attrs = []
-    print(f"Applying mirrored data to {len(mirror_data)} objects")
-    
-    for target_obj, attrs_data in mirror_data.items():
-        print(f"Setting attributes for {target_obj}")
-        for attr, data in attrs_data.items():
-            full_attr = f"{target_obj}.{attr}"
-            try:
-                # Check if attribute is locked
-                is_locked = False
-                try:
-                    is_locked = cmds.getAttr(full_attr, lock=True)
-                except:
-                    pass
-                
-                # Skip locked attributes instead of trying to unlock them
-                if is_locked:
-                    locked_attrs.append(full_attr)
-                    print(f"Skipping locked attribute {full_attr}")
-                    continue
-                
-                # Set the attribute value
-                if data['multi']:
-                    # Apply multi-attribute values
-                    for i, val in enumerate(data['values']):
-                        cmds.setAttr(f"{full_attr}[{i}]", val)
-                else:
-                    # Apply simple attribute value
-                    cmds.setAttr(full_attr, data['value'])
-                
-                # Add to the list of mirrored objects if not already there
-                if target_obj not in mirrored_objects:
-                    mirrored_objects.append(target_obj)
-                    
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "locked" in error_msg or "connected" in error_msg:
-                    locked_attrs.append(full_attr)
-                    print(f"Skipping locked or connected attribute {full_attr}: {e}")
-                else:
-                    print(f"Error setting attribute {attr} on {target_obj}: {e}")
-    
-    # Provide feedback about locked attributes if any were found
-    if locked_attrs:
-        print(f"Warning: {len(locked_attrs)} attributes were locked or connected and could not be modified:")
-        for attr in locked_attrs:
-            print(f"  - {attr}")
-    
-    return mirrored_objects
 #---------------------------------------------------------------------------------------------------------------
 @shortcuts(t='text', c='color', o='opacity', s='selectable', sb='source_button', tb='target_buttons')
 def button_appearance(text="", color="", opacity="", selectable="", source_button=None, target_buttons=None):
@@ -1438,80 +1099,69 @@ def button_appearance(text="", color="", opacity="", selectable="", source_butto
     # Apply appearance changes to buttons
     modified_buttons = _apply_appearance_changes(buttons_to_modify, validated_params)
     
-    # Persist changes to database and update UI
+    # Persist changes to database and update UI (deferred to the end of an appearance_batch)
     if modified_buttons:
-        _persist_appearance_changes(modified_buttons, context, validated_params)
+        if _appearance_batch is not None:
+            _appearance_batch.add(context, modified_buttons)
+        else:
+            _persist_appearance_changes(modified_buttons, context, validated_params)
+
+def _find_picker_widget(source_button=None):
+    """Picker window containing source_button, else the first open picker window (None if there is none)"""
+    current_widget = source_button
+    while current_widget:
+        if current_widget.__class__.__name__ == 'AnimPickerWindow':
+            return current_widget
+        current_widget = current_widget.parent()
+    
+    manager = MAIN.PickerWindowManager.get_instance()
+    if manager and manager._picker_widgets:
+        return manager._picker_widgets[0]
+    return None
+
+def _find_canvas(picker_widget):
+    """Canvas of a picker window's current tab, or None"""
+    if hasattr(picker_widget, 'canvas'):
+        return picker_widget.canvas
+    if hasattr(picker_widget, 'tab_system') and picker_widget.tab_system.current_tab:
+        current_tab = picker_widget.tab_system.current_tab
+        if current_tab in picker_widget.tab_system.tabs:
+            return picker_widget.tab_system.tabs[current_tab]['canvas']
+    
+    for child in picker_widget.findChildren(QtWidgets.QWidget):
+        if hasattr(child, 'buttons') and isinstance(child.buttons, list):
+            return child
+    return None
+
+def _picker_buttons(picker_widget, canvas):
+    """All buttons of the canvas, or of the picker window's children if there is no canvas"""
+    if canvas and hasattr(canvas, 'buttons') and canvas.buttons:
+        return list(canvas.buttons)
+    return [child for child in picker_widget.findChildren(QtWidgets.QWidget)
+            if hasattr(child, 'mode') and hasattr(child, 'label') and hasattr(child, 'unique_id')]
 
 def _discover_execution_context(source_button):
     """
     Discover the execution context including source button, picker widget, and all available buttons.
     
+    The source button defaults to the button whose script is running (see script_context).
+    
     Returns:
         dict: Context containing 'source_button', 'picker_widget', 'all_buttons', and 'canvas'
         None: If no valid context could be established
     """
-    # Detect source button from call stack if not provided
     if source_button is None:
-        import inspect
-        for frame_info in inspect.stack():
-            if frame_info.function == 'execute_script_command':
-                if hasattr(frame_info, 'frame') and 'self' in frame_info.frame.f_locals:
-                    potential_button = frame_info.frame.f_locals['self']
-                    if hasattr(potential_button, 'mode') and hasattr(potential_button, 'script_data'):
-                        source_button = potential_button
-                        break
-    
-    # Find the target picker widget
-    picker_widget = None
-    if source_button:
-        # Walk up the widget hierarchy to find the picker window
-        current_widget = source_button
-        while current_widget:
-            if current_widget.__class__.__name__ == 'AnimPickerWindow':
-                picker_widget = current_widget
-                break
-            current_widget = current_widget.parent()
-    
-    # Fallback to manager approach if no picker widget found
-    if not picker_widget:
-        from . import main as MAIN
-        manager = MAIN.PickerWindowManager.get_instance()
-        if manager and manager._picker_widgets:
-            picker_widget = manager._picker_widgets[0]
+        source_button = SC.current_script_button()
     
+    picker_widget = _find_picker_widget(source_button)
     if not picker_widget:
         return None
     
-    # Get canvas from picker widget
-    canvas = None
-    if hasattr(picker_widget, 'canvas'):
-        canvas = picker_widget.canvas
-    elif hasattr(picker_widget, 'tab_system') and picker_widget.tab_system.current_tab:
-        current_tab = picker_widget.tab_system.current_tab
-        if current_tab in picker_widget.tab_system.tabs:
-            canvas = picker_widget.tab_system.tabs[current_tab]['canvas']
-    
-    if not canvas:
-        for child in picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'buttons') and isinstance(child.buttons, list):
-                canvas = child
-                break
-    
-    # Get all buttons from the picker widget
-    all_buttons = []
-    if canvas and hasattr(canvas, 'buttons'):
-        all_buttons.extend(canvas.buttons)
-    
-    # Fallback: search for buttons in all child widgets
-    if not all_buttons:
-        for child in picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'mode') and hasattr(child, 'label') and hasattr(child, 'unique_id'):
-                all_buttons.append(child)
-    
+    canvas = _find_canvas(picker_widget)
     return {
         'source_button': source_button,
         'picker_widget': picker_widget,
-        'all_buttons': all_buttons,
+        'all_buttons': _picker_buttons(picker_widget, canvas),
         'canvas': canvas
     }
 
@@ -1722,7 +1372,7 @@ def _persist_appearance_changes(modified_buttons, context, validated_params):
                     "assigned_objects": getattr(button, 'assigned_objects', []),
                     "mode": getattr(button, 'mode', 'select'),
                     "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-                    "pose_data": getattr(button, 'pose_data', {}),
+                    "pose_data": button.pose_document_data(),
                     "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                     "shape_type": getattr(button, 'shape_type', 'rect'),
                     "svg_path_data": getattr(button, 'svg_path_data', None),
@@ -1773,6 +1423,49 @@ def _persist_appearance_changes(modified_buttons, context, validated_params):
     # widget_name = getattr(picker_widget, 'objectName', lambda: 'Unknown')()
     # print(f"Updated {len(modified_buttons)} button(s) in widget '{widget_name}': {', '.join(changes)}")
     # print("Changes have been saved to the database.")
+
+class _AppearanceBatch:
+    """Buttons modified by button_appearance calls inside an appearance_batch, per picker window"""
+    def __init__(self):
+        self.pending = {}  # id(picker widget) -> (context, {button: None})
+
+    def add(self, context, buttons):
+        _, pending_buttons = self.pending.setdefault(id(context['picker_widget']), (context, {}))
+        pending_buttons.update(dict.fromkeys(buttons))
+
+    def flush(self):
+        for context, buttons in self.pending.values():
+            _persist_appearance_changes(list(buttons), context, None)
+        self.pending.clear()
+
+_appearance_batch = None
+
+@contextmanager
+def appearance_batch():
+    """
+    Coalesce button_appearance calls into one data write and one repaint per picker window.
+    
+    Buttons change as each call is made (so pb() sees the new values right away); saving the
+    picker data and refreshing the canvas happen once when the outermost batch ends. Button
+    scripts already run inside a batch.
+    
+    Example:
+        with TF.appearance_batch():
+            for button_id in ["arm_L", "arm_R", "leg_L", "leg_R"]:
+                TF.button_appearance(color="#FF0000", target_buttons=button_id)
+    """
+    global _appearance_batch
+    if _appearance_batch is not None:
+        # Nested batch: the outermost one persists
+        yield _appearance_batch
+        return
+    
+    _appearance_batch = _AppearanceBatch()
+    try:
+        yield _appearance_batch
+    finally:
+        batch, _appearance_batch = _appearance_batch, None
+        batch.flush()
 #---------------------------------------------------------------------------------------------------------------
 def tool_tip(tooltip_header="", tooltip_text=""):
     """
@@ -1836,10 +1529,6 @@ def pb(button_ids):
         else:
             print("Button not found")
     """
-    # Import needed modules
-    from . import main as MAIN
-    import inspect
-    
     class PickerButtonCollection:
         """
         Collection object that provides access to multiple picker buttons.
@@ -2087,79 +1776,25 @@ def pb(button_ids):
     else:
         single_button = False
     
-    # Get the correct picker window instance
-    target_picker_widget = None
-    
-    # Try to find the picker widget from the current context
-    # First, check if we're being called from a script and can find the source button
-    script_source_button = None
-    for frame_info in inspect.stack():
-        if frame_info.function == 'execute_script_command':
-            if hasattr(frame_info, 'frame') and 'self' in frame_info.frame.f_locals:
-                potential_button = frame_info.frame.f_locals['self']
-                if hasattr(potential_button, 'mode') and hasattr(potential_button, 'script_data'):
-                    script_source_button = potential_button
-                    break
-    
-    if script_source_button:
-        # Find the picker widget that contains this button
-        current_widget = script_source_button
-        while current_widget:
-            if current_widget.__class__.__name__ == 'AnimPickerWindow':
-                target_picker_widget = current_widget
-                break
-            current_widget = current_widget.parent()
-    
-    # If we couldn't find the specific window, fall back to manager approach
+    # The picker window comes from the button running the script (see script_context)
+    target_picker_widget = _find_picker_widget(SC.current_script_button())
     if not target_picker_widget:
-        manager = MAIN.PickerWindowManager.get_instance()
-        if not manager or not manager._picker_widgets:
-            print("No picker widgets found.")
-            return None
-        # Use the first available picker widget as fallback
-        target_picker_widget = manager._picker_widgets[0]
-    
-    # Get all buttons from the correct picker widget instance
-    all_buttons = []
-    
-    # Try different ways to access the canvas from the target picker widget
-    canvas = None
-    
-    # Method 1: Direct canvas attribute
-    if hasattr(target_picker_widget, 'canvas'):
-        canvas = target_picker_widget.canvas
-    
-    # Method 2: Look for canvas in tab system
-    elif hasattr(target_picker_widget, 'tab_system'):
-        if target_picker_widget.tab_system.current_tab:
-            current_tab = target_picker_widget.tab_system.current_tab
-            if current_tab in target_picker_widget.tab_system.tabs:
-                canvas = target_picker_widget.tab_system.tabs[current_tab]['canvas']
-    
-    # Method 3: Search for canvas in children of the target widget only
-    if not canvas:
-        for child in target_picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'buttons') and isinstance(child.buttons, list):
-                canvas = child
-                break
-    
-    # If we found a canvas, get its buttons
-    if canvas and hasattr(canvas, 'buttons'):
-        all_buttons.extend(canvas.buttons)
-    
-    # If we still don't have any buttons from the target widget, search more thoroughly
-    if not all_buttons:
-        for child in target_picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'mode') and hasattr(child, 'label') and hasattr(child, 'unique_id'):
-                all_buttons.append(child)
-    
-    # Find buttons with matching IDs
+        print("No picker widgets found.")
+        return None
+    canvas = _find_canvas(target_picker_widget)
+    
+    # Find buttons with matching IDs through the canvas id index
     found_buttons = []
-    for button_id in button_ids:
-        for button in all_buttons:
-            if hasattr(button, 'unique_id') and button.unique_id == button_id:
+    if canvas is not None and hasattr(canvas, 'button_by_id'):
+        for button_id in button_ids:
+            button = canvas.button_by_id(button_id)
+            if button is not None:
                 found_buttons.append(button)
-                break
+    else:
+        buttons_by_id = {}
+        for button in reversed(_picker_buttons(target_picker_widget, canvas)):
+            buttons_by_id[getattr(button, 'unique_id', None)] = button
+        found_buttons = [buttons_by_id[button_id] for button_id in button_ids if button_id in buttons_by_id]
     
     # Handle results based on input type
     if single_button:
@@ -2184,60 +1819,10 @@ def list_buttons():
     Returns:
         list: List of dictionaries containing button information
     """
-    from . import main as MAIN
-    import inspect
-    
-    # Get picker widget (reusing logic from pb function)
-    target_picker_widget = None
-    script_source_button = None
-    
-    for frame_info in inspect.stack():
-        if frame_info.function == 'execute_script_command':
-            if hasattr(frame_info, 'frame') and 'self' in frame_info.frame.f_locals:
-                potential_button = frame_info.frame.f_locals['self']
-                if hasattr(potential_button, 'mode') and hasattr(potential_button, 'script_data'):
-                    script_source_button = potential_button
-                    break
-    
-    if script_source_button:
-        current_widget = script_source_button
-        while current_widget:
-            if current_widget.__class__.__name__ == 'AnimPickerWindow':
-                target_picker_widget = current_widget
-                break
-            current_widget = current_widget.parent()
-    
+    target_picker_widget = _find_picker_widget(SC.current_script_button())
     if not target_picker_widget:
-        manager = MAIN.PickerWindowManager.get_instance()
-        if not manager or not manager._picker_widgets:
-            return []
-        target_picker_widget = manager._picker_widgets[0]
-    
-    # Get all buttons
-    all_buttons = []
-    canvas = None
-    
-    if hasattr(target_picker_widget, 'canvas'):
-        canvas = target_picker_widget.canvas
-    elif hasattr(target_picker_widget, 'tab_system'):
-        if target_picker_widget.tab_system.current_tab:
-            current_tab = target_picker_widget.tab_system.current_tab
-            if current_tab in target_picker_widget.tab_system.tabs:
-                canvas = target_picker_widget.tab_system.tabs[current_tab]['canvas']
-    
-    if not canvas:
-        for child in target_picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'buttons') and isinstance(child.buttons, list):
-                canvas = child
-                break
-    
-    if canvas and hasattr(canvas, 'buttons'):
-        all_buttons.extend(canvas.buttons)
-    
-    if not all_buttons:
-        for child in target_picker_widget.findChildren(QtWidgets.QWidget):
-            if hasattr(child, 'mode') and hasattr(child, 'label') and hasattr(child, 'unique_id'):
-                all_buttons.append(child)
+        return []
+    all_buttons = _picker_buttons(target_picker_widget, _find_canvas(target_picker_widget))
     
     # Return button info
     button_info = []
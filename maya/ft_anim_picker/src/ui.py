@@ -27,6 +27,7 @@ from . import data_management as DM
 from . import button_edit_widgets as BEW
 from . import tool_functions as TF
 from . import custom_dialog as CD
+from . import namespace_resolver as NR
 from . fade_away_logic import FadeAway
 from .update_ui import UpdateWidget
 
@@ -96,6 +97,7 @@ class AnimPickerWindow(QtWidgets.QWidget):
         self.image_scale_factor.valueChanged.connect(self.update_image_scale)
 
         self.update_namespace_dropdown()
+        NR.NamespaceRegistry.get_instance().add_listener(self._on_scene_namespaces_changed)
 
         # Define widgets that should be affected by minimal mode
         minimal_affected_widgets = [
@@ -1009,10 +1011,10 @@ class AnimPickerWindow(QtWidgets.QWidget):
     # [Name Space]    
     #----------------------------------------------------------------------------------------------------------------------------------------
     def get_namespaces(self):
-        namespaces = cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True)
-        namespaces = [ns for ns in namespaces if ns not in ['UI', 'shared'] and ':' not in ns]
-        namespaces.sort()
-        return ['None'] + namespaces
+        return NR.NamespaceRegistry.get_instance().namespaces()
+
+    def _on_scene_namespaces_changed(self, namespaces):
+        self.update_namespace_dropdown()
 
     def update_namespace_dropdown(self):
         # Add a check to ensure tab_system exists
@@ -1047,6 +1049,11 @@ class AnimPickerWindow(QtWidgets.QWidget):
     def on_namespace_changed(self, namespace):
         if self.tab_system.current_tab:
             DM.PickerDataManager.update_tab_namespace(self.tab_system.current_tab, namespace)
+            
+            # Buttons are left as they are; only the resolver prefix changes. Warm the
+            # selection caches for the new namespace in one deferred batch.
+            canvas = self.tab_system.tabs[self.tab_system.current_tab]['canvas']
+            QtCore.QTimer.singleShot(0, lambda: canvas.prefetch_selection_cache(namespace))
     #----------------------------------------------------------------------------------------------------------------------------------------
     # [Picker Button] 
     #----------------------------------------------------------------------------------------------------------------------------------------
@@ -1225,7 +1232,7 @@ class AnimPickerWindow(QtWidgets.QWidget):
                 "assigned_objects": getattr(button, 'assigned_objects', []),
                 "mode": getattr(button, 'mode', 'select'),
                 "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-                "pose_data": getattr(button, 'pose_data', {}),
+                "pose_data": button.pose_document_data(),
                 "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                 "shape_type": button.shape_type,
                 "svg_path_data": button.svg_path_data,
@@ -1337,9 +1344,7 @@ class AnimPickerWindow(QtWidgets.QWidget):
                                     button, 'script_data', {'code': '', 'type': 'python'}
                                 )
                             elif field == 'pose_data':
-                                tab_data['buttons'][button_index]['pose_data'] = getattr(
-                                    button, 'pose_data', {}
-                                )
+                                tab_data['buttons'][button_index]['pose_data'] = button.pose_document_data()
                             elif field == 'thumbnail_path':
                                 tab_data['buttons'][button_index]['thumbnail_path'] = getattr(
                                     button, 'thumbnail_path', ''
@@ -1365,7 +1370,7 @@ class AnimPickerWindow(QtWidgets.QWidget):
                             "assigned_objects": getattr(button, 'assigned_objects', []),
                             "mode": getattr(button, 'mode', 'select'),
                             "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-                            "pose_data": getattr(button, 'pose_data', {}),
+                            "pose_data": button.pose_document_data(),
                             "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                             "shape_type": button.shape_type,
                             "svg_path_data": button.svg_path_data,
@@ -1454,7 +1459,7 @@ class AnimPickerWindow(QtWidgets.QWidget):
                     "assigned_objects": button.assigned_objects,
                     "mode": button.mode,
                     "script_data": button.script_data,
-                    "pose_data": button.pose_data,
+                    "pose_data": button.pose_document_data(),
                     "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                     "shape_type": button.shape_type,
                     "svg_path_data": button.svg_path_data,
@@ -1587,7 +1592,7 @@ class AnimPickerWindow(QtWidgets.QWidget):
                         "assigned_objects": getattr(button, 'assigned_objects', []),
                         "mode": getattr(button, 'mode', 'select'),
                         "script_data": getattr(button, 'script_data', {'code': '', 'type': 'python'}),
-                        "pose_data": getattr(button, 'pose_data', {}),
+                        "pose_data": button.pose_document_data(),
                         "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                         "shape_type": button.shape_type,
                         "svg_path_data": button.svg_path_data,
@@ -1642,7 +1647,7 @@ class AnimPickerWindow(QtWidgets.QWidget):
                 "assigned_objects": button.assigned_objects,
                 "mode": button.mode,
                 "script_data": button.script_data,
-                "pose_data": button.pose_data,
+                "pose_data": button.pose_document_data(),
                 "thumbnail_path": getattr(button, 'thumbnail_path', ''),
                 "shape_type": button.shape_type,
                 "svg_path_data": button.svg_path_data,
@@ -1702,7 +1707,7 @@ class AnimPickerWindow(QtWidgets.QWidget):
                     "assigned_objects": getattr(canvas_button, 'assigned_objects', []),
                     "mode": getattr(canvas_button, 'mode', 'select'),
                     "script_data": getattr(canvas_button, 'script_data', {'code': '', 'type': 'python'}),
-                    "pose_data": getattr(canvas_button, 'pose_data', {}),
+                    "pose_data": canvas_button.pose_document_data(),
                     "thumbnail_path": getattr(canvas_button, 'thumbnail_path', ''),
                     "shape_type": canvas_button.shape_type,
                     "svg_path_data": canvas_button.svg_path_data,
@@ -2983,6 +2988,8 @@ class AnimPickerWindow(QtWidgets.QWidget):
         except Exception as e:
             print(f"Error flushing database: {e}")
         
+        NR.NamespaceRegistry.get_instance().remove_listener(self._on_scene_namespaces_changed)
+        
         # Perform comprehensive cleanup
         self.cleanup_resources()
         